@@ -10,6 +10,7 @@ import pygame
 import sys
 import math
 import time
+import numpy as np
 from src.rendering.black_mamba_renderer import BlackMambaRenderer
 
 
@@ -17,14 +18,26 @@ def main():
     """Run the Black Mamba Racer rendering demo."""
     pygame.init()
     
-    # Initialize renderer
-    renderer = BlackMambaRenderer(800, 600)
+    # Initialize renderer, presenting through SDL's hardware renderer
+    renderer = BlackMambaRenderer(800, 600, pygame.SCALED)
     clock = pygame.time.Clock()
     
     # Demo state
     running = True
     demo_time = 0
     
+    # Animated car positions, updated in place each frame
+    car_points = np.empty((3, 2))
+    car_points[:, 1] = (350, 380, 320)
+    
+    # Horizontal sway per car: base + amplitude * sin(rate * t + phase)
+    # (the pi/2 phase turns the second car's sine into a cosine)
+    sway_base = np.array([200.0, 400.0, 600.0])
+    sway_amplitude = np.array([100.0, 80.0, 60.0])
+    sway_rate = np.array([1.0, 1.5, 0.8])
+    sway_phase = np.array([0.0, math.pi / 2, 0.0])
+    car_colors = (renderer.colors.LIGHT_GRAY, renderer.colors.ACCENT_RED, renderer.colors.WHITE)
+    
     # Sample track points for mini-map
     track_points = [
         (100, 100), (300, 100), (400, 150), (450, 250),
@@ -41,6 +54,40 @@ def main():
     print("- Clean HUD typography")
     print("- Minimalist mini-map")
     
+    # Render static scenery once; each frame starts from a single blit of it
+    static_bg = pygame.Surface((800, 600)).convert()
+    static_bg.fill(renderer.colors.BACKGROUND_GRAY)
+    
+    # Demo 1: Track boundaries with checkered pattern
+    boundary_points = [
+        (50, 50), (750, 50), (750, 150), (50, 150)
+    ]
+    renderer.draw_track_boundary(boundary_points, width=30, use_checkered=True, surface=static_bg)
+    
+    # Demo 2: Tire barriers
+    renderer.draw_tire_barriers([(100 + i * 60, 250) for i in range(10)], 12, surface=static_bg)
+    
+    # Demo 4: Checkered pattern area
+    checkered_rect = pygame.Rect(50, 450, 200, 100)
+    renderer.draw_checkered_pattern(checkered_rect, 12, surface=static_bg)
+    
+    # Demo 7: Color palette showcase
+    palette_y = 200
+    colors_to_show = [
+        ("Background", renderer.colors.BACKGROUND_GRAY),
+        ("Track", renderer.colors.TRACK_GRAY),
+        ("Light Gray", renderer.colors.LIGHT_GRAY),
+        ("White", renderer.colors.WHITE),
+        ("Accent Red", renderer.colors.ACCENT_RED),
+        ("Accent Yellow", renderer.colors.ACCENT_YELLOW),
+    ]
+    palette_labels = []
+    for i, (name, color) in enumerate(colors_to_show):
+        x = 500 + (i % 3) * 90
+        y = palette_y + (i // 3) * 40
+        pygame.draw.rect(static_bg, color, (x, y, 30, 20))
+        palette_labels.append((name, (x, y + 25), "small"))
+    
     while running:
         dt = clock.tick(60) / 1000.0
         demo_time += dt
@@ -53,36 +100,16 @@ def main():
                 if event.key == pygame.K_ESCAPE:
                     running = False
         
-        # Clear screen
-        renderer.clear_screen()
+        # Restore static scenery (also clears the previous frame)
+        renderer.get_screen_surface().blit(static_bg, (0, 0))
         renderer.clear_ui_surface()
         
-        # Demo 1: Draw track boundaries with checkered pattern
-        boundary_points = [
-            (50, 50), (750, 50), (750, 150), (50, 150)
-        ]
-        renderer.draw_track_boundary(boundary_points, width=30, use_checkered=True)
-        
-        # Demo 2: Draw tire barriers
-        for i in range(10):
-            x = 100 + i * 60
-            y = 250
-            renderer.draw_tire_barrier((x, y), 12)
-        
         # Demo 3: Draw animated cars with different colors
-        car_positions = [
-            (200 + math.sin(demo_time) * 100, 350, renderer.colors.LIGHT_GRAY),
-            (400 + math.cos(demo_time * 1.5) * 80, 380, renderer.colors.ACCENT_RED),
-            (600 + math.sin(demo_time * 0.8) * 60, 320, renderer.colors.WHITE)
-        ]
+        car_points[:, 0] = sway_base + sway_amplitude * np.sin(sway_rate * demo_time + sway_phase)
         
-        for i, (x, y, color) in enumerate(car_positions):
+        for i, (point, color) in enumerate(zip(car_points, car_colors)):
             angle = demo_time * 50 + i * 45  # Rotating cars
-            renderer.draw_car((x, y), angle, color)
-        
-        # Demo 4: Draw checkered pattern area
-        checkered_rect = pygame.Rect(50, 450, 200, 100)
-        renderer.draw_checkered_pattern(checkered_rect, 12)
+            renderer.draw_car(point, angle, color)
         
         # Demo 5: HUD elements
         renderer.draw_hud_text("Black Mamba Racer Demo", (20, 20), "large", renderer.colors.HUD_ACCENT)
@@ -92,25 +119,10 @@ def main():
         renderer.draw_hud_text("Speed: 85 mph", (20, 160), "small")
         
         # Demo 6: Mini-map
-        car_map_positions = [(pos[0], pos[1]) for pos in car_positions]
-        renderer.draw_mini_map((640, 20), (140, 100), track_points, car_map_positions)
-        
-        # Demo 7: Color palette showcase
-        palette_y = 200
-        colors_to_show = [
-            ("Background", renderer.colors.BACKGROUND_GRAY),
-            ("Track", renderer.colors.TRACK_GRAY),
-            ("Light Gray", renderer.colors.LIGHT_GRAY),
-            ("White", renderer.colors.WHITE),
-            ("Accent Red", renderer.colors.ACCENT_RED),
-            ("Accent Yellow", renderer.colors.ACCENT_YELLOW),
-        ]
+        renderer.draw_mini_map((640, 20), (140, 100), track_points, car_points)
         
-        for i, (name, color) in enumerate(colors_to_show):
-            x = 500 + (i % 3) * 90
-            y = palette_y + (i // 3) * 40
-            pygame.draw.rect(renderer.get_screen_surface(), color, (x, y, 30, 20))
-            renderer.draw_hud_text(name, (x, y + 25), "small")
+        # Demo 7: Color palette labels
+        renderer.draw_hud_texts(palette_labels)
         
         # Present the frame
         renderer.present()
@@ -9,10 +9,12 @@ and game state management.
 import pygame
 import pymunk
 import math
+import numpy as np
 import sys
 from typing import List
 
 from src.entities.car import Car
+from src.entities.car_fleet import CarFleet
 from src.physics.physics_engine import PhysicsEngine
 from src.rendering.black_mamba_renderer import BlackMambaRenderer
 
@@ -36,8 +38,10 @@ class CarEntityDemo:
         # Initialize renderer
         self.renderer = BlackMambaRenderer(self.screen_width, self.screen_height)
         
-        # Create cars
+        # Create cars; AI cars share a fleet so their controls and
+        # bookkeeping are applied in bulk
         self.cars: List[Car] = []
+        self.ai_fleet = CarFleet()
         self._create_cars()
         
         # Demo state
@@ -49,6 +53,15 @@ class CarEntityDemo:
         self.camera_x = 0
         self.camera_y = 0
         
+        # Car positions as an (N, 2) array, refreshed once per update for culling
+        self._positions = np.array([car.get_position() for car in self.cars], dtype=float)
+        self._cull_margin = 50
+        self._half_screen = np.array([self.screen_width // 2, self.screen_height // 2])
+        self._screen_positions = self._positions - (self.camera_x, self.camera_y)
+        
+        # Per-AI-car control arrays for the vectorized AI policy
+        self._init_ai_controls()
+        
         print("Car Entity Demo")
         print("Controls:")
         print("  WASD - Control player car")
@@ -80,10 +93,19 @@ class CarEntityDemo:
                 car_id=f"ai_{i}",
                 physics_space=self.physics_engine.space,
                 position=pos,
-                angle=math.pi * i / 4  # Different starting angles
+                angle=math.pi * i / 4,  # Different starting angles
+                fleet=self.ai_fleet
             )
             self.cars.append(ai_car)
     
+    def _init_ai_controls(self) -> None:
+        """(Re)allocate AI control arrays to match the current car list."""
+        ai_count = len(self.ai_fleet)
+        self._ai_phase = np.arange(1, ai_count + 1, dtype=float)
+        self._ai_throttle = np.full(ai_count, 0.3)
+        self._ai_steer = np.zeros(ai_count)
+        self._ai_brake = np.zeros(ai_count)
+    
     def handle_input(self) -> None:
         """Handle user input."""
         keys = pygame.key.get_pressed()
@@ -113,10 +135,11 @@ class CarEntityDemo:
         player_car.apply_controls(throttle, steering, brake)
         
         # Simple AI for other cars (just drive forward with slight steering)
-        for i, car in enumerate(self.cars[1:], 1):
-            ai_throttle = 0.3
-            ai_steering = math.sin(pygame.time.get_ticks() * 0.001 + i) * 0.2
-            car.apply_controls(ai_throttle, ai_steering, 0.0)
+        if self._ai_phase.shape[0] != len(self.ai_fleet):
+            self._init_ai_controls()
+        np.sin(pygame.time.get_ticks() * 0.001 + self._ai_phase, out=self._ai_steer)
+        self._ai_steer *= 0.2
+        self.ai_fleet.apply_controls_bulk(self._ai_throttle, self._ai_steer, self._ai_brake)
     
     def handle_events(self) -> None:
         """Handle pygame events."""
@@ -135,17 +158,29 @@ class CarEntityDemo:
     
     def update(self, dt: float) -> None:
         """Update game state."""
-        # Update all cars
-        for car in self.cars:
-            car.update(dt)
+        # Update the player car, then the AI fleet in one pass; AI cars far
+        # from the player recompute their drive forces less often
+        player_car = self.cars[0]
+        player_car.update(dt)
+        self.ai_fleet.update_all(dt, focus=player_car.get_position())
         
         # Step physics simulation
         self.physics_engine.step(dt)
         
-        # Update camera to follow player car
-        player_pos = self.cars[0].get_position()
-        self.camera_x = player_pos[0] - self.screen_width // 2
-        self.camera_y = player_pos[1] - self.screen_height // 2
+        # The HUD reads the player's info view; refresh it after the step so
+        # it matches the car as rendered this frame
+        player_car.refresh_info_view()
+        
+        # Refresh position array, reallocating only when the car count changes
+        if self._positions.shape[0] != len(self.cars):
+            self._positions = np.zeros((len(self.cars), 2))
+        for i, car in enumerate(self.cars):
+            self._positions[i] = car.physics_body.body.position
+        
+        # Update camera to follow player car, snapped to whole pixels
+        camera = np.rint(self._positions[0] - self._half_screen).astype(np.int32)
+        self.camera_x, self.camera_y = int(camera[0]), int(camera[1])
+        self._screen_positions = self._positions - camera
     
     def render(self) -> None:
         """Render the demo."""
@@ -153,28 +188,16 @@ class CarEntityDemo:
         self.renderer.clear_screen()
         self.renderer.clear_ui_surface()
         
-        # Save current transform
-        screen = self.renderer.get_screen_surface()
+        # Cull off-screen cars with a single vectorized mask
+        xs = self._screen_positions[:, 0]
+        ys = self._screen_positions[:, 1]
+        margin = self._cull_margin
+        visible = ((xs >= -margin) & (xs <= self.screen_width + margin) &
+                   (ys >= -margin) & (ys <= self.screen_height + margin))
         
-        # Apply camera transform
-        for car in self.cars:
-            pos = car.get_position()
-            screen_pos = (pos[0] - self.camera_x, pos[1] - self.camera_y)
-            
-            # Only render if on screen
-            if (-50 <= screen_pos[0] <= self.screen_width + 50 and
-                -50 <= screen_pos[1] <= self.screen_height + 50):
-                
-                # Temporarily modify renderer for camera offset
-                original_draw_car = self.renderer.draw_car
-                
-                def draw_car_with_camera(position, angle, color=None):
-                    camera_pos = (position[0] - self.camera_x, position[1] - self.camera_y)
-                    original_draw_car(camera_pos, angle, color)
-                
-                self.renderer.draw_car = draw_car_with_camera
-                car.render(self.renderer)
-                self.renderer.draw_car = original_draw_car
+        camera = (self.camera_x, self.camera_y)
+        for i in np.flatnonzero(visible):
+            self.cars[i].render(self.renderer, camera=camera)
         
         # Render HUD
         self._render_hud()
@@ -185,31 +208,39 @@ class CarEntityDemo:
     def _render_hud(self) -> None:
         """Render HUD information."""
         player_car = self.cars[0]
-        car_info = player_car.get_car_info()
+        view = player_car.get_info_view()
         
         # Car information
         # Convert from pixels/second to km/h (assuming 1 pixel = 1 meter for racing scale)
-        speed_kmh = car_info['speed'] * 3.6  # m/s to km/h conversion
-        self.renderer.draw_hud_text(f"Speed: {speed_kmh:.0f} km/h", (10, 10), "medium")
-        self.renderer.draw_hud_text(f"Physics: {self.physics_model.title()}", (10, 40), "medium")
-        
-        # Position and angle
-        pos = car_info['position']
-        self.renderer.draw_hud_text(f"Position: ({pos[0]:.0f}, {pos[1]:.0f})", (10, 70), "small")
-        self.renderer.draw_hud_text(f"Angle: {car_info['angle_degrees']:.0f}°", (10, 90), "small")
+        # Values are quantized so sub-unit jitter doesn't force a re-render
+        speed_kmh = view.speed * 3.6  # m/s to km/h conversion
+        pos = view.position
+        self.renderer.draw_hud_fields([
+            ("speed", round(speed_kmh), "Speed: {} km/h", (10, 10), "medium"),
+            ("physics", self.physics_model.title(), "Physics: {}", (10, 40), "medium"),
+            
+            # Position and angle
+            ("position", (round(pos[0]), round(pos[1])), "Position: ({0[0]}, {0[1]})",
+             (10, 70), "small"),
+            ("angle", round(view.angle_degrees), "Angle: {}°", (10, 90), "small"),
+            
+            # Control inputs
+            ("throttle", round(view.throttle, 2), "Throttle: {:.2f}", (10, 120), "small"),
+            ("steering", round(view.steering, 2), "Steering: {:.2f}", (10, 140), "small"),
+            ("brake", round(view.brake, 2), "Brake: {:.2f}", (10, 160), "small"),
+            
+            # Performance metrics
+            ("top_speed", round(view.top_speed * 3.6), "Top Speed: {} km/h",
+             (10, 220), "small"),
+            ("distance", round(view.distance_traveled), "Distance: {}m",
+             (10, 240), "small"),
+        ])
         
-        # Control inputs
-        self.renderer.draw_hud_text(f"Throttle: {car_info['throttle']:.2f}", (10, 120), "small")
-        self.renderer.draw_hud_text(f"Steering: {car_info['steering']:.2f}", (10, 140), "small")
-        self.renderer.draw_hud_text(f"Brake: {car_info['brake']:.2f}", (10, 160), "small")
+        hud_items = []
         
         # Physics info
-        if player_car.is_sliding():
-            self.renderer.draw_hud_text("SLIDING!", (10, 190), "medium", (255, 255, 0))
-        
-        # Performance metrics
-        self.renderer.draw_hud_text(f"Top Speed: {car_info['top_speed'] * 3.6:.0f} km/h", (10, 220), "small")
-        self.renderer.draw_hud_text(f"Distance: {car_info['distance_traveled']:.0f}m", (10, 240), "small")
+        if view.is_sliding:
+            hud_items.append(("SLIDING!", (10, 190), "medium", (255, 255, 0)))
         
         # Instructions
         instructions = [
@@ -220,7 +251,10 @@ class CarEntityDemo:
         ]
         
         for i, instruction in enumerate(instructions):
-            self.renderer.draw_hud_text(instruction, (self.screen_width - 200, 10 + i * 20), "small")
+            hud_items.append((instruction, (self.screen_width - 200, 10 + i * 20), "small"))
+        
+        # Submit all HUD text in one batched blit
+        self.renderer.draw_hud_texts(hud_items)
     
     def run(self) -> None:
         """Run the demo."""
@@ -228,6 +262,14 @@ class CarEntityDemo:
             dt = self.clock.tick(60) / 1000.0  # 60 FPS, convert to seconds
             
             self.handle_events()
+            
+            # Idle while the window is minimized or hidden: skip physics and
+            # rendering, and don't count the idle time as simulation time
+            if not pygame.display.get_active():
+                pygame.time.wait(50)
+                self.clock.tick()
+                continue
+            
             self.handle_input()
             self.update(dt)
             self.render()
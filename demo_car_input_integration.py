@@ -9,7 +9,6 @@ that integrates seamlessly with the Car entity's physics simulation.
 import pygame
 import pymunk
 import sys
-import time
 from src.input import InputManager, InputAction, ControlSchemes
 from src.entities.car import Car
 from src.physics.physics_engine import PhysicsEngine
@@ -58,7 +57,7 @@ def main():
         player_car.reset_position(car_start_position, 0.0)
     
     def switch_physics():
-        current_model = "arcade" if player_car.physics_body.config.friction > 0.8 else "realistic"
+        current_model = player_car.physics_model
         new_model = "realistic" if current_model == "arcade" else "arcade"
         print(f"Switching physics from {current_model} to {new_model}")
         player_car.switch_physics_model(new_model)
@@ -80,15 +79,18 @@ def main():
     # Demo variables
     running = True
     last_info_time = 0
-    info_update_interval = 0.5  # Update info display twice per second
+    info_update_interval = 500  # Update info display twice per second (ms)
+    # Console readout only when someone is watching (or explicitly requested)
+    console_info = sys.stdout.isatty() or '--verbose' in sys.argv
     paused = False
     
     while running:
         dt = clock.tick(60) / 1000.0  # 60 FPS, convert to seconds
-        current_time = time.time()
         
         # Handle pygame events
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        input_manager.process_events(events)
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.KEYDOWN:
@@ -98,6 +100,13 @@ def main():
                     paused = not paused
                     print(f"Game {'paused' if paused else 'resumed'}")
         
+        # Idle while the window is minimized or hidden: skip physics and
+        # rendering, and don't count the idle time as simulation time
+        if not pygame.display.get_active():
+            pygame.time.wait(50)
+            clock.tick()
+            continue
+        
         if not paused:
             # Update input manager
             input_manager.update(dt)
@@ -116,6 +125,7 @@ def main():
         
         # Render everything
         renderer.clear_screen()
+        renderer.clear_ui_surface()
         
         # Draw car
         player_car.render(renderer)
@@ -130,9 +140,11 @@ def main():
         renderer.present()
         
         # Display periodic info to console
-        if current_time - last_info_time >= info_update_interval:
-            display_console_info(player_car, input_manager)
-            last_info_time = current_time
+        if console_info:
+            current_time = pygame.time.get_ticks()
+            if current_time - last_info_time >= info_update_interval:
+                display_console_info(player_car, input_manager)
+                last_info_time = current_time
     
     # Cleanup
     player_car.cleanup()
@@ -153,77 +165,73 @@ def draw_input_visualization(renderer, input_manager, screen_width, screen_heigh
     bar_height = 20
     
     # Draw background for input display
-    pygame.draw.rect(renderer.screen, (40, 40, 40), 
-                    (bar_x - 10, bar_y - 10, bar_width + 20, 120))
+    rects = [((40, 40, 40), (bar_x - 10, bar_y - 10, bar_width + 20, 120))]
     
     # Draw throttle bar
     throttle = info['throttle']
     throttle_color = (0, 255, 0) if throttle > 0 else (255, 100, 100) if throttle < 0 else (100, 100, 100)
     throttle_width = int(abs(throttle) * bar_width)
-    if throttle_width > 0:
-        pygame.draw.rect(renderer.screen, throttle_color, 
-                        (bar_x, bar_y, throttle_width, bar_height))
+    rects.append((throttle_color, (bar_x, bar_y, throttle_width, bar_height)))
     
     # Draw steering bar
     steering = info['steering']
     steering_center = bar_x + bar_width // 2
     steering_width = int(abs(steering) * bar_width // 2)
-    if steering_width > 0:
-        steering_color = (100, 100, 255)
-        if steering > 0:  # Right
-            pygame.draw.rect(renderer.screen, steering_color, 
-                            (steering_center, bar_y + 25, steering_width, bar_height))
-        else:  # Left
-            pygame.draw.rect(renderer.screen, steering_color, 
-                            (steering_center - steering_width, bar_y + 25, steering_width, bar_height))
+    steering_x = steering_center if steering > 0 else steering_center - steering_width
+    rects.append(((100, 100, 255), (steering_x, bar_y + 25, steering_width, bar_height)))
     
     # Draw brake bar
     brake = info['brake']
     brake_width = int(brake * bar_width)
-    if brake_width > 0:
-        pygame.draw.rect(renderer.screen, (255, 255, 0), 
-                        (bar_x, bar_y + 50, brake_width, bar_height))
-    
-    # Draw labels
-    renderer.draw_hud_text("Throttle", (bar_x, bar_y - 20), "small")
-    renderer.draw_hud_text("Steering", (bar_x, bar_y + 5), "small")
-    renderer.draw_hud_text("Brake", (bar_x, bar_y + 30), "small")
-    
-    # Draw values
-    renderer.draw_hud_text(f"{throttle:+.2f}", (bar_x + bar_width + 10, bar_y), "small")
-    renderer.draw_hud_text(f"{steering:+.2f}", (bar_x + bar_width + 10, bar_y + 25), "small")
-    renderer.draw_hud_text(f"{brake:.2f}", (bar_x + bar_width + 10, bar_y + 50), "small")
+    rects.append(((255, 255, 0), (bar_x, bar_y + 50, brake_width, bar_height)))
+    
+    # Empty bars are skipped by the renderer
+    renderer.fill_rects(rects)
+    
+    # Draw labels and values in one batched blit
+    renderer.draw_hud_texts([
+        ("Throttle", (bar_x, bar_y - 20), "small"),
+        ("Steering", (bar_x, bar_y + 5), "small"),
+        ("Brake", (bar_x, bar_y + 30), "small"),
+        (f"{throttle:+.2f}", (bar_x + bar_width + 10, bar_y), "small"),
+        (f"{steering:+.2f}", (bar_x + bar_width + 10, bar_y + 25), "small"),
+        (f"{brake:.2f}", (bar_x + bar_width + 10, bar_y + 50), "small"),
+    ])
 
 
 def draw_car_info(renderer, car, screen_width):
     """Draw car information on screen."""
-    car_info = car.get_car_info()
+    view = car.get_info_view()
     
     # Position for car info
     info_x = screen_width - 250
     info_y = 20
     
     # Draw background
-    pygame.draw.rect(renderer.screen, (40, 40, 40), 
-                    (info_x - 10, info_y - 10, 240, 160))
+    renderer.fill_rects([((40, 40, 40), (info_x - 10, info_y - 10, 240, 160))])
     
-    # Draw car info
+    # Draw car info; values are quantized to their displayed precision so
+    # fields are only re-rendered when the visible text changes
     renderer.draw_hud_text("CAR INFO", (info_x, info_y), "medium")
     
-    y_offset = 25
-    info_items = [
-        f"Speed: {car_info['speed']:.1f} px/s",
-        f"Forward: {car_info['forward_speed']:.1f} px/s",
-        f"Lateral: {car_info['lateral_speed']:.1f} px/s",
-        f"Sliding: {'YES' if car_info['is_sliding'] else 'NO'}",
-        f"Physics: {car_info['physics_model'].title()}",
-        f"Position: ({car_info['position'][0]:.0f}, {car_info['position'][1]:.0f})",
-        f"Angle: {car_info['angle_degrees']:.1f}°"
+    position = view.position
+    info_fields = [
+        ("speed", round(view.speed, 1), "Speed: {:.1f} px/s"),
+        ("forward_speed", round(view.forward_speed, 1), "Forward: {:.1f} px/s"),
+        ("lateral_speed", round(view.lateral_speed, 1), "Lateral: {:.1f} px/s"),
+        ("sliding", 'YES' if view.is_sliding else 'NO', "Sliding: {}"),
+        ("physics", view.physics_model.title(), "Physics: {}"),
+        ("position", (round(position[0]), round(position[1])), "Position: ({0[0]}, {0[1]})"),
+        ("angle", round(view.angle_degrees, 1), "Angle: {:.1f}°"),
     ]
     
-    for item in info_items:
-        renderer.draw_hud_text(item, (info_x, info_y + y_offset), "small")
+    y_offset = 25
+    hud_fields = []
+    for field, value, template in info_fields:
+        hud_fields.append((field, value, template, (info_x, info_y + y_offset), "small"))
         y_offset += 18
+    
+    renderer.draw_hud_fields(hud_fields)
 
 
 def display_console_info(car, input_manager):
@@ -263,9 +271,13 @@ def test_integration():
     )
     print("✓ Car created")
     
-    # Test applying controls
-    input_manager.input_state.accelerate = 0.5
-    input_manager.input_state.steer_right = 0.3
+    # Test applying controls: hold W and D for a few frames
+    input_manager.process_events([
+        pygame.event.Event(pygame.KEYDOWN, key=pygame.K_w),
+        pygame.event.Event(pygame.KEYDOWN, key=pygame.K_d),
+    ])
+    for _ in range(5):
+        input_manager.update(0.016)
     
     throttle, steering, brake = input_manager.get_car_controls()
     car.apply_controls(throttle, steering, brake)
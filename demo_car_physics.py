@@ -8,10 +8,38 @@ physics configurations, showing car movement, steering, and collision detection.
 
 import pygame
 import pymunk
-import math
 import sys
-from src.physics.car_physics import CarBody, CarPhysicsPresets
+import numpy as np
+from operator import itemgetter
+from src.physics.car_physics import CarBody, CarPhysicsInfo, CarPhysicsPresets
 from src.physics.physics_engine import PhysicsEngine
+from src.rendering.geometry import rotate_box_corners
+
+
+# Driving control bits, combined into an index into CONTROL_TABLE
+FORWARD, REVERSE, LEFT, RIGHT, BRAKE = 1, 2, 4, 8, 16
+
+
+def build_control_table():
+    """
+    Precompute (throttle, steering, brake) for every driving key combination.
+    
+    Reverse wins over forward and right wins over left, matching the order
+    the keys used to be checked in.
+    
+    Returns:
+        Tuple of control tuples indexed by a combination of control bits
+    """
+    table = []
+    for state in range(BRAKE * 2):
+        throttle = -1.0 if state & REVERSE else (1.0 if state & FORWARD else 0.0)
+        steering = 1.0 if state & RIGHT else (-1.0 if state & LEFT else 0.0)
+        brake = 1.0 if state & BRAKE else 0.0
+        table.append((throttle, steering, brake))
+    return tuple(table)
+
+
+CONTROL_TABLE = build_control_table()
 
 
 def main():
@@ -91,12 +119,35 @@ def main():
         obstacles.append(obstacle)
         physics_engine.space.add(obstacle)
     
+    # Static geometry as structure-of-arrays: segment endpoints (N, 2, 2)
+    # and obstacle circles as (x, y, radius) rows (M, 3)
+    boundary_segments = np.array(
+        [[[b.a.x, b.a.y], [b.b.x, b.b.y]] for b in boundaries], dtype=np.int32)
+    obstacle_circles = np.array(
+        [[o.offset.x, o.offset.y, o.radius] for o in obstacles], dtype=np.int32)
+    
+    # Static geometry never moves, so render it once into a background.
+    # The boundary segments span the full screen, so together they form a
+    # single rectangular border around the segments' bounding box.
+    static_background = pygame.Surface((WIDTH, HEIGHT)).convert()
+    static_background.fill(WHITE)
+    endpoints = boundary_segments.reshape(-1, 2)
+    (left, top), (right, bottom) = endpoints.min(axis=0), endpoints.max(axis=0)
+    border = pygame.Rect(int(left), int(top), int(right - left), int(bottom - top))
+    pygame.draw.rect(static_background, BLACK, border, boundary_thickness * 2)
+    for x, y, radius in obstacle_circles.tolist():
+        pygame.draw.circle(static_background, GRAY, (x, y), radius)
+    
+    # Reused buffer for the car outline corners
+    car_corners = np.empty((4, 2), dtype=np.int32)
+    
     # Collision callback
+    # The callback runs inside the space step, so it only records the hit;
+    # the main loop counts and reports collisions once per frame
+    pending_collisions = []
     collision_count = 0
     def on_collision(info):
-        nonlocal collision_count
-        collision_count += 1
-        print(f"Collision {collision_count}: {info['point']}")
+        pending_collisions.append(info['point'])
     
     car.set_collision_callback(on_collision)
     
@@ -106,6 +157,46 @@ def main():
     small_font = pygame.font.Font(None, 24)
     running = True
     
+    # Static text is rasterized once; the title only changes with the physics model
+    instructions = [
+        "WASD/Arrow Keys: Drive",
+        "Space: Brake",
+        "R: Reset position",
+        "P: Switch physics model"
+    ]
+    instruction_surfs = [small_font.render(instruction, True, BLACK) for instruction in instructions]
+    title_surf = font.render(f"Car Physics Demo - {current_physics.title()} Mode", True, BLACK)
+    
+    # Info line surfaces, re-rendered only when their text changes; the text
+    # itself is refreshed at most every INFO_INTERVAL_MS (~10 Hz)
+    INFO_INTERVAL_MS = 100
+    info_strings = []
+    info_surfs = []
+    info_elapsed = INFO_INTERVAL_MS
+    physics_info = CarPhysicsInfo()
+    
+    # Bind hot module attributes to locals for the game loop
+    draw_line = pygame.draw.line
+    draw_polygon = pygame.draw.polygon
+    get_pressed = pygame.key.get_pressed
+    # Fetch all driving keys from the key state with a single C-level lookup
+    read_drive_keys = itemgetter(pygame.K_w, pygame.K_s, pygame.K_a, pygame.K_d,
+                                 pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT,
+                                 pygame.K_SPACE)
+    control_table = CONTROL_TABLE
+    body = car.body
+    
+    # Body pose before the latest fixed step, for render interpolation
+    previous_position = body.position
+    previous_angle = body.angle
+    
+    def before_physics_step(step_dt):
+        """Record the pre-step pose and apply car forces for one fixed step."""
+        nonlocal previous_position, previous_angle
+        previous_position = body.position
+        previous_angle = body.angle
+        car.update_physics(step_dt)
+    
     while running:
         dt = clock.tick(60) / 1000.0  # Delta time in seconds
         
@@ -117,7 +208,9 @@ def main():
                 if event.key == pygame.K_r:
                     # Reset car position
                     car.reset_position((WIDTH//2, HEIGHT//2), 0)
+                    previous_position, previous_angle = body.position, body.angle
                     collision_count = 0
+                    pending_collisions.clear()
                 elif event.key == pygame.K_p:
                     # Switch physics model
                     if current_physics == "arcade":
@@ -126,73 +219,53 @@ def main():
                     else:
                         car.switch_physics_config(CarPhysicsPresets.arcade())
                         current_physics = "arcade"
+                    title_surf = font.render(f"Car Physics Demo - {current_physics.title()} Mode",
+                                             True, BLACK)
                     print(f"Switched to {current_physics} physics")
         
-        # Handle input
-        keys = pygame.key.get_pressed()
-        throttle = 0.0
-        steering = 0.0
-        brake = 0.0
+        # Idle while the window is minimized or hidden: skip physics and
+        # rendering, and don't count the idle time as simulation time
+        if not pygame.display.get_active():
+            pygame.time.wait(50)
+            clock.tick()
+            continue
         
-        if keys[pygame.K_w] or keys[pygame.K_UP]:
-            throttle = 1.0
-        if keys[pygame.K_s] or keys[pygame.K_DOWN]:
-            throttle = -1.0
-        if keys[pygame.K_a] or keys[pygame.K_LEFT]:
-            steering = -1.0
-        if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
-            steering = 1.0
-        if keys[pygame.K_SPACE]:
-            brake = 1.0
+        # Handle input: pack the held keys into control bits and look them up
+        w, s, a, d, up, down, left_key, right_key, space = read_drive_keys(get_pressed())
+        throttle, steering, brake = control_table[
+            (w | up) | (s | down) << 1 | (a | left_key) << 2 | (d | right_key) << 3 | space << 4]
         
         # Apply controls to car
         car.apply_controls(throttle, steering, brake)
         
-        # Update physics
-        car.update_physics(dt)
-        physics_engine.step(dt)
+        # Update physics in fixed steps; forces are re-applied before each one
+        physics_engine.advance(dt, before_physics_step)
         
-        # Clear screen
-        screen.fill(WHITE)
+        # Report this frame's collisions with a single write
+        if pending_collisions:
+            sys.stdout.write(''.join(
+                f"Collision {collision_count + i}: {point}\n"
+                for i, point in enumerate(pending_collisions, 1)))
+            sys.stdout.flush()
+            collision_count += len(pending_collisions)
+            pending_collisions.clear()
         
-        # Draw boundaries
-        for boundary in boundaries:
-            if hasattr(boundary, 'a') and hasattr(boundary, 'b'):
-                start = (int(boundary.a.x), int(boundary.a.y))
-                end = (int(boundary.b.x), int(boundary.b.y))
-                pygame.draw.line(screen, BLACK, start, end, boundary_thickness * 2)
-        
-        # Draw obstacles
-        for obstacle in obstacles:
-            pos = (int(obstacle.offset.x), int(obstacle.offset.y))
-            pygame.draw.circle(screen, GRAY, pos, int(obstacle.radius))
+        # Clear screen with the pre-rendered boundaries and obstacles
+        screen.blit(static_background, (0, 0))
         
         # Draw car
-        car_pos = (int(car.body.position.x), int(car.body.position.y))
-        car_angle = car.body.angle
-        
-        # Calculate car corners for drawing
-        half_width = car.config.width / 2
-        half_height = car.config.height / 2
-        
-        corners = [
-            (-half_width, -half_height),
-            (half_width, -half_height),
-            (half_width, half_height),
-            (-half_width, half_height)
-        ]
+        # Interpolate between the last two physics states by the leftover time
+        alpha = physics_engine.interpolation_alpha
+        position = previous_position.interpolate_to(body.position, alpha)
+        car_pos = (int(position.x), int(position.y))
+        car_angle = previous_angle + (body.angle - previous_angle) * alpha
         
-        # Rotate and translate corners
-        rotated_corners = []
-        for corner in corners:
-            rotated_x = corner[0] * math.cos(car_angle) - corner[1] * math.sin(car_angle)
-            rotated_y = corner[0] * math.sin(car_angle) + corner[1] * math.cos(car_angle)
-            rotated_corners.append((
-                int(car_pos[0] + rotated_x),
-                int(car_pos[1] + rotated_y)
-            ))
+        # Rotate and translate car corners for drawing
+        rotate_box_corners(car.config.width / 2, car.config.height / 2, car_angle,
+                           car_pos, out=car_corners)
         
-        pygame.draw.polygon(screen, RED, rotated_corners)
+        # pygame reads the int32 buffer rows directly as points
+        draw_polygon(screen, RED, car_corners)
         
         # Draw forward direction indicator
         forward = car.get_forward_vector()
@@ -200,55 +273,56 @@ def main():
             int(car_pos[0] + forward.x * 30),
             int(car_pos[1] + forward.y * 30)
         )
-        pygame.draw.line(screen, BLACK, car_pos, forward_end, 3)
+        draw_line(screen, BLACK, car_pos, forward_end, 3)
         
         # Draw velocity vector
-        velocity = car.body.velocity
-        if velocity.length > 1:
-            vel_scale = min(velocity.length / 5, 50)
+        velocity = body.velocity
+        if velocity.get_length_sqrd() > 1:  # Gate without a sqrt when stationary
+            speed = velocity.length
+            vel_scale = min(speed / 5, 50) / speed
             vel_end = (
-                int(car_pos[0] + velocity.x / velocity.length * vel_scale),
-                int(car_pos[1] + velocity.y / velocity.length * vel_scale)
+                int(car_pos[0] + velocity.x * vel_scale),
+                int(car_pos[1] + velocity.y * vel_scale)
             )
-            pygame.draw.line(screen, BLUE, car_pos, vel_end, 2)
+            draw_line(screen, BLUE, car_pos, vel_end, 2)
         
         # Draw debug physics
-        physics_engine.render_debug()
+        physics_engine.render_debug(include_static=False)  # Static geometry is in the background
         
-        # Draw UI
-        physics_info = car.get_physics_info()
-        
-        # Title
-        title_text = font.render(f"Car Physics Demo - {current_physics.title()} Mode", True, BLACK)
-        screen.blit(title_text, (10, 10))
+        # Draw UI: title
+        screen.blit(title_surf, (10, 10))
         
         # Instructions
-        instructions = [
-            "WASD/Arrow Keys: Drive",
-            "Space: Brake",
-            "R: Reset position",
-            "P: Switch physics model"
-        ]
-        
-        for i, instruction in enumerate(instructions):
-            text = small_font.render(instruction, True, BLACK)
+        for i, text in enumerate(instruction_surfs):
             screen.blit(text, (10, 50 + i * 20))
         
-        # Physics info
-        info_lines = [
-            f"Speed: {physics_info['speed']:.1f} px/s",
-            f"Forward Speed: {physics_info['forward_speed']:.1f} px/s",
-            f"Lateral Speed: {physics_info['lateral_speed']:.1f} px/s",
-            f"Sliding: {'Yes' if physics_info['is_sliding'] else 'No'}",
-            f"Throttle: {physics_info['throttle']:.2f}",
-            f"Steering: {physics_info['steering']:.2f}",
-            f"Brake: {physics_info['brake']:.2f}",
-            f"Collisions: {collision_count}"
-        ]
+        # Physics info, refreshed at a readable rate rather than every frame
+        info_elapsed += clock.get_time()
+        if info_elapsed >= INFO_INTERVAL_MS:
+            info_elapsed = 0
+            car.fill_physics_info(physics_info)
+            info_lines = [
+                f"Speed: {physics_info.speed:.1f} px/s",
+                f"Forward Speed: {physics_info.forward_speed:.1f} px/s",
+                f"Lateral Speed: {physics_info.lateral_speed:.1f} px/s",
+                f"Sliding: {'Yes' if physics_info.is_sliding else 'No'}",
+                f"Throttle: {physics_info.throttle:.2f}",
+                f"Steering: {physics_info.steering:.2f}",
+                f"Brake: {physics_info.brake:.2f}",
+                f"Collisions: {collision_count}"
+            ]
+            
+            if len(info_surfs) != len(info_lines):
+                info_strings = [None] * len(info_lines)
+                info_surfs = [None] * len(info_lines)
+            
+            for i, line in enumerate(info_lines):
+                if line != info_strings[i]:
+                    color = RED if "Sliding: Yes" in line else BLACK
+                    info_surfs[i] = small_font.render(line, True, color)
+                    info_strings[i] = line
         
-        for i, line in enumerate(info_lines):
-            color = RED if "Sliding: Yes" in line else BLACK
-            text = small_font.render(line, True, color)
+        for i, text in enumerate(info_surfs):
             screen.blit(text, (WIDTH - 200, 50 + i * 20))
         
         # Update display
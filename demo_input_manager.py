@@ -7,11 +7,96 @@ showing how keyboard inputs are processed and converted to car controls.
 """
 
 import pygame
+import queue
 import sys
+import threading
 import time
 from src.input import InputManager, InputAction, ControlSchemes, ControlsHelper
 
 
+# Real-time display, including the ANSI clear screen / cursor home prefix
+INFO_TEMPLATE = (
+    "\033[2J\033[H"
+    "Input Manager Demo - Real-time Input Display\n"
+    + "=" * 60 + "\n"
+    "\n"
+    "CAR CONTROLS:\n"
+    "  Throttle: {throttle:6.3f} {throttle_bar}\n"
+    "  Steering: {steering:6.3f} {steering_bar}\n"
+    "  Brake:    {brake:6.3f} {brake_bar}\n"
+    "\n"
+    "RAW INPUT STATE:\n"
+    "  Accelerate:   {raw_accelerate:6.3f}\n"
+    "  Brake:        {raw_brake:6.3f}\n"
+    "  Steer Left:   {raw_steer_left:6.3f}\n"
+    "  Steer Right:  {raw_steer_right:6.3f}\n"
+    "  Reverse:      {raw_reverse:6.3f}\n"
+    "\n"
+    "DIGITAL INPUTS:\n"
+    "  Pause:         {pause}\n"
+    "  Reset:         {reset}\n"
+    "  Switch Physics:{switch_physics}\n"
+    "\n"
+    "PRESSED KEYS: {pressed_keys}\n"
+    "\n"
+    "INPUT CONFIGURATION:\n"
+    "  Acceleration Smoothing: {acceleration_smoothing}\n"
+    "  Steering Smoothing:     {steering_smoothing}\n"
+    "  Brake Smoothing:        {brake_smoothing}\n"
+    "  Input Deadzone:         {deadzone}\n"
+    "\n"
+    "Controls: WASD/Arrow Keys to drive, Shift for reverse, Space for brake\n"
+    "System: P=Pause, R=Reset, Tab=Switch Physics, ESC=Quit\n"
+)
+
+
+class ConsoleWriter:
+    """
+    Background thread that owns stdout while the demo loop runs.
+    
+    All console output goes through one queue, so display refreshes and
+    action messages never interleave. Display refreshes are dropped when the
+    terminal falls behind; messages are always written.
+    """
+    
+    def __init__(self, maxsize=2):
+        """
+        Start the writer thread.
+        
+        Args:
+            maxsize: Number of pending writes to buffer before display
+                refreshes are dropped
+        """
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(target=self._write_loop, name="console-writer")
+        self._thread.start()
+    
+    def _write_loop(self):
+        """Write queued text until the shutdown sentinel arrives."""
+        while True:
+            text = self._queue.get()
+            if text is None:
+                return
+            sys.stdout.write(text)
+            sys.stdout.flush()
+    
+    def show(self, display):
+        """Queue a full display refresh, dropping it if the writer is behind."""
+        try:
+            self._queue.put_nowait(display)
+        except queue.Full:
+            pass
+    
+    def print(self, message):
+        """Queue a message line; waits for room rather than dropping it."""
+        self._queue.put(message + "\n")
+    
+    def close(self):
+        """Write everything still queued, then stop the thread."""
+        self._queue.put(None)
+        self._thread.join()
+
+
 def main():
     """Run the input manager demo."""
     print("Input Manager Demo")
@@ -21,9 +106,12 @@ def main():
     # Initialize pygame
     pygame.init()
     
-    # Create display for pygame event handling
+    # Create display for pygame event handling; its contents never change,
+    # so it is cleared and presented once here rather than every frame
     screen = pygame.display.set_mode((800, 600))
     pygame.display.set_caption("Input Manager Demo")
+    screen.fill((0, 0, 0))
+    pygame.display.flip()
     clock = pygame.time.Clock()
     
     # Create input manager with combined control scheme
@@ -36,36 +124,64 @@ def main():
     print("Press keys to see input response. Press ESC to quit.")
     print("=" * 60)
     
-    # Demo variables
-    running = True
-    last_info_time = 0
-    info_update_interval = 0.1  # Update info display 10 times per second
+    # Terminal output happens off the main loop; from here on everything
+    # is written through the console writer
+    console = ConsoleWriter()
     
     # Set up action callbacks
     def on_pause():
-        print("PAUSE action triggered!")
+        console.print("PAUSE action triggered!")
     
     def on_reset():
-        print("RESET action triggered!")
+        console.print("RESET action triggered!")
     
     def on_switch_physics():
-        print("SWITCH PHYSICS action triggered!")
+        console.print("SWITCH PHYSICS action triggered!")
     
     input_manager.set_action_callback(InputAction.PAUSE, on_pause)
     input_manager.set_action_callback(InputAction.RESET, on_reset)
     input_manager.set_action_callback(InputAction.SWITCH_PHYSICS, on_switch_physics)
     
+    try:
+        run_loop(clock, input_manager, console)
+    finally:
+        # Flush pending output before anything else prints
+        console.close()
+    
+    # Cleanup
+    pygame.quit()
+    print("\nDemo finished!")
+
+
+def run_loop(clock, input_manager, console):
+    """
+    Run the demo's frame loop until the window is closed or ESC is pressed.
+    
+    Args:
+        clock: Frame clock
+        input_manager: InputManager fed from the window's events
+        console: ConsoleWriter the live display is written through
+    """
+    running = True
+    last_info_time = 0
+    info_update_interval = 0.1  # Update info display 10 times per second
+    
     while running:
         dt = clock.tick(60) / 1000.0  # 60 FPS, convert to seconds
         current_time = time.time()
         
         # Handle pygame events
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        input_manager.process_events(events)
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     running = False
+            elif event.type == pygame.WINDOWEXPOSED:
+                # Re-present the static window only when the OS asks for it
+                pygame.display.update()
         
         # Update input manager
         input_manager.update(dt)
@@ -75,65 +191,37 @@ def main():
         
         # Display info periodically
         if current_time - last_info_time >= info_update_interval:
-            # Clear screen (simple console output)
-            print("\033[2J\033[H", end="")  # ANSI clear screen and move cursor to top
-            
-            print("Input Manager Demo - Real-time Input Display")
-            print("=" * 60)
-            print()
-            
-            # Display car controls
-            print("CAR CONTROLS:")
-            print(f"  Throttle: {throttle:6.3f} {'█' * int(abs(throttle) * 20)}")
-            print(f"  Steering: {steering:6.3f} {'█' * int(abs(steering) * 20)}")
-            print(f"  Brake:    {brake:6.3f} {'█' * int(brake * 20)}")
-            print()
-            
-            # Display raw input state
+            # Render the whole display as one string for the console writer
             info = input_manager.get_input_info()
-            print("RAW INPUT STATE:")
-            print(f"  Accelerate:   {info['raw_accelerate']:6.3f}")
-            print(f"  Brake:        {info['raw_brake']:6.3f}")
-            print(f"  Steer Left:   {info['raw_steer_left']:6.3f}")
-            print(f"  Steer Right:  {info['raw_steer_right']:6.3f}")
-            print(f"  Reverse:      {info['raw_reverse']:6.3f}")
-            print()
-            
-            # Display digital inputs
-            print("DIGITAL INPUTS:")
-            print(f"  Pause:         {'YES' if info['pause'] else 'NO'}")
-            print(f"  Reset:         {'YES' if info['reset'] else 'NO'}")
-            print(f"  Switch Physics:{'YES' if info['switch_physics'] else 'NO'}")
-            print()
-            
-            # Display currently pressed keys
             if info['pressed_keys']:
-                key_names = [ControlsHelper.get_key_name(key) for key in info['pressed_keys']]
-                print(f"PRESSED KEYS: {', '.join(key_names)}")
+                pressed_keys = ', '.join(ControlsHelper.get_key_name(key) for key in info['pressed_keys'])
             else:
-                print("PRESSED KEYS: None")
-            print()
+                pressed_keys = "None"
             
-            # Display configuration
-            print("INPUT CONFIGURATION:")
-            print(f"  Acceleration Smoothing: {info['acceleration_smoothing']}")
-            print(f"  Steering Smoothing:     {info['steering_smoothing']}")
-            print(f"  Brake Smoothing:        {info['brake_smoothing']}")
-            print(f"  Input Deadzone:         {info['deadzone']}")
-            print()
-            
-            print("Controls: WASD/Arrow Keys to drive, Shift for reverse, Space for brake")
-            print("System: P=Pause, R=Reset, Tab=Switch Physics, ESC=Quit")
+            display = INFO_TEMPLATE.format(
+                throttle=throttle,
+                steering=steering,
+                brake=brake,
+                throttle_bar='█' * int(abs(throttle) * 20),
+                steering_bar='█' * int(abs(steering) * 20),
+                brake_bar='█' * int(brake * 20),
+                pause='YES' if info['pause'] else 'NO',
+                reset='YES' if info['reset'] else 'NO',
+                switch_physics='YES' if info['switch_physics'] else 'NO',
+                raw_accelerate=info['raw_accelerate'],
+                raw_brake=info['raw_brake'],
+                raw_steer_left=info['raw_steer_left'],
+                raw_steer_right=info['raw_steer_right'],
+                raw_reverse=info['raw_reverse'],
+                pressed_keys=pressed_keys,
+                acceleration_smoothing=info['acceleration_smoothing'],
+                steering_smoothing=info['steering_smoothing'],
+                brake_smoothing=info['brake_smoothing'],
+                deadzone=info['deadzone']
+            )
+            console.show(display)
             
             last_info_time = current_time
-        
-        # Fill screen with black (required for pygame)
-        screen.fill((0, 0, 0))
-        pygame.display.flip()
-    
-    # Cleanup
-    pygame.quit()
-    print("\nDemo finished!")
 
 
 def test_control_schemes():
@@ -157,8 +245,7 @@ def test_control_schemes():
         ]
         
         for action in movement_actions:
-            keys = [key for key, mapped_action in scheme.key_mappings.items() 
-                   if mapped_action == action]
+            keys = scheme.keys_by_action.get(action)
             if keys:
                 key_names = [ControlsHelper.get_key_name(key) for key in keys]
                 action_desc = ControlsHelper.get_action_description(action)
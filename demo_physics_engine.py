@@ -10,6 +10,7 @@ import pygame
 import pymunk
 import sys
 import math
+import numpy as np
 from src.physics.physics_engine import PhysicsEngine, PhysicsConfig
 
 
@@ -50,6 +51,14 @@ def main():
         wall.friction = 0.7
         physics_engine.add_static_body(wall)
     
+    # Walls never move: cache their endpoints as an int32 (N, 2, 2) array and
+    # draw them once into the background instead of every frame
+    wall_points = np.array([[wall.a, wall.b] for wall in walls], dtype=np.int32)
+    background = pygame.Surface((WIDTH, HEIGHT)).convert()
+    background.fill((50, 50, 50))  # Dark gray background
+    for start, end in wall_points.tolist():
+        pygame.draw.line(background, (0, 255, 0), start, end, wall_thickness * 2)
+    
     # Create some dynamic bodies (balls)
     balls = []
     for i in range(5):
@@ -88,6 +97,39 @@ def main():
     print("- ESC: Exit")
     
     running = True
+    
+    # Bind hot module attributes to locals for the game loop
+    get_pressed = pygame.key.get_pressed
+    K_UP, K_DOWN, K_LEFT, K_RIGHT = pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT
+    apply_force = car_body.apply_force_at_local_point
+    cos, sin = math.cos, math.sin
+    
+    def apply_car_forces(step_dt):
+        """Apply the car forces for the currently held keys."""
+        force_magnitude = 2000
+        
+        if keys[K_UP]:
+            # Apply forward force
+            angle = car_body.angle
+            force_x = force_magnitude * cos(angle)
+            force_y = force_magnitude * sin(angle)
+            apply_force((force_x, force_y), (0, 0))
+        
+        if keys[K_DOWN]:
+            # Apply backward force
+            angle = car_body.angle
+            force_x = -force_magnitude * 0.5 * cos(angle)
+            force_y = -force_magnitude * 0.5 * sin(angle)
+            apply_force((force_x, force_y), (0, 0))
+        
+        if keys[K_LEFT]:
+            # Apply left turning torque
+            apply_force((-force_magnitude * 0.3, 0), (0, 10))
+        
+        if keys[K_RIGHT]:
+            # Apply right turning torque
+            apply_force((force_magnitude * 0.3, 0), (0, 10))
+    
     while running:
         dt = clock.tick(60) / 1000.0  # Convert to seconds
         
@@ -112,40 +154,25 @@ def main():
                     car_body.angular_velocity = 0
                     car_body.angle = 0
         
-        # Handle continuous input (car controls)
-        keys = pygame.key.get_pressed()
-        force_magnitude = 2000
+        # Idle while the window is minimized or hidden: skip physics and
+        # rendering, and don't count the idle time as simulation time
+        if not pygame.display.get_active():
+            pygame.time.wait(50)
+            clock.tick()
+            continue
         
-        if keys[pygame.K_UP]:
-            # Apply forward force
-            angle = car_body.angle
-            force_x = force_magnitude * math.cos(angle)
-            force_y = force_magnitude * math.sin(angle)
-            car_body.apply_force_at_local_point((force_x, force_y), (0, 0))
-        
-        if keys[pygame.K_DOWN]:
-            # Apply backward force
-            angle = car_body.angle
-            force_x = -force_magnitude * 0.5 * math.cos(angle)
-            force_y = -force_magnitude * 0.5 * math.sin(angle)
-            car_body.apply_force_at_local_point((force_x, force_y), (0, 0))
-        
-        if keys[pygame.K_LEFT]:
-            # Apply left turning torque
-            car_body.apply_force_at_local_point((-force_magnitude * 0.3, 0), (0, 10))
-        
-        if keys[pygame.K_RIGHT]:
-            # Apply right turning torque
-            car_body.apply_force_at_local_point((force_magnitude * 0.3, 0), (0, 10))
+        # Handle continuous input (car controls)
+        keys = get_pressed()
         
-        # Step physics simulation
-        physics_engine.step(dt)
+        # Step physics in fixed increments; Pymunk clears forces after every
+        # step, so the car forces are re-applied before each one
+        physics_engine.advance(dt, apply_car_forces)
         
-        # Clear screen
-        screen.fill((50, 50, 50))  # Dark gray background
+        # Clear screen to the background with the pre-rendered walls
+        screen.blit(background, (0, 0))
         
-        # Render debug physics
-        physics_engine.render_debug()
+        # Render debug physics for the moving bodies
+        physics_engine.render_debug(include_static=False)
         
         # Display information
         if show_info:
@@ -6,28 +6,34 @@ implementing a custom event messaging system for game components.
 """
 
 import pygame
-from typing import Dict, List, Callable, Any, Optional
-from enum import Enum
+import traceback
+from typing import Dict, List, Callable, Any, Optional, Tuple
+from enum import IntEnum
 from dataclasses import dataclass
 
 
-class GameEventType(Enum):
-    """Custom game event types beyond pygame events."""
+class GameEventType(IntEnum):
+    """
+    Custom game event types beyond pygame events.
+
+    Values are dense integer tags so handler lists can be indexed by type.
+    """
 
-    SCENE_CHANGE_REQUESTED = "scene_change_requested"
-    CAR_COLLISION = "car_collision"
-    LAP_COMPLETED = "lap_completed"
-    RACE_FINISHED = "race_finished"
-    TRACK_LOADED = "track_loaded"
-    PHYSICS_MODEL_CHANGED = "physics_model_changed"
+    SCENE_CHANGE_REQUESTED = 0
+    CAR_COLLISION = 1
+    LAP_COMPLETED = 2
+    RACE_FINISHED = 3
+    TRACK_LOADED = 4
+    PHYSICS_MODEL_CHANGED = 5
 
 
-@dataclass
+@dataclass(slots=True)
 class GameEvent:
     """
     Custom game event data structure.
 
     This allows for game-specific events beyond pygame's event system.
+    Slotted, since one is allocated for every posted event.
     """
 
     event_type: GameEventType
@@ -36,6 +42,10 @@ class GameEvent:
     source: Optional[str] = None
 
 
+# Data placeholder for reserved slots that haven't been published yet
+_UNPUBLISHED = object()
+
+
 class EventSystem:
     """
     Event handling and messaging system for the game.
@@ -44,16 +54,38 @@ class EventSystem:
     providing a centralized event handling mechanism.
     """
 
+    INITIAL_QUEUE_CAPACITY = 1024
+
     def __init__(self) -> None:
         """Initialize the event system."""
         # Pygame event handlers
         self.pygame_handlers: Dict[int, List[Callable]] = {}
+        # Dense table indexed by event type holding tuple snapshots of the
+        # handler lists above, so dispatch is a list index instead of a hash
+        # lookup. Snapshots are rebuilt on (un)registration, so handlers may
+        # (un)register during dispatch without affecting the running loop.
+        self._handlers_by_type: List[Optional[Tuple[Callable, ...]]] = [None] * pygame.NUMEVENTS
 
         # Custom game event handlers
         self.game_event_handlers: Dict[GameEventType, List[Callable]] = {}
+        # Dense table of tuple snapshots indexed by game event type
+        self._game_handlers_by_type: List[Optional[Tuple[Callable, ...]]] = [None] * len(
+            GameEventType
+        )
 
-        # Event queue for custom events
-        self.event_queue: List[GameEvent] = []
+        # Ring buffer queue for custom events, stored as parallel slot lists.
+        # Capacity is a power of two so sequence numbers map to slots with a
+        # mask; it doubles when full. Sequences in [head, published) are ready
+        # for dispatch, [published, tail) are reserved but not yet published.
+        capacity = self.INITIAL_QUEUE_CAPACITY
+        self._ring_types: List[Optional[GameEventType]] = [None] * capacity
+        self._ring_data: List[Any] = [None] * capacity
+        self._ring_timestamps: List[float] = [0.0] * capacity
+        self._ring_sources: List[Optional[str]] = [None] * capacity
+        self._mask = capacity - 1
+        self._head = 0
+        self._published = 0
+        self._tail = 0
 
         # Event statistics
         self.events_processed = 0
@@ -67,10 +99,15 @@ class EventSystem:
         Args:
             event_type: pygame event type constant (e.g., pygame.KEYDOWN)
             handler: Function to call when this event occurs
+
+        Raises:
+            TypeError: If handler is not callable
         """
-        if event_type not in self.pygame_handlers:
-            self.pygame_handlers[event_type] = []
-        self.pygame_handlers[event_type].append(handler)
+        if not callable(handler):
+            raise TypeError(f"Event handler must be callable, got {handler!r}")
+        handlers = self.pygame_handlers.setdefault(event_type, [])
+        handlers.append(handler)
+        self._handlers_by_type[event_type] = tuple(handlers)
 
     def register_game_event_handler(
         self, event_type: GameEventType, handler: Callable[[GameEvent], None]
@@ -81,10 +118,15 @@ class EventSystem:
         Args:
             event_type: Custom game event type
             handler: Function to call when this event occurs
+
+        Raises:
+            TypeError: If handler is not callable
         """
-        if event_type not in self.game_event_handlers:
-            self.game_event_handlers[event_type] = []
-        self.game_event_handlers[event_type].append(handler)
+        if not callable(handler):
+            raise TypeError(f"Event handler must be callable, got {handler!r}")
+        handlers = self.game_event_handlers.setdefault(event_type, [])
+        handlers.append(handler)
+        self._game_handlers_by_type[event_type] = tuple(handlers)
 
     def unregister_pygame_handler(self, event_type: int, handler: Callable) -> bool:
         """
@@ -98,11 +140,13 @@ class EventSystem:
             bool: True if handler was found and removed, False otherwise
         """
         if event_type in self.pygame_handlers:
+            handlers = self.pygame_handlers[event_type]
             try:
-                self.pygame_handlers[event_type].remove(handler)
-                return True
+                handlers.remove(handler)
             except ValueError:
-                pass
+                return False
+            self._handlers_by_type[event_type] = tuple(handlers) or None
+            return True
         return False
 
     def unregister_game_event_handler(
@@ -119,11 +163,13 @@ class EventSystem:
             bool: True if handler was found and removed, False otherwise
         """
         if event_type in self.game_event_handlers:
+            handlers = self.game_event_handlers[event_type]
             try:
-                self.game_event_handlers[event_type].remove(handler)
-                return True
+                handlers.remove(handler)
             except ValueError:
-                pass
+                return False
+            self._game_handlers_by_type[event_type] = tuple(handlers) or None
+            return True
         return False
 
     def post_game_event(
@@ -140,54 +186,220 @@ class EventSystem:
             data: Event data dictionary
             source: Optional source identifier for the event
         """
-        event = GameEvent(
-            event_type=event_type,
-            data=data,
-            timestamp=pygame.time.get_ticks() / 1000.0,
-            source=source,
+        self.publish_event(self.reserve_event(event_type, source), data)
+
+    def reserve_event(
+        self, event_type: GameEventType, source: Optional[str] = None
+    ) -> int:
+        """
+        Reserve the next queue slot for an event whose data is filled in later.
+
+        The event keeps its place in the queue from the moment it is reserved,
+        but is not dispatched until publish_event() is called for it.
+
+        Args:
+            event_type: Type of game event
+            source: Optional source identifier for the event
+
+        Returns:
+            int: Sequence number to pass to publish_event()
+        """
+        if self._tail - self._head > self._mask:
+            self._grow_event_queue()
+
+        sequence = self._tail
+        slot = sequence & self._mask
+        self._ring_types[slot] = event_type
+        self._ring_data[slot] = _UNPUBLISHED
+        self._ring_timestamps[slot] = pygame.time.get_ticks() * 0.001
+        self._ring_sources[slot] = source
+        self._tail = sequence + 1
+        return sequence
+
+    def publish_event(self, sequence: int, data: Dict[str, Any]) -> None:
+        """
+        Fill in a reserved event's data and make it available for dispatch.
+
+        Events are dispatched in reservation order, so an event published
+        early waits for any earlier reservations to be published too.
+
+        Args:
+            sequence: Sequence number returned by reserve_event()
+            data: Event data dictionary
+        """
+        if not self._head <= sequence < self._tail:
+            # Cleared before it was published
+            return
+
+        ring_data, mask = self._ring_data, self._mask
+        ring_data[sequence & mask] = data
+
+        published, tail = self._published, self._tail
+        while published < tail and ring_data[published & mask] is not _UNPUBLISHED:
+            published += 1
+        self._published = published
+
+    def _grow_event_queue(self) -> None:
+        """Double the ring buffer capacity, keeping every sequence number valid."""
+        old_mask = self._mask
+        capacity = (old_mask + 1) * 2
+        mask = capacity - 1
+
+        rings = []
+        for old_ring, fill in (
+            (self._ring_types, None),
+            (self._ring_data, None),
+            (self._ring_timestamps, 0.0),
+            (self._ring_sources, None),
+        ):
+            ring = [fill] * capacity
+            for sequence in range(self._head, self._tail):
+                ring[sequence & mask] = old_ring[sequence & old_mask]
+            rings.append(ring)
+
+        self._ring_types, self._ring_data, self._ring_timestamps, self._ring_sources = rings
+        self._mask = mask
+
+    def _make_event(self, sequence: int) -> GameEvent:
+        """Build the GameEvent handed to handlers for a queued sequence."""
+        slot = sequence & self._mask
+        return GameEvent(
+            event_type=self._ring_types[slot],
+            data=self._ring_data[slot],
+            timestamp=self._ring_timestamps[slot],
+            source=self._ring_sources[slot],
         )
-        self.event_queue.append(event)
 
-    def process_pygame_events(self) -> List[pygame.event.Event]:
+    @property
+    def event_queue(self) -> List[GameEvent]:
+        """
+        Get the published custom game events in posting order.
+
+        Returns:
+            List[GameEvent]: Snapshot of events not yet processed
+        """
+        return [self._make_event(sequence) for sequence in range(self._head, self._published)]
+
+    def get_pending_event_count(self) -> int:
         """
-        Process all pygame events and dispatch to registered handlers.
+        Get the number of custom game events waiting to be processed.
+
+        Returns:
+            int: Number of published events not yet processed
+        """
+        return self._published - self._head
+
+    def process_pygame_events(
+        self, events: Optional[List[pygame.event.Event]] = None
+    ) -> List[pygame.event.Event]:
+        """
+        Process pygame events and dispatch to registered handlers.
+
+        Args:
+            events: Events already retrieved this frame (e.g. the game engine's
+                frame_events). The pygame queue is drained only if None, so
+                the queue is never read twice per frame.
 
         Returns:
             List[pygame.event.Event]: List of all pygame events processed
         """
-        events = pygame.event.get()
+        if events is None:
+            events = pygame.event.get()
+        return self.dispatch(events)
+
+    def dispatch(self, events: List[pygame.event.Event]) -> List[pygame.event.Event]:
+        """
+        Dispatch an already-retrieved list of pygame events to registered handlers.
 
+        This never touches the pygame queue; the caller owns the single
+        pygame.event.get() per frame.
+
+        Args:
+            events: Events retrieved this frame
+
+        Returns:
+            List[pygame.event.Event]: The same list, for chaining
+        """
+        handlers_by_type = self._handlers_by_type
         for event in events:
             # Dispatch to registered handlers
-            if event.type in self.pygame_handlers:
-                for handler in self.pygame_handlers[event.type]:
+            handlers = handlers_by_type[event.type]
+            if handlers:
+                for handler in handlers:
                     try:
                         handler(event)
                     except Exception as e:
-                        print(f"Error in pygame event handler: {e}")
-
-            self.events_processed += 1
+                        self._report_handler_error(pygame.event.event_name(event.type), handler, e)
 
+        self.events_processed += len(events)
         return events
 
     def process_game_events(self) -> None:
-        """Process all custom game events in the queue."""
-        while self.event_queue:
-            event = self.event_queue.pop(0)
+        """
+        Process all published custom game events in the queue.
 
-            # Dispatch to registered handlers
-            if event.event_type in self.game_event_handlers:
-                for handler in self.game_event_handlers[event.event_type]:
-                    try:
-                        handler(event)
-                    except Exception as e:
-                        print(f"Error in game event handler: {e}")
+        Events are dispatched in batches by type: each handler runs over all
+        of its type's events before the next handler. Order is preserved within
+        a type; types are dispatched in the order their first event arrived.
+        """
+        game_handlers_by_type = self._game_handlers_by_type
+
+        # Handlers may post new events; they are processed in the same call
+        while self._head != self._published:
+            start, end = self._head, self._published
+            mask = self._mask
+            ring_types, ring_data, ring_sources = (
+                self._ring_types,
+                self._ring_data,
+                self._ring_sources,
+            )
+
+            # Drain the published range into per-type batches. Events nobody
+            # listens to are dropped without building a GameEvent.
+            batches: Dict[GameEventType, List[GameEvent]] = {}
+            for sequence in range(start, end):
+                slot = sequence & mask
+                event_type = ring_types[slot]
+                if game_handlers_by_type[event_type]:
+                    batch = batches.get(event_type)
+                    if batch is None:
+                        batch = batches[event_type] = []
+                    batch.append(self._make_event(sequence))
+                ring_data[slot] = ring_sources[slot] = None
+            self._head = end
+            self.events_processed += end - start
+
+            # Dispatch each batch through its handler list; a type whose
+            # handlers were all unregistered mid-dispatch is skipped
+            for event_type, events in batches.items():
+                for handler in game_handlers_by_type[event_type] or ():
+                    for event in events:
+                        try:
+                            handler(event)
+                        except Exception as e:
+                            self._report_handler_error(event_type.name, handler, e)
+
+    @staticmethod
+    def _report_handler_error(event_name: str, handler: Callable, error: Exception) -> None:
+        """
+        Log a failing handler with its traceback and keep dispatching.
 
-            self.events_processed += 1
+        Args:
+            event_name: Name of the event being dispatched
+            handler: Handler that raised
+            error: The raised exception
+        """
+        handler_name = getattr(handler, "__qualname__", repr(handler))
+        print(f"Error in {event_name} handler {handler_name}: {error}")
+        traceback.print_exception(error)
 
     def clear_event_queue(self) -> None:
-        """Clear all pending custom game events."""
-        self.event_queue.clear()
+        """Clear all pending custom game events, including unpublished reservations."""
+        mask = self._mask
+        for sequence in range(self._head, self._tail):
+            slot = sequence & mask
+            self._ring_data[slot] = self._ring_sources[slot] = None
+        self._head = self._published = self._tail
 
     def get_events_processed(self) -> int:
         """
@@ -205,18 +417,58 @@ class InputManager:
 
     This class provides utilities for checking input states and
     managing input mappings for the game.
+
+    Key and button states are stored as integer bitsets: membership is a
+    bit test and clearing the per-frame states is a single assignment.
     """
 
+    # Keycodes below this are used directly as bit indices
+    _DIRECT_KEY_LIMIT = 512
+    # SDL keycodes for keys without a character are scancodes with this bit set
+    _SCANCODE_MASK = 1 << 30
+
     def __init__(self) -> None:
         """Initialize the input manager."""
-        self.keys_pressed: set[int] = set()
-        self.keys_just_pressed: set[int] = set()
-        self.keys_just_released: set[int] = set()
+        self._keys_pressed = 0
+        self._keys_just_pressed = 0
+        self._keys_just_released = 0
+
+        # Bit indices handed out to keycodes outside the compact ranges
+        # (e.g. non-Latin layout characters), assigned on first sight
+        self._wide_key_indices: Dict[int, int] = {}
 
         self.mouse_pos = (0, 0)
-        self.mouse_buttons: set[int] = set()
-        self.mouse_just_pressed: set[int] = set()
-        self.mouse_just_released: set[int] = set()
+        self._mouse_buttons = 0
+        self._mouse_just_pressed = 0
+        self._mouse_just_released = 0
+
+    def _key_index(self, key: int, assign: bool = False) -> Optional[int]:
+        """
+        Map a pygame keycode to a small bit index.
+
+        Args:
+            key: pygame key constant
+            assign: Whether to allocate an index for an unseen wide keycode
+
+        Returns:
+            Optional[int]: Bit index, or None for an unseen wide keycode
+        """
+        if 0 <= key < self._DIRECT_KEY_LIMIT:
+            return key
+        scancode = key ^ self._SCANCODE_MASK
+        if 0 <= scancode < self._DIRECT_KEY_LIMIT:
+            return self._DIRECT_KEY_LIMIT + scancode
+
+        index = self._wide_key_indices.get(key)
+        if index is None and assign:
+            index = 2 * self._DIRECT_KEY_LIMIT + len(self._wide_key_indices)
+            self._wide_key_indices[key] = index
+        return index
+
+    def _key_bit(self, key: int) -> int:
+        """Get the bitset mask for a keycode (0 if it was never seen)."""
+        index = self._key_index(key)
+        return 0 if index is None else 1 << index
 
     def update(self, events: List[pygame.event.Event]) -> None:
         """
@@ -226,28 +478,101 @@ class InputManager:
             events: List of pygame events to process
         """
         # Clear frame-specific input states
-        self.keys_just_pressed.clear()
-        self.keys_just_released.clear()
-        self.mouse_just_pressed.clear()
-        self.mouse_just_released.clear()
+        keys_pressed = self._keys_pressed
+        keys_just_pressed = keys_just_released = 0
+        mouse_buttons = self._mouse_buttons
+        mouse_just_pressed = mouse_just_released = 0
 
         # Process events
         for event in events:
-            if event.type == pygame.KEYDOWN:
-                self.keys_pressed.add(event.key)
-                self.keys_just_pressed.add(event.key)
-            elif event.type == pygame.KEYUP:
-                self.keys_pressed.discard(event.key)
-                self.keys_just_released.add(event.key)
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                self.mouse_buttons.add(event.button)
-                self.mouse_just_pressed.add(event.button)
-            elif event.type == pygame.MOUSEBUTTONUP:
-                self.mouse_buttons.discard(event.button)
-                self.mouse_just_released.add(event.button)
-            elif event.type == pygame.MOUSEMOTION:
+            event_type = event.type
+            if event_type == pygame.KEYDOWN:
+                bit = 1 << self._key_index(event.key, assign=True)
+                keys_pressed |= bit
+                keys_just_pressed |= bit
+            elif event_type == pygame.KEYUP:
+                bit = 1 << self._key_index(event.key, assign=True)
+                keys_pressed &= ~bit
+                keys_just_released |= bit
+            elif event_type == pygame.MOUSEBUTTONDOWN:
+                bit = 1 << event.button
+                mouse_buttons |= bit
+                mouse_just_pressed |= bit
+            elif event_type == pygame.MOUSEBUTTONUP:
+                bit = 1 << event.button
+                mouse_buttons &= ~bit
+                mouse_just_released |= bit
+            elif event_type == pygame.MOUSEMOTION:
                 self.mouse_pos = event.pos
 
+        self._keys_pressed = keys_pressed
+        self._keys_just_pressed = keys_just_pressed
+        self._keys_just_released = keys_just_released
+        self._mouse_buttons = mouse_buttons
+        self._mouse_just_pressed = mouse_just_pressed
+        self._mouse_just_released = mouse_just_released
+
+    def _keys_from_bits(self, bits: int) -> frozenset[int]:
+        """
+        Decode a key bitset back into pygame keycodes.
+
+        Args:
+            bits: Key bitset
+
+        Returns:
+            frozenset[int]: Keycodes whose bits are set
+        """
+        keys = set()
+        wide_keys = None
+        while bits:
+            low_bit = bits & -bits
+            index = low_bit.bit_length() - 1
+            bits ^= low_bit
+            if index < self._DIRECT_KEY_LIMIT:
+                keys.add(index)
+            elif index < 2 * self._DIRECT_KEY_LIMIT:
+                keys.add((index - self._DIRECT_KEY_LIMIT) | self._SCANCODE_MASK)
+            else:
+                if wide_keys is None:
+                    wide_keys = {i: k for k, i in self._wide_key_indices.items()}
+                keys.add(wide_keys[index])
+        return frozenset(keys)
+
+    @staticmethod
+    def _buttons_from_bits(bits: int) -> frozenset[int]:
+        """Decode a mouse button bitset into button numbers."""
+        return frozenset(button for button in range(bits.bit_length()) if bits >> button & 1)
+
+    @property
+    def keys_pressed(self) -> frozenset[int]:
+        """frozenset[int]: Keys currently held down (read-only snapshot)."""
+        return self._keys_from_bits(self._keys_pressed)
+
+    @property
+    def keys_just_pressed(self) -> frozenset[int]:
+        """frozenset[int]: Keys pressed this frame (read-only snapshot)."""
+        return self._keys_from_bits(self._keys_just_pressed)
+
+    @property
+    def keys_just_released(self) -> frozenset[int]:
+        """frozenset[int]: Keys released this frame (read-only snapshot)."""
+        return self._keys_from_bits(self._keys_just_released)
+
+    @property
+    def mouse_buttons(self) -> frozenset[int]:
+        """frozenset[int]: Mouse buttons currently held down (read-only snapshot)."""
+        return self._buttons_from_bits(self._mouse_buttons)
+
+    @property
+    def mouse_just_pressed(self) -> frozenset[int]:
+        """frozenset[int]: Mouse buttons pressed this frame (read-only snapshot)."""
+        return self._buttons_from_bits(self._mouse_just_pressed)
+
+    @property
+    def mouse_just_released(self) -> frozenset[int]:
+        """frozenset[int]: Mouse buttons released this frame (read-only snapshot)."""
+        return self._buttons_from_bits(self._mouse_just_released)
+
     def is_key_pressed(self, key: int) -> bool:
         """
         Check if a key is currently pressed.
@@ -258,7 +583,7 @@ class InputManager:
         Returns:
             bool: True if key is currently pressed
         """
-        return key in self.keys_pressed
+        return bool(self._keys_pressed & self._key_bit(key))
 
     def is_key_just_pressed(self, key: int) -> bool:
         """
@@ -270,7 +595,7 @@ class InputManager:
         Returns:
             bool: True if key was just pressed
         """
-        return key in self.keys_just_pressed
+        return bool(self._keys_just_pressed & self._key_bit(key))
 
     def is_key_just_released(self, key: int) -> bool:
         """
@@ -282,7 +607,16 @@ class InputManager:
         Returns:
             bool: True if key was just released
         """
-        return key in self.keys_just_released
+        return bool(self._keys_just_released & self._key_bit(key))
+
+    def is_any_key_pressed(self) -> bool:
+        """
+        Check if any key is currently pressed.
+
+        Returns:
+            bool: True if at least one key is held
+        """
+        return self._keys_pressed != 0
 
     def is_mouse_button_pressed(self, button: int) -> bool:
         """
@@ -294,7 +628,7 @@ class InputManager:
         Returns:
             bool: True if mouse button is currently pressed
         """
-        return button in self.mouse_buttons
+        return bool(self._mouse_buttons >> button & 1)
 
     def is_mouse_button_just_pressed(self, button: int) -> bool:
         """
@@ -306,7 +640,7 @@ class InputManager:
         Returns:
             bool: True if mouse button was just pressed
         """
-        return button in self.mouse_just_pressed
+        return bool(self._mouse_just_pressed >> button & 1)
 
     def get_mouse_position(self) -> tuple[int, int]:
         """
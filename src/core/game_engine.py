@@ -6,10 +6,15 @@ scene transitions, and event handling for the retro racing game.
 """
 
 import pygame
-from typing import Dict, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable
 from enum import Enum
 from dataclasses import dataclass
 
+from .event_system import EventSystem, InputManager
+from src.utils.fonts import get_font
+
+MS_TO_SECONDS = 0.001
+
 
 class GameScene(Enum):
     """Enumeration of available game scenes."""
@@ -29,6 +34,8 @@ class GameConfig:
     window_height: int = 768
     window_title: str = "Retro Racing Game"
     target_fps: int = 60
+    background_idle_ms: int = 50  # Sleep per loop while the window is minimized or hidden
+    static_wait_ms: int = 100  # Longest event wait for scenes that aren't animated
     background_color: tuple[int, int, int] = (32, 32, 32)  # Dark gray retro background
 
 
@@ -55,20 +62,55 @@ class GameEngine:
 
         # Game state
         self.running = False
-        self.current_scene = GameScene.MENU
+        # Backing field for current_scene; the property rebinds scene methods
+        self._current_scene = GameScene.MENU
         self.next_scene: Optional[GameScene] = None
 
         # Scene management
         self.scenes: Dict[GameScene, Any] = {}
         self.scene_transition_requested = False
 
+        # Scene methods resolved once at registration (None if not defined)
+        self._scene_update: Dict[GameScene, Optional[Callable]] = {}
+        self._scene_render: Dict[GameScene, Optional[Callable]] = {}
+        self._scene_handle_event: Dict[GameScene, Optional[Callable]] = {}
+        self._scene_enter: Dict[GameScene, Optional[Callable]] = {}
+        self._scene_exit: Dict[GameScene, Optional[Callable]] = {}
+
+        # Methods of the current scene, rebound on registration and whenever
+        # current_scene is assigned
+        self._current_update: Optional[Callable] = None
+        self._current_render: Optional[Callable] = None
+        self._current_handle_event: Optional[Callable] = None
+        # Static scenes are only redrawn when events arrive, and skipped
+        # when the scene's dirty flag says nothing changed
+        self._current_scene_object: Any = None
+        self._current_tracks_dirty = False
+        self._current_animated = True
+        self._redraw_requested = True
+
+        # Display-format background fill, and the current scene's background
+        # with its static content baked in (built on first render)
+        self._background: Optional[pygame.Surface] = None
+        self._current_background: Optional[pygame.Surface] = None
+
         # Event handling
         self.event_handlers: Dict[int, list] = {}
+        # Dense table indexed by event type holding tuple snapshots of the
+        # handler lists above, so dispatch is a list index instead of a hash
+        # lookup; rebuilt whenever a handler is added
+        self._handlers_by_type: List[Optional[tuple]] = [None] * pygame.NUMEVENTS
+        # Events retrieved this frame, shared with other systems so the
+        # pygame queue is only drained once per frame
+        self.frame_events: List[pygame.event.Event] = []
+        # Optional systems fed from frame_events instead of draining the
+        # queue themselves
+        self.event_system: Optional[EventSystem] = None
+        self.input_manager: Optional[InputManager] = None
 
         # Performance tracking
         self.frame_count = 0
         self.delta_time = 0.0
-        self.last_frame_time = 0.0
 
     def initialize(self) -> bool:
         """
@@ -87,12 +129,10 @@ class GameEngine:
             )
             pygame.display.set_caption(self.config.window_title)
 
-            # Initialize the game clock for 60 FPS control
+            # Initialize the game clock for 60 FPS control; it also provides
+            # the frame delta time
             self.clock = pygame.time.Clock()
 
-            # Initialize timing
-            self.last_frame_time = pygame.time.get_ticks()
-
             print(
                 f"GameEngine initialized - {self.config.window_width}x{self.config.window_height} @ {self.config.target_fps} FPS"
             )
@@ -111,8 +151,68 @@ class GameEngine:
             scene_object: The scene object that handles this scene type
         """
         self.scenes[scene_type] = scene_object
+        self._scene_update[scene_type] = getattr(scene_object, "update", None)
+        self._scene_render[scene_type] = getattr(scene_object, "render", None)
+        self._scene_handle_event[scene_type] = getattr(scene_object, "handle_event", None)
+        self._scene_enter[scene_type] = getattr(scene_object, "enter", None)
+        self._scene_exit[scene_type] = getattr(scene_object, "exit", None)
+        if scene_type == self.current_scene:
+            self._bind_current_scene()
         print(f"Registered scene: {scene_type.value}")
 
+    @property
+    def current_scene(self) -> GameScene:
+        """GameScene: The active scene; assigning it rebinds the scene's methods."""
+        return self._current_scene
+
+    @current_scene.setter
+    def current_scene(self, scene_type: GameScene) -> None:
+        self._current_scene = scene_type
+        self._bind_current_scene()
+
+    def _bind_current_scene(self) -> None:
+        """Cache the current scene's per-frame methods."""
+        self._current_update = self._scene_update.get(self.current_scene)
+        self._current_render = self._scene_render.get(self.current_scene)
+        self._current_handle_event = self._scene_handle_event.get(self.current_scene)
+        self._current_background = None
+        scene = self.scenes.get(self.current_scene)
+        self._current_scene_object = scene
+        self._current_tracks_dirty = hasattr(scene, "dirty")
+        self._current_animated = scene is None or getattr(scene, "is_animated", True)
+        self._redraw_requested = True
+
+    def _create_background(self) -> pygame.Surface:
+        """
+        Create a screen-sized surface filled with the background color.
+
+        Returns:
+            pygame.Surface: Background surface in the display's pixel format
+        """
+        background = pygame.Surface(self.screen.get_size())
+        if pygame.display.get_surface() is not None:
+            background = background.convert()
+        background.fill(self.config.background_color)
+        return background
+
+    def _build_scene_background(self) -> pygame.Surface:
+        """
+        Build the current scene's background, including its static content.
+
+        Returns:
+            pygame.Surface: Surface to blit at the start of each frame
+        """
+        if self._background is None or self._background.get_size() != self.screen.get_size():
+            self._background = self._create_background()
+
+        scene_obj = self.scenes.get(self.current_scene)
+        build_background = getattr(scene_obj, "build_static_background", None)
+        if build_background is not None:
+            self._current_background = build_background(self._background)
+        else:
+            self._current_background = self._background
+        return self._current_background
+
     def change_scene(self, new_scene: GameScene) -> None:
         """
         Request a scene change to occur at the end of the current frame.
@@ -134,9 +234,29 @@ class GameEngine:
             event_type: pygame event type constant (e.g., pygame.KEYDOWN)
             handler_func: Function to call when this event occurs
         """
-        if event_type not in self.event_handlers:
-            self.event_handlers[event_type] = []
-        self.event_handlers[event_type].append(handler_func)
+        handlers = self.event_handlers.setdefault(event_type, [])
+        handlers.append(handler_func)
+        self._handlers_by_type[event_type] = tuple(handlers)
+
+    def attach_event_system(
+        self,
+        event_system: Optional[EventSystem] = None,
+        input_manager: Optional[InputManager] = None,
+    ) -> None:
+        """
+        Feed an event system and/or input manager from the engine's event drain.
+
+        The engine is the only caller of pygame.event.get(); attached systems
+        receive each frame's events after the engine's own handlers run.
+
+        Args:
+            event_system: EventSystem to dispatch pygame events through
+            input_manager: InputManager to update with each frame's events
+        """
+        if event_system is not None:
+            self.event_system = event_system
+        if input_manager is not None:
+            self.input_manager = input_manager
 
     def run(self) -> None:
         """
@@ -151,34 +271,89 @@ class GameEngine:
         self.running = True
         print("GameEngine started - entering main loop")
 
-        while self.running:
-            # Calculate delta time for frame-independent updates
-            current_time = pygame.time.get_ticks()
-            self.delta_time = (current_time - self.last_frame_time) / 1000.0
-            self.last_frame_time = current_time
-
-            # Handle pygame events
-            self._handle_events()
-
-            # Handle scene transitions
-            if self.scene_transition_requested:
-                self._perform_scene_transition()
-
-            # Update current scene
-            self._update_current_scene()
-
-            # Render current scene
-            self._render_current_scene()
+        # Bind everything the loop touches every frame to locals
+        tick = self.clock.tick
+        target_fps = self.config.target_fps
+        background_idle_ms = self.config.background_idle_ms
+        static_wait_ms = self.config.static_wait_ms
+        get_active = pygame.display.get_active
+        wait = pygame.time.wait
+        wait_event = pygame.event.wait
+        get_events = pygame.event.get
+        handle_events = self._handle_events
+        perform_scene_transition = self._perform_scene_transition
+        update_scene = self._update_current_scene
+        render_scene = self._render_current_scene
+
+        frame_count = 0
+        try:
+            while self.running:
+                if (
+                    self._current_animated
+                    or self._redraw_requested
+                    or self.scene_transition_requested
+                ):
+                    # Maintain the target FPS; the returned milliseconds since the
+                    # previous tick are the delta time for frame-independent updates
+                    self.delta_time = tick(target_fps) * MS_TO_SECONDS
+
+                    # Handle pygame events
+                    handle_events()
+                else:
+                    # Static scene: sleep until an event arrives instead of
+                    # redrawing an unchanged frame at the target FPS
+                    event = wait_event(static_wait_ms)
+                    self.delta_time = tick() * MS_TO_SECONDS
+                    if event.type == pygame.NOEVENT:
+                        continue
+                    events = [event]
+                    events.extend(get_events())
+                    handle_events(events)
+
+                # Idle while the window is minimized or hidden: skip scene
+                # updates, and don't count the idle time as frame time. Pending
+                # transitions and redraw requests are still serviced so the
+                # frame is current when the window is shown again.
+                if not get_active():
+                    if self.scene_transition_requested:
+                        perform_scene_transition()
+                    if self._redraw_requested:
+                        render_scene()
+                        self._redraw_requested = False
+                    wait(background_idle_ms)
+                    tick()
+                    continue
+
+                # Handle scene transitions
+                if self.scene_transition_requested:
+                    perform_scene_transition()
+
+                # Update current scene
+                update_scene()
+
+                # Render current scene
+                render_scene()
+                self._redraw_requested = False
+
+                frame_count += 1
+        finally:
+            self.frame_count += frame_count
+
+    def _handle_events(self, events: Optional[List[pygame.event.Event]] = None) -> None:
+        """
+        Handle pygame events and dispatch to registered handlers.
 
-            # Maintain 60 FPS
-            if self.clock:
-                self.clock.tick(self.config.target_fps)
+        Args:
+            events: Events already retrieved this frame; the pygame queue is
+                drained if None
+        """
+        self.frame_events = pygame.event.get() if events is None else events
 
-            self.frame_count += 1
+        # Resolve per-frame lookups once rather than for every event
+        handlers_by_type = self._handlers_by_type
+        scene_handle_event = self._current_handle_event
 
-    def _handle_events(self) -> None:
-        """Handle pygame events and dispatch to registered handlers."""
-        for event in pygame.event.get():
+        for event in self.frame_events:
             # Handle core engine events
             if event.type == pygame.QUIT:
                 self.quit()
@@ -189,16 +364,73 @@ class GameEngine:
                         self.quit()
                     else:
                         self.change_scene(GameScene.MENU)
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.WINDOWSIZECHANGED):
+                # The window contents must be presented again even if the
+                # scene itself hasn't changed
+                self._redraw_requested = True
 
             # Dispatch to registered event handlers
-            if event.type in self.event_handlers:
-                for handler in self.event_handlers[event.type]:
+            handlers = handlers_by_type[event.type]
+            if handlers:
+                for handler in handlers:
                     handler(event)
 
-            # Pass event to current scene if it exists
-            current_scene_obj = self.scenes.get(self.current_scene)
-            if current_scene_obj and hasattr(current_scene_obj, "handle_event"):
-                current_scene_obj.handle_event(event)
+        # Broadcast the same list to attached systems
+        if self.event_system is not None:
+            self.event_system.dispatch(self.frame_events)
+        if self.input_manager is not None:
+            self.input_manager.update(self.frame_events)
+
+        # Pass the coalesced events to the current scene if it exists
+        if scene_handle_event is not None:
+            for event in self._coalesce_scene_events(self.frame_events):
+                scene_handle_event(event)
+
+    @staticmethod
+    def _coalesce_scene_events(
+        events: List[pygame.event.Event],
+    ) -> List[pygame.event.Event]:
+        """
+        Compact a frame's events for scene dispatch.
+
+        Mouse motion is merged into a single event with the final position
+        and the summed relative movement, appended last. Auto-repeated
+        KEYDOWN events for a key that is already down this frame are dropped.
+
+        Args:
+            events: Events retrieved this frame, in order
+
+        Returns:
+            List[pygame.event.Event]: Events for the scene to handle
+        """
+        compact = []
+        last_motion = None
+        rel_x = rel_y = 0
+        keys_down = set()
+
+        for event in events:
+            event_type = event.type
+            if event_type == pygame.MOUSEMOTION:
+                last_motion = event
+                rel_x += event.rel[0]
+                rel_y += event.rel[1]
+                continue
+            if event_type == pygame.KEYDOWN:
+                if event.key in keys_down:
+                    continue
+                keys_down.add(event.key)
+            elif event_type == pygame.KEYUP:
+                keys_down.discard(event.key)
+            compact.append(event)
+
+        if last_motion is not None:
+            if last_motion.rel != (rel_x, rel_y):
+                last_motion = pygame.event.Event(
+                    pygame.MOUSEMOTION, {**last_motion.dict, "rel": (rel_x, rel_y)}
+                )
+            compact.append(last_motion)
+
+        return compact
 
     def _perform_scene_transition(self) -> None:
         """Perform the requested scene transition."""
@@ -206,9 +438,9 @@ class GameEngine:
             return
 
         # Exit current scene
-        current_scene_obj = self.scenes.get(self.current_scene)
-        if current_scene_obj and hasattr(current_scene_obj, "exit"):
-            current_scene_obj.exit()
+        exit_scene = self._scene_exit.get(self.current_scene)
+        if exit_scene is not None:
+            exit_scene()
 
         # Change to new scene
         old_scene = self.current_scene
@@ -220,9 +452,9 @@ class GameEngine:
             return
 
         # Enter new scene
-        new_scene_obj = self.scenes.get(self.current_scene)
-        if new_scene_obj and hasattr(new_scene_obj, "enter"):
-            new_scene_obj.enter()
+        enter_scene = self._scene_enter.get(self.current_scene)
+        if enter_scene is not None:
+            enter_scene()
 
         print(
             f"Scene transition completed: {old_scene.value} -> {self.current_scene.value}"
@@ -234,28 +466,38 @@ class GameEngine:
 
     def _update_current_scene(self) -> None:
         """Update the current scene."""
-        current_scene_obj = self.scenes.get(self.current_scene)
-        if current_scene_obj and hasattr(current_scene_obj, "update"):
-            current_scene_obj.update(self.delta_time)
+        update_scene = self._current_update
+        if update_scene is not None:
+            update_scene(self.delta_time)
 
     def _render_current_scene(self) -> None:
-        """Render the current scene."""
+        """Render the current scene, unless it reports that nothing changed."""
         if not self.screen:
             return
 
-        # Clear screen with background color
-        self.screen.fill(self.config.background_color)
+        tracks_dirty = self._current_tracks_dirty
+        scene = self._current_scene_object
+        if tracks_dirty and not scene.dirty and not self._redraw_requested:
+            return
+
+        # Clear screen with the background and the scene's static content
+        background = self._current_background
+        if background is None:
+            background = self._build_scene_background()
+        self.screen.blit(background, (0, 0))
 
         # Render current scene
-        current_scene_obj = self.scenes.get(self.current_scene)
-        if current_scene_obj and hasattr(current_scene_obj, "render"):
-            current_scene_obj.render(self.screen)
+        render_scene = self._current_render
+        if render_scene is not None:
+            render_scene(self.screen)
         else:
             # Fallback rendering for unregistered scenes
             self._render_fallback_scene()
 
         # Update display
         pygame.display.flip()
+        if tracks_dirty:
+            scene.dirty = False
 
     def _render_fallback_scene(self) -> None:
         """Render a fallback scene when no scene object is registered."""
@@ -263,7 +505,7 @@ class GameEngine:
             return
 
         # Display scene name and basic info
-        font = pygame.font.Font(None, 48)
+        font = get_font(48)
         scene_text = font.render(
             f"{self.current_scene.value.upper()} SCENE", True, (255, 255, 255)
         )
@@ -273,7 +515,7 @@ class GameEngine:
         self.screen.blit(scene_text, scene_rect)
 
         # Display instructions
-        font_small = pygame.font.Font(None, 24)
+        font_small = get_font(24)
         instructions = [
             "Scene not implemented yet",
             "Press ESC to return to menu",
@@ -318,9 +560,9 @@ class GameEngine:
     def cleanup(self) -> None:
         """Clean up resources and quit pygame."""
         # Exit current scene
-        current_scene_obj = self.scenes.get(self.current_scene)
-        if current_scene_obj and hasattr(current_scene_obj, "exit"):
-            current_scene_obj.exit()
+        exit_scene = self._scene_exit.get(self.current_scene)
+        if exit_scene is not None:
+            exit_scene()
 
         # Cleanup pygame
         pygame.quit()
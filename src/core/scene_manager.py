@@ -7,7 +7,9 @@ such as menu, race, and editor states.
 
 import pygame
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional, Tuple
+
+from src.utils.fonts import get_font
 
 
 class Scene(ABC):
@@ -16,8 +18,13 @@ class Scene(ABC):
 
     All scenes (menu, race, editor) should inherit from this class
     and implement the required methods.
+
+    Scenes that don't change without input should leave is_animated False;
+    the engine then only updates and redraws them when events arrive.
     """
 
+    is_animated = False
+
     def __init__(self, name: str) -> None:
         """
         Initialize the scene.
@@ -27,6 +34,13 @@ class Scene(ABC):
         """
         self.name = name
         self.active = False
+        # Whether the scene needs redrawing; the engine clears it after
+        # each render and skips rendering while it stays False
+        self.dirty = True
+
+        # Pre-rendered text that never changes, laid out for _static_text_size
+        self._static_text: List[Tuple[pygame.Surface, pygame.Rect]] = []
+        self._static_text_size: Optional[Tuple[int, int]] = None
 
     def enter(self) -> None:
         """
@@ -36,6 +50,7 @@ class Scene(ABC):
         load resources, or set up scene-specific state.
         """
         self.active = True
+        self.dirty = True
         print(f"Entering scene: {self.name}")
 
     def exit(self) -> None:
@@ -77,6 +92,108 @@ class Scene(ABC):
         """
         pass
 
+    def _render_static_text(
+        self, width: int, height: int
+    ) -> List[Tuple[pygame.Surface, pygame.Rect]]:
+        """
+        Render the scene's unchanging text for a given screen size.
+
+        Override this to return (surface, rect) pairs; it only runs again
+        when the screen size changes.
+
+        Args:
+            width: Screen width in pixels
+            height: Screen height in pixels
+
+        Returns:
+            List of (surface, destination rect) pairs
+        """
+        return []
+
+    def build_static_background(self, base: pygame.Surface) -> pygame.Surface:
+        """
+        Bake the scene's static text into a copy of a background surface.
+
+        Once baked, render() skips the static text on screens of the same
+        size, so each frame is a single background blit plus dynamic content.
+
+        Args:
+            base: Background surface sized like the screen
+
+        Returns:
+            pygame.Surface: Background to blit at the start of each frame
+        """
+        size = base.get_size()
+        static_text = self._render_static_text(*size)
+
+        # Nothing static left to draw for this size
+        self._static_text = []
+        self._static_text_size = size
+
+        if not static_text:
+            return base
+        background = base.copy()
+        background.blits(static_text, doreturn=False)
+        return background
+
+    def _blit_static_text(self, screen: pygame.Surface) -> None:
+        """
+        Blit the cached static text, rendering it first if needed.
+
+        Args:
+            screen: Pygame surface to render to
+        """
+        size = screen.get_size()
+        if size != self._static_text_size:
+            self._static_text = self._render_static_text(*size)
+            self._static_text_size = size
+        screen.blits(self._static_text, doreturn=False)
+
+
+class PlaceholderScene(Scene):
+    """
+    Scene that shows a title and a few instruction lines.
+
+    Used for scenes whose real implementation is still to come.
+    """
+
+    def __init__(self, name: str, title: str, instructions: List[str]) -> None:
+        """
+        Initialize the placeholder scene.
+
+        Args:
+            name: Human-readable name for this scene
+            title: Large heading text
+            instructions: Lines shown below the heading
+        """
+        super().__init__(name)
+        self.title = title
+        self.instructions = instructions
+
+    def update(self, delta_time: float) -> None:
+        """Update scene logic."""
+        pass
+
+    def render(self, screen: pygame.Surface) -> None:
+        """Render the placeholder text."""
+        self._blit_static_text(screen)
+
+    def _render_static_text(
+        self, width: int, height: int
+    ) -> List[Tuple[pygame.Surface, pygame.Rect]]:
+        """Render the title and instruction lines."""
+        font = get_font(48)
+        text = font.render(self.title, True, (255, 255, 255))
+        static_text = [(text, text.get_rect(center=(width // 2, height // 2 - 50)))]
+
+        font_small = get_font(24)
+        for i, instruction in enumerate(self.instructions):
+            text = font_small.render(instruction, True, (200, 200, 200))
+            text_rect = text.get_rect(center=(width // 2, height // 2 + 20 + i * 30))
+            static_text.append((text, text_rect))
+
+        return static_text
+
 
 class MenuScene(Scene):
     """
@@ -90,6 +207,8 @@ class MenuScene(Scene):
         super().__init__("Menu")
         self.menu_items = ["Start Race", "Track Editor", "Settings", "Quit"]
         self.selected_item = 0
+        # (normal, selected, rect) per menu item, built with the static text
+        self._item_surfaces: List[Tuple[pygame.Surface, pygame.Surface, pygame.Rect]] = []
 
     def update(self, delta_time: float) -> None:
         """Update menu logic."""
@@ -97,40 +216,51 @@ class MenuScene(Scene):
 
     def render(self, screen: pygame.Surface) -> None:
         """Render the menu scene."""
-        # Get screen dimensions
-        width, height = screen.get_size()
+        # Title and instructions are pre-rendered
+        self._blit_static_text(screen)
+
+        # Menu items are pre-rendered in both colors; only the choice varies
+        for i, (normal, selected, rect) in enumerate(self._item_surfaces):
+            screen.blit(selected if i == self.selected_item else normal, rect)
 
+    def _render_static_text(
+        self, width: int, height: int
+    ) -> List[Tuple[pygame.Surface, pygame.Rect]]:
+        """Render the title, instructions and both states of each menu item."""
         # Render title
-        font_title = pygame.font.Font(None, 72)
+        font_title = get_font(72)
         title_text = font_title.render("RETRO RACING", True, (255, 255, 255))
         title_rect = title_text.get_rect(center=(width // 2, height // 4))
-        screen.blit(title_text, title_rect)
 
         # Render menu items
-        font_menu = pygame.font.Font(None, 36)
+        font_menu = get_font(36)
         start_y = height // 2
+        self._item_surfaces = []
 
         for i, item in enumerate(self.menu_items):
-            color = (255, 255, 0) if i == self.selected_item else (200, 200, 200)
-            text = font_menu.render(item, True, color)
-            text_rect = text.get_rect(center=(width // 2, start_y + i * 50))
-            screen.blit(text, text_rect)
+            normal = font_menu.render(item, True, (200, 200, 200))
+            selected = font_menu.render(item, True, (255, 255, 0))
+            text_rect = normal.get_rect(center=(width // 2, start_y + i * 50))
+            self._item_surfaces.append((normal, selected, text_rect))
 
         # Render instructions
-        font_small = pygame.font.Font(None, 24)
+        font_small = get_font(24)
         instructions = font_small.render(
             "Use UP/DOWN arrows to navigate, ENTER to select", True, (150, 150, 150)
         )
         inst_rect = instructions.get_rect(center=(width // 2, height - 50))
-        screen.blit(instructions, inst_rect)
+
+        return [(title_text, title_rect), (instructions, inst_rect)]
 
     def handle_event(self, event: pygame.event.Event) -> None:
         """Handle menu-specific events."""
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_UP:
                 self.selected_item = (self.selected_item - 1) % len(self.menu_items)
+                self.dirty = True
             elif event.key == pygame.K_DOWN:
                 self.selected_item = (self.selected_item + 1) % len(self.menu_items)
+                self.dirty = True
             elif event.key == pygame.K_RETURN:
                 self._handle_menu_selection()
 
@@ -141,7 +271,7 @@ class MenuScene(Scene):
         # Menu actions will be implemented in future tasks
 
 
-class RaceScene(Scene):
+class RaceScene(PlaceholderScene):
     """
     Basic race scene implementation.
 
@@ -149,37 +279,24 @@ class RaceScene(Scene):
     in future tasks with proper racing functionality.
     """
 
+    is_animated = True
+
     def __init__(self) -> None:
-        super().__init__("Race")
+        super().__init__(
+            "Race",
+            "RACE SCENE",
+            [
+                "Race implementation coming soon...",
+                "Press ESC to return to menu",
+            ],
+        )
 
     def update(self, delta_time: float) -> None:
-        """Update race logic."""
-        pass
-
-    def render(self, screen: pygame.Surface) -> None:
-        """Render the race scene."""
-        width, height = screen.get_size()
+        """Update race logic; the race changes every frame."""
+        self.dirty = True
 
-        # Render race placeholder
-        font = pygame.font.Font(None, 48)
-        text = font.render("RACE SCENE", True, (255, 255, 255))
-        text_rect = text.get_rect(center=(width // 2, height // 2 - 50))
-        screen.blit(text, text_rect)
 
-        # Render instructions
-        font_small = pygame.font.Font(None, 24)
-        instructions = [
-            "Race implementation coming soon...",
-            "Press ESC to return to menu",
-        ]
-
-        for i, instruction in enumerate(instructions):
-            text = font_small.render(instruction, True, (200, 200, 200))
-            text_rect = text.get_rect(center=(width // 2, height // 2 + 20 + i * 30))
-            screen.blit(text, text_rect)
-
-
-class EditorScene(Scene):
+class EditorScene(PlaceholderScene):
     """
     Basic editor scene implementation.
 
@@ -188,36 +305,17 @@ class EditorScene(Scene):
     """
 
     def __init__(self) -> None:
-        super().__init__("Editor")
-
-    def update(self, delta_time: float) -> None:
-        """Update editor logic."""
-        pass
-
-    def render(self, screen: pygame.Surface) -> None:
-        """Render the editor scene."""
-        width, height = screen.get_size()
-
-        # Render editor placeholder
-        font = pygame.font.Font(None, 48)
-        text = font.render("TRACK EDITOR", True, (255, 255, 255))
-        text_rect = text.get_rect(center=(width // 2, height // 2 - 50))
-        screen.blit(text, text_rect)
-
-        # Render instructions
-        font_small = pygame.font.Font(None, 24)
-        instructions = [
-            "Track editor implementation coming soon...",
-            "Press ESC to return to menu",
-        ]
-
-        for i, instruction in enumerate(instructions):
-            text = font_small.render(instruction, True, (200, 200, 200))
-            text_rect = text.get_rect(center=(width // 2, height // 2 + 20 + i * 30))
-            screen.blit(text, text_rect)
+        super().__init__(
+            "Editor",
+            "TRACK EDITOR",
+            [
+                "Track editor implementation coming soon...",
+                "Press ESC to return to menu",
+            ],
+        )
 
 
-class SettingsScene(Scene):
+class SettingsScene(PlaceholderScene):
     """
     Basic settings scene implementation.
 
@@ -225,30 +323,11 @@ class SettingsScene(Scene):
     """
 
     def __init__(self) -> None:
-        super().__init__("Settings")
-
-    def update(self, delta_time: float) -> None:
-        """Update settings logic."""
-        pass
-
-    def render(self, screen: pygame.Surface) -> None:
-        """Render the settings scene."""
-        width, height = screen.get_size()
-
-        # Render settings placeholder
-        font = pygame.font.Font(None, 48)
-        text = font.render("SETTINGS", True, (255, 255, 255))
-        text_rect = text.get_rect(center=(width // 2, height // 2 - 50))
-        screen.blit(text, text_rect)
-
-        # Render instructions
-        font_small = pygame.font.Font(None, 24)
-        instructions = [
-            "Settings implementation coming soon...",
-            "Press ESC to return to menu",
-        ]
-
-        for i, instruction in enumerate(instructions):
-            text = font_small.render(instruction, True, (200, 200, 200))
-            text_rect = text.get_rect(center=(width // 2, height // 2 + 20 + i * 30))
-            screen.blit(text, text_rect)
+        super().__init__(
+            "Settings",
+            "SETTINGS",
+            [
+                "Settings implementation coming soon...",
+                "Press ESC to return to menu",
+            ],
+        )
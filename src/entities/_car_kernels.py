@@ -0,0 +1,96 @@
+"""
+Array kernels for CarFleet.
+
+Each kernel works in place on fleet columns (already sliced to the number
+of cars) so a frame's update allocates no temporary arrays.
+"""
+
+import numpy as np
+
+
+def update_metrics(pos_x: np.ndarray, pos_y: np.ndarray,
+                   last_x: np.ndarray, last_y: np.ndarray,
+                   vel_x: np.ndarray, vel_y: np.ndarray,
+                   speed: np.ndarray, top_speed: np.ndarray,
+                   distance_traveled: np.ndarray, scratch: np.ndarray) -> None:
+    """
+    Accumulate distance and top speed for every car, in place.
+    
+    Args:
+        pos_x: Current x positions
+        pos_y: Current y positions
+        last_x: Previous x positions; replaced with pos_x
+        last_y: Previous y positions; replaced with pos_y
+        vel_x: Current x velocities
+        vel_y: Current y velocities
+        speed: Output speed magnitudes
+        top_speed: Highest speed per car; raised to speed where exceeded
+        distance_traveled: Distance per car; incremented by this frame's motion
+        scratch: Work buffer the same length as the other columns
+    """
+    # Displacement since last frame, computed in the last-position buffers
+    np.subtract(pos_x, last_x, out=last_x)
+    np.subtract(pos_y, last_y, out=last_y)
+    np.hypot(last_x, last_y, out=scratch)
+    np.add(distance_traveled, scratch, out=distance_traveled)
+    
+    np.hypot(vel_x, vel_y, out=speed)
+    np.maximum(top_speed, speed, out=top_speed)
+    
+    np.copyto(last_x, pos_x)
+    np.copyto(last_y, pos_y)
+
+
+def update_respawn(is_crashed: np.ndarray, respawn_timer: np.ndarray, dt: float) -> np.ndarray:
+    """
+    Count down respawn timers and clear the crash flag of cars that are done.
+    
+    Args:
+        is_crashed: Crash flag per car; cleared in place for respawned cars
+        respawn_timer: Seconds left per car; decremented for crashed cars and
+            clamped at zero
+        dt: Delta time in seconds
+        
+    Returns:
+        Indices of the cars that respawned this frame
+    """
+    np.subtract(respawn_timer, dt, out=respawn_timer, where=is_crashed)
+    respawned = is_crashed & (respawn_timer <= 0.0)
+    np.logical_xor(is_crashed, respawned, out=is_crashed)
+    np.maximum(respawn_timer, 0.0, out=respawn_timer)
+    return np.flatnonzero(respawned)
+
+
+def update_slip(angle: np.ndarray, vel_x: np.ndarray, vel_y: np.ndarray,
+                forward_speed: np.ndarray, lateral_speed: np.ndarray,
+                is_sliding: np.ndarray, threshold: float,
+                cos_scratch: np.ndarray, sin_scratch: np.ndarray) -> None:
+    """
+    Split every car's velocity into forward and lateral speed, in place.
+    
+    Args:
+        angle: Body angles in radians
+        vel_x: Current x velocities
+        vel_y: Current y velocities
+        forward_speed: Output speed along each car's heading
+        lateral_speed: Output speed to each car's right
+        is_sliding: Output flag, set where |lateral_speed| exceeds threshold
+        threshold: Lateral speed above which a car counts as sliding
+        cos_scratch: Work buffer the same length as the other columns
+        sin_scratch: Work buffer the same length as the other columns
+    """
+    np.cos(angle, out=cos_scratch)
+    np.sin(angle, out=sin_scratch)
+    
+    # forward = v . (cos, sin), using lateral_speed as a temporary
+    np.multiply(vel_x, cos_scratch, out=forward_speed)
+    np.multiply(vel_y, sin_scratch, out=lateral_speed)
+    np.add(forward_speed, lateral_speed, out=forward_speed)
+    
+    # lateral = v . (-sin, cos)
+    np.multiply(vel_y, cos_scratch, out=lateral_speed)
+    np.multiply(vel_x, sin_scratch, out=sin_scratch)
+    np.subtract(lateral_speed, sin_scratch, out=lateral_speed)
+    
+    np.abs(lateral_speed, out=cos_scratch)
+    np.greater(cos_scratch, threshold, out=is_sliding)
@@ -6,16 +6,30 @@ with rendering capabilities and game state management for the retro racing game.
 """
 
 from dataclasses import dataclass
-from typing import Optional, Tuple, Dict, Any, Callable
+from types import MappingProxyType
+from typing import Optional, Tuple, Dict, Any, Callable, Mapping
 import pygame
 import pymunk
 import math
+import zlib
 
+from src.entities.car_fleet import CarFleet
 from src.physics.car_physics import CarBody, CarPhysicsConfig, CarPhysicsPresets
 from src.rendering.black_mamba_renderer import BlackMambaRenderer
 
 
-@dataclass
+# Gray tones cycled through for AI cars
+AI_CAR_COLORS = (
+    (120, 120, 120),  # Light gray
+    (80, 80, 80),     # Medium gray
+    (60, 60, 60),     # Dark gray
+)
+
+# Impulse assumed when collision info doesn't carry one
+_NO_IMPULSE = pymunk.Vec2d(0, 0)
+
+
+@dataclass(slots=True)
 class CarState:
     """Car game state information."""
     
@@ -39,6 +53,29 @@ class CarState:
     respawn_timer: float = 0.0
 
 
+@dataclass(slots=True)
+class CarInfoView:
+    """
+    Preallocated snapshot of the car values shown on the HUD.
+    
+    Updated in place by the owning Car so per-frame UI code can read
+    attributes instead of building a get_car_info() dictionary.
+    """
+    
+    position: Tuple[float, float] = (0.0, 0.0)
+    angle_degrees: float = 0.0
+    speed: float = 0.0
+    forward_speed: float = 0.0
+    lateral_speed: float = 0.0
+    is_sliding: bool = False
+    throttle: float = 0.0
+    steering: float = 0.0
+    brake: float = 0.0
+    physics_model: str = 'arcade'
+    top_speed: float = 0.0
+    distance_traveled: float = 0.0
+
+
 class Car:
     """
     Main car entity integrating physics body with game logic.
@@ -47,6 +84,13 @@ class Car:
     and game-specific functionality like lap tracking and collision handling.
     """
     
+    __slots__ = ('state', 'physics_body', '_car_color', '_crash_color',
+                 '_last_render_position', '_last_render_angle',
+                 'throttle_input', 'steering_input', 'brake_input',
+                 'collision_callback', 'crash_threshold', '_last_x', '_last_y',
+                 '_physics_model_name', '_frame_count', '_angle_rad', '_angle_deg',
+                 '_fleet', '_fleet_index', '_info_view', '_info_cache')
+    
     def __init__(self,
                  car_id: str,
                  physics_space: pymunk.Space,
@@ -54,7 +98,9 @@ class Car:
                  angle: float = 0.0,
                  is_player: bool = False,
                  physics_config: Optional[CarPhysicsConfig] = None,
-                 car_color: Optional[Tuple[int, int, int]] = None):
+                 car_color: Optional[Tuple[int, int, int]] = None,
+                 fleet: Optional[CarFleet] = None,
+                 spawn_index: Optional[int] = None):
         """
         Initialize car entity.
         
@@ -66,6 +112,10 @@ class Car:
             is_player: Whether this is the player's car
             physics_config: Physics configuration (uses arcade preset if None)
             car_color: RGB color for rendering (auto-assigned if None)
+            fleet: Fleet to register with; fleet cars are advanced by
+                CarFleet.update_all() instead of update()
+            spawn_index: Grid slot picking the default AI color (derived
+                from car_id if None)
         """
         # Initialize car state
         self.state = CarState(car_id=car_id, is_player=is_player)
@@ -73,12 +123,14 @@ class Car:
         # Initialize physics body
         config = physics_config or CarPhysicsPresets.arcade()
         self.physics_body = CarBody(physics_space, position, angle, config)
+        self._physics_model_name = config.model
         
-        # Set up collision callback
-        self.physics_body.set_collision_callback(self._handle_collision)
+        # Set up collision callback; fleet cars are handled by the fleet
+        if fleet is None:
+            self.physics_body.set_collision_callback(self._handle_collision)
         
         # Rendering properties
-        self.car_color = car_color or self._get_default_color()
+        self.car_color = car_color or self._get_default_color(spawn_index)
         self._last_render_position = position
         self._last_render_angle = angle
         
@@ -92,23 +144,47 @@ class Car:
         self.crash_threshold: float = 300.0  # Impact force threshold for crashes
         
         # Performance tracking
-        self._last_position = pymunk.Vec2d(*position)
+        self._last_x, self._last_y = float(position[0]), float(position[1])
         self._frame_count = 0
+        
+        # Body angle last converted by get_angle_degrees() and its result
+        self._angle_rad: Optional[float] = None
+        self._angle_deg = 0.0
+        
+        # Fleet column holding this car's per-frame metrics (-1 if standalone)
+        self._fleet = fleet
+        self._fleet_index = fleet.add(self, position) if fleet is not None else -1
+        
+        # HUD snapshot, refreshed in place every update
+        self._info_view = CarInfoView()
+        # get_car_info() result, rebuilt on the first call after a change
+        self._info_cache: Optional[Mapping[str, Any]] = None
+        self.refresh_info_view()
+    
+    @property
+    def car_color(self) -> Tuple[int, int, int]:
+        """RGB color the car is drawn in."""
+        return self._car_color
     
-    def _get_default_color(self) -> Tuple[int, int, int]:
-        """Get default color based on car type."""
+    @car_color.setter
+    def car_color(self, color: Tuple[int, int, int]) -> None:
+        self._car_color = color
+        # Darker variant drawn while crashed
+        self._crash_color = tuple(max(0, c - 50) for c in color)
+    
+    def _get_default_color(self, spawn_index: Optional[int] = None) -> Tuple[int, int, int]:
+        """
+        Get default color based on car type.
+        
+        Args:
+            spawn_index: Grid slot for AI cars; if None, a CRC of car_id is
+                used so the same ID gets the same color in every run
+        """
         if self.state.is_player:
             return (220, 50, 50)  # Red for player
-        else:
-            # Cycle through gray tones for AI cars
-            colors = [
-                (120, 120, 120),  # Light gray
-                (80, 80, 80),     # Medium gray
-                (60, 60, 60),     # Dark gray
-            ]
-            # Use car_id hash to pick consistent color
-            color_index = hash(self.state.car_id) % len(colors)
-            return colors[color_index]
+        if spawn_index is None:
+            spawn_index = zlib.crc32(self.state.car_id.encode())
+        return AI_CAR_COLORS[spawn_index % len(AI_CAR_COLORS)]
     
     def _handle_collision(self, collision_info: Dict[str, Any]) -> None:
         """
@@ -118,13 +194,14 @@ class Car:
             collision_info: Collision information from CarBody
         """
         # Calculate impact force magnitude
-        impulse = collision_info.get('impulse', pymunk.Vec2d(0, 0))
+        impulse = collision_info.get('impulse', _NO_IMPULSE)
         impact_force = impulse.length
         
         # Check for crash conditions
+        self._info_cache = None
         if impact_force > self.crash_threshold:
             self.state.is_crashed = True
-            self.state.respawn_timer = 2.0  # 2 second respawn delay
+            self.state.respawn_timer = CarFleet.RESPAWN_DELAY
         
         # Call external collision callback if set
         if self.collision_callback:
@@ -149,12 +226,43 @@ class Car:
             brake: Brake input (0.0 to 1.0, no brake to full brake)
         """
         # Clamp inputs to valid ranges
-        self.throttle_input = max(-1.0, min(1.0, throttle))
-        self.steering_input = max(-1.0, min(1.0, steering))
-        self.brake_input = max(0.0, min(1.0, brake))
+        throttle = max(-1.0, min(1.0, throttle))
+        steering = max(-1.0, min(1.0, steering))
+        brake = max(0.0, min(1.0, brake))
+        self._set_clamped_controls(throttle, steering, brake)
+        
+        # Keep the fleet's control columns in step (bulk controls fill them directly)
+        fleet = self._fleet
+        if fleet is not None:
+            index = self._fleet_index
+            fleet.throttle[index] = throttle
+            fleet.steering[index] = steering
+            fleet.brake[index] = brake
+    
+    def _set_clamped_controls(self, throttle: float, steering: float, brake: float) -> None:
+        """
+        Store control inputs that are already within their valid ranges.
+        
+        Args:
+            throttle: Throttle input (-1.0 to 1.0)
+            steering: Steering input (-1.0 to 1.0)
+            brake: Brake input (0.0 to 1.0)
+        """
+        self.throttle_input = throttle
+        self.steering_input = steering
+        self.brake_input = brake
         
         # Apply to physics body
-        self.physics_body.apply_controls(self.throttle_input, self.steering_input, self.brake_input)
+        car_body = self.physics_body
+        car_body.throttle = throttle
+        car_body.steering = steering
+        car_body.brake = brake
+        
+        view = self._info_view
+        view.throttle = throttle
+        view.steering = steering
+        view.brake = brake
+        self._info_cache = None
     
     def update(self, dt: float) -> None:
         """
@@ -184,43 +292,89 @@ class Car:
         self.state.lap_time += dt
         
         self._frame_count += 1
+        self.refresh_info_view()
     
     def _update_performance_metrics(self, dt: float) -> None:
         """Update performance tracking metrics."""
-        current_position = pymunk.Vec2d(*self.get_position())
+        position = self.physics_body.body.position
+        x, y = position.x, position.y
         
         # Update distance traveled
-        distance_delta = current_position.get_distance(self._last_position)
-        self.state.distance_traveled += distance_delta
-        self._last_position = current_position
+        self.state.distance_traveled += math.hypot(x - self._last_x, y - self._last_y)
+        self._last_x, self._last_y = x, y
         
         # Update top speed
         current_speed = self.get_speed()
         if current_speed > self.state.top_speed:
             self.state.top_speed = current_speed
     
-    def render(self, renderer: BlackMambaRenderer) -> None:
+    def refresh_info_view(self) -> None:
+        """
+        Update the preallocated HUD snapshot in place.
+        
+        update() already does this; call it again after stepping the physics
+        space so the snapshot matches the positions that get rendered.
+        """
+        self._info_cache = None
+        body = self.physics_body.body
+        view = self._info_view
+        car_body = self.physics_body
+        view.position = (body.position.x, body.position.y)
+        view.angle_degrees = self.get_angle_degrees()
+        view.speed = self.physics_body.get_speed()
+        view.forward_speed = self.physics_body.get_forward_speed()
+        view.lateral_speed = self.physics_body.get_lateral_speed()
+        view.is_sliding = self.is_sliding()
+        view.throttle = car_body.throttle
+        view.steering = car_body.steering
+        view.brake = car_body.brake
+        view.physics_model = self._physics_model_name
+        view.top_speed = self.state.top_speed
+        view.distance_traveled = self.state.distance_traveled
+    
+    def get_info_view(self) -> CarInfoView:
+        """
+        Get the HUD snapshot of this car, as of the last update.
+        
+        This is the cached path for per-frame UI. The same object is returned
+        every call and updated in place, so callers should read it rather
+        than keep references to its values; use get_car_info() for an
+        independent copy of the live state.
+        
+        Returns:
+            CarInfoView with current display values
+        """
+        return self._info_view
+    
+    def render(self, renderer: BlackMambaRenderer,
+               camera: Optional[Tuple[float, float]] = None) -> None:
         """
         Render the car using the Black Mamba renderer.
         
         Args:
             renderer: BlackMambaRenderer instance
+            camera: Camera offset (defaults to the renderer's camera)
         """
-        if self.state.is_crashed:
-            # Render crashed car with different visual (darker, maybe spinning)
-            crash_color = tuple(max(0, c - 50) for c in self.car_color)
-            renderer.draw_car(self.get_position(), self.get_angle_degrees(), crash_color)
-        else:
-            # Normal rendering
-            renderer.draw_car(self.get_position(), self.get_angle_degrees(), self.car_color)
+        position = self.get_position()
+        angle_degrees = self.get_angle_degrees()
+        
+        # Crashed cars are drawn darker
+        color = self._crash_color if self.state.is_crashed else self._car_color
+        renderer.draw_car(position, angle_degrees, color, camera)
         
         # Update render tracking
-        self._last_render_position = self.get_position()
-        self._last_render_angle = self.get_angle_degrees()
+        self._last_render_position = position
+        self._last_render_angle = angle_degrees
     
     def get_position(self) -> Tuple[float, float]:
         """Get current car position."""
-        return tuple(self.physics_body.body.position)
+        position = self.physics_body.body.position
+        return (position.x, position.y)
+    
+    @property
+    def physics_model(self) -> str:
+        """Name of the car's current physics model (e.g. 'arcade')."""
+        return self._physics_model_name
     
     def get_angle_radians(self) -> float:
         """Get current car angle in radians."""
@@ -228,11 +382,16 @@ class Car:
     
     def get_angle_degrees(self) -> float:
         """Get current car angle in degrees."""
-        return math.degrees(self.physics_body.body.angle)
+        angle = self.physics_body.body.angle
+        if angle != self._angle_rad:
+            self._angle_deg = math.degrees(angle)
+            self._angle_rad = angle
+        return self._angle_deg
     
     def get_velocity(self) -> Tuple[float, float]:
         """Get current velocity vector."""
-        return tuple(self.physics_body.body.velocity)
+        velocity = self.physics_body.body.velocity
+        return (velocity.x, velocity.y)
     
     def get_speed(self) -> float:
         """Get current speed in pixels per second."""
@@ -246,9 +405,25 @@ class Car:
         """Get lateral (sideways) speed."""
         return self.physics_body.get_lateral_speed()
     
-    def is_sliding(self, threshold: float = 50.0) -> bool:
-        """Check if the car is sliding."""
-        return self.physics_body.is_sliding(threshold)
+    def is_sliding(self, threshold: float = CarFleet.SLIDING_THRESHOLD) -> bool:
+        """
+        Check if the car is sliding.
+        
+        Fleet cars answer from the fleet's lateral speed column, as of the
+        last CarFleet.update_all().
+        
+        Args:
+            threshold: Lateral speed threshold for sliding detection
+            
+        Returns:
+            True if car is sliding
+        """
+        fleet = self._fleet
+        if fleet is None:
+            return self.physics_body.is_sliding(threshold)
+        if threshold == CarFleet.SLIDING_THRESHOLD:
+            return bool(fleet.is_sliding[self._fleet_index])
+        return bool(abs(fleet.lateral_speed[self._fleet_index]) > threshold)
     
     def reset_position(self, position: Tuple[float, float], angle: float = 0.0) -> None:
         """
@@ -263,7 +438,10 @@ class Car:
         # Reset state
         self.state.is_crashed = False
         self.state.respawn_timer = 0.0
-        self._last_position = pymunk.Vec2d(*position)
+        self._last_x, self._last_y = float(position[0]), float(position[1])
+        if self._fleet is not None:
+            self._fleet.reset(self._fleet_index, position)
+        self.refresh_info_view()
     
     def complete_lap(self, lap_time: float) -> None:
         """
@@ -280,6 +458,7 @@ class Car:
         
         # Reset lap timer
         self.state.lap_time = 0.0
+        self._info_cache = None
     
     def finish_race(self, final_position: int) -> None:
         """
@@ -290,6 +469,9 @@ class Car:
         """
         self.state.is_finished = True
         self.state.position_in_race = final_position
+        self._info_cache = None
+        if self._fleet is not None:
+            self._fleet.is_finished[self._fleet_index] = True
     
     def switch_physics_model(self, model: str) -> None:
         """
@@ -306,40 +488,53 @@ class Car:
             raise ValueError(f"Invalid physics model: {model}")
         
         self.physics_body.switch_physics_config(config)
+        self._physics_model_name = model
+        self.refresh_info_view()
     
-    def get_car_info(self) -> Dict[str, Any]:
+    def get_car_info(self) -> Mapping[str, Any]:
         """
         Get comprehensive car information for debugging and UI.
         
+        The read-only mapping is built once and reused until the car changes
+        through update() (or CarFleet.update_all()), its controls, a
+        collision, a lap or a reset. A change builds a new mapping, so results
+        already handed out keep their values. Per-frame UI code can read
+        get_info_view() instead, which is refreshed in place by each update.
+        
         Returns:
-            Dictionary with car state and physics information
+            Read-only mapping with car state and physics information
         """
-        physics_info = self.physics_body.get_physics_info()
+        if self._info_cache is not None:
+            return self._info_cache
+        
+        state = self.state
+        car_body = self.physics_body
+        position = car_body.body.position
         
-        return {
+        self._info_cache = MappingProxyType({
             # Car identity and state
-            'car_id': self.state.car_id,
-            'is_player': self.state.is_player,
-            'is_crashed': self.state.is_crashed,
-            'is_finished': self.state.is_finished,
+            'car_id': state.car_id,
+            'is_player': state.is_player,
+            'is_crashed': state.is_crashed,
+            'is_finished': state.is_finished,
             
             # Race information
-            'current_lap': self.state.current_lap,
-            'lap_time': self.state.lap_time,
-            'best_lap_time': self.state.best_lap_time,
-            'position_in_race': self.state.position_in_race,
+            'current_lap': state.current_lap,
+            'lap_time': state.lap_time,
+            'best_lap_time': state.best_lap_time,
+            'position_in_race': state.position_in_race,
             
             # Performance metrics
-            'top_speed': self.state.top_speed,
-            'distance_traveled': self.state.distance_traveled,
+            'top_speed': state.top_speed,
+            'distance_traveled': state.distance_traveled,
             
             # Current physics state
-            'position': physics_info['position'],
-            'angle_degrees': math.degrees(physics_info['angle']),
-            'speed': physics_info['speed'],
-            'forward_speed': physics_info['forward_speed'],
-            'lateral_speed': physics_info['lateral_speed'],
-            'is_sliding': physics_info['is_sliding'],
+            'position': (position.x, position.y),
+            'angle_degrees': self.get_angle_degrees(),
+            'speed': car_body.get_speed(),
+            'forward_speed': car_body.get_forward_speed(),
+            'lateral_speed': car_body.get_lateral_speed(),
+            'is_sliding': self.is_sliding(),
             
             # Control inputs
             'throttle': self.throttle_input,
@@ -347,9 +542,10 @@ class Car:
             'brake': self.brake_input,
             
             # Physics configuration
-            'physics_model': 'arcade' if physics_info['friction'] > 0.8 else 'realistic',
-            'mass': physics_info['mass']
-        }
+            'physics_model': self._physics_model_name,
+            'mass': car_body.body.mass
+        })
+        return self._info_cache
     
     def cleanup(self) -> None:
         """Clean up car resources."""
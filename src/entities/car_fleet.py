@@ -0,0 +1,410 @@
+"""
+Structure-of-arrays storage for the per-frame bookkeeping of many cars.
+
+Cars registered with a CarFleet keep their physics bodies and game state,
+but distance, top speed and crash/respawn tracking live in parallel NumPy
+columns that are updated for the whole fleet in one vectorized pass.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+import numpy as np
+import pymunk
+
+from src.entities._car_kernels import update_metrics, update_respawn, update_slip
+
+if TYPE_CHECKING:
+    from src.entities.car import Car
+
+
+class CarFleet:
+    """
+    Parallel per-car arrays updated together each frame.
+    
+    Column i belongs to the car whose fleet index is i. Cars are added with
+    add() (done by Car when constructed with a fleet) and the whole fleet is
+    advanced with update_all() instead of calling Car.update() per car.
+    
+    The fleet also handles collisions for its cars: one pymunk handler per
+    collision pair, shared by every fleet in the space, marks crashes
+    directly in the arrays, and per-car collision callbacks are deferred to
+    the next update_all().
+    """
+    
+    # Seconds a crashed car waits before respawning
+    RESPAWN_DELAY = 2.0
+    
+    # Level of detail by distance from the focus point (usually the player):
+    # cars beyond NEAR_DISTANCE recompute their throttle and steering forces
+    # every MID_INTERVAL frames, beyond FAR_DISTANCE every FAR_INTERVAL frames
+    NEAR_DISTANCE = 800.0
+    FAR_DISTANCE = 2000.0
+    MID_INTERVAL = 3
+    FAR_INTERVAL = 10
+    
+    # Lateral speed above which a car counts as sliding
+    SLIDING_THRESHOLD = 50.0
+    
+    # Collision types set on car and track boundary shapes by CarBody
+    CAR_COLLISION_TYPE = 1
+    BOUNDARY_COLLISION_TYPE = 2
+    
+    _COLUMNS = ('pos_x', 'pos_y', 'last_x', 'last_y', 'vel_x', 'vel_y', 'angle', 'speed',
+                'forward_speed', 'lateral_speed', 'distance_traveled', 'top_speed',
+                'respawn_timer', '_scratch', '_scratch2', 'throttle', 'steering', 'brake',
+                'drive_force', 'drive_torque', 'drive_throttle', 'drive_steering',
+                'is_crashed', 'is_finished', 'is_sliding')
+    
+    def __init__(self, capacity: int = 16):
+        """
+        Initialize an empty fleet.
+        
+        Args:
+            capacity: Initial number of car slots; grows as needed
+        """
+        self.cars: List['Car'] = []
+        self._frame = 0
+        
+        # Collision lookup and per-car callbacks waiting for update_all()
+        self._space: Optional[pymunk.Space] = None
+        self._body_to_index: Dict[pymunk.Body, int] = {}
+        self._pending_collisions: List[Tuple[int, Dict[str, Any]]] = []
+        
+        self.pos_x = np.zeros(capacity)
+        self.pos_y = np.zeros(capacity)
+        self.last_x = np.zeros(capacity)
+        self.last_y = np.zeros(capacity)
+        self.vel_x = np.zeros(capacity)
+        self.vel_y = np.zeros(capacity)
+        self.angle = np.zeros(capacity)
+        self.speed = np.zeros(capacity)
+        self.forward_speed = np.zeros(capacity)
+        self.lateral_speed = np.zeros(capacity)
+        self.distance_traveled = np.zeros(capacity)
+        self.top_speed = np.zeros(capacity)
+        self.respawn_timer = np.zeros(capacity)
+        self._scratch = np.zeros(capacity)
+        self._scratch2 = np.zeros(capacity)
+        self.throttle = np.zeros(capacity)
+        self.steering = np.zeros(capacity)
+        self.brake = np.zeros(capacity)
+        # Forward driving force and steering torque last computed for each
+        # car, reapplied every frame between level-of-detail recomputations,
+        # and the throttle and steering they were computed for
+        self.drive_force = np.zeros(capacity)
+        self.drive_torque = np.zeros(capacity)
+        self.drive_throttle = np.zeros(capacity)
+        self.drive_steering = np.zeros(capacity)
+        self.is_crashed = np.zeros(capacity, dtype=bool)
+        self.is_finished = np.zeros(capacity, dtype=bool)
+        self.is_sliding = np.zeros(capacity, dtype=bool)
+    
+    def __len__(self) -> int:
+        """Get the number of cars in the fleet."""
+        return len(self.cars)
+    
+    def add(self, car: 'Car', position: Tuple[float, float]) -> int:
+        """
+        Register a car and allocate its column.
+        
+        Args:
+            car: Car to register
+            position: The car's starting position
+        
+        Returns:
+            Index of the car's column in every array
+        """
+        index = len(self.cars)
+        if index == len(self.pos_x):
+            self._grow()
+        
+        self.cars.append(car)
+        body = car.physics_body.body
+        self._body_to_index[body] = index
+        if self._space is None:
+            self._attach_space(body.space)
+        self.pos_x[index] = self.last_x[index] = position[0]
+        self.pos_y[index] = self.last_y[index] = position[1]
+        return index
+    
+    def _grow(self) -> None:
+        """Double the capacity of every column."""
+        for name in self._COLUMNS:
+            column = getattr(self, name)
+            grown = np.zeros(len(column) * 2, dtype=column.dtype)
+            grown[:len(column)] = column
+            setattr(self, name, grown)
+    
+    def _attach_space(self, space: pymunk.Space) -> None:
+        """
+        Route car collisions in a physics space through the fleet.
+        
+        pymunk keeps one handler per collision type pair, so every fleet in
+        a space shares it: the handler's data lists the fleets, and each
+        collision is offered to all of them.
+        
+        Args:
+            space: Space the fleet's cars live in
+        
+        Raises:
+            RuntimeError: If another post-solve callback already claims car
+                collisions in the space
+        """
+        self._space = space
+        for other_type in (self.CAR_COLLISION_TYPE, self.BOUNDARY_COLLISION_TYPE):
+            handler = space.add_collision_handler(self.CAR_COLLISION_TYPE, other_type)
+            fleets = handler.data.setdefault('car_fleets', [])
+            if handler.post_solve is not CarFleet._dispatch_space_collision:
+                if handler.post_solve is not None:
+                    raise RuntimeError(
+                        f"Collision pair ({self.CAR_COLLISION_TYPE}, {other_type}) "
+                        "already has a post-solve callback")
+                handler.post_solve = CarFleet._dispatch_space_collision
+            fleets.append(self)
+    
+    @staticmethod
+    def _dispatch_space_collision(arbiter: pymunk.Arbiter, space: pymunk.Space,
+                                  data: Dict[str, Any]) -> None:
+        """
+        Offer a car collision to every fleet in the space.
+        
+        Args:
+            arbiter: Collision arbiter from pymunk
+            space: Physics space
+            data: Handler data holding the space's fleets
+        """
+        for fleet in data['car_fleets']:
+            fleet._on_collision(arbiter)
+    
+    def _on_collision(self, arbiter: pymunk.Arbiter) -> None:
+        """
+        Mark crashes for this fleet's cars in a collision.
+        
+        Args:
+            arbiter: Collision arbiter from pymunk
+        """
+        shapes = arbiter.shapes
+        body_to_index = self._body_to_index
+        cars = self.cars
+        impact_force = None
+        
+        for shape, other_shape in (shapes, shapes[::-1]):
+            index = body_to_index.get(shape.body)
+            if index is None:
+                continue
+            
+            if impact_force is None:
+                impact_force = arbiter.total_impulse.length
+            car = cars[index]
+            if impact_force > car.crash_threshold:
+                self.mark_crashed(index)
+            
+            if car.collision_callback is not None:
+                contact_points = arbiter.contact_point_set
+                collision_info = {
+                    'point': contact_points.points[0].point_a if contact_points.points else None,
+                    'normal': contact_points.normal,
+                    'impulse': arbiter.total_impulse,
+                    'other_shape': other_shape
+                }
+                self._pending_collisions.append((index, collision_info))
+    
+    def _dispatch_collisions(self) -> None:
+        """Run the collision callbacks queued since the last update."""
+        pending, self._pending_collisions = self._pending_collisions, []
+        cars = self.cars
+        for index, collision_info in pending:
+            car = cars[index]
+            car.collision_callback(car, collision_info)
+    
+    def mark_crashed(self, index: int) -> None:
+        """
+        Start the respawn countdown for a car.
+        
+        Args:
+            index: Fleet index of the car
+        """
+        self.is_crashed[index] = True
+        self.respawn_timer[index] = self.RESPAWN_DELAY
+    
+    def reset(self, index: int, position: Tuple[float, float]) -> None:
+        """
+        Clear crash state and restart distance tracking from a new position.
+        
+        Args:
+            index: Fleet index of the car
+            position: New position (x, y)
+        """
+        self.is_crashed[index] = False
+        self.respawn_timer[index] = 0.0
+        self.forward_speed[index] = self.lateral_speed[index] = 0.0
+        self.is_sliding[index] = False
+        self.drive_force[index] = self.drive_torque[index] = 0.0
+        self.drive_throttle[index] = self.drive_steering[index] = 0.0
+        self.pos_x[index] = self.last_x[index] = position[0]
+        self.pos_y[index] = self.last_y[index] = position[1]
+    
+    def apply_controls_bulk(self, throttles: Sequence[float], steerings: Sequence[float],
+                            brakes: Sequence[float]) -> None:
+        """
+        Apply control inputs to every car in fleet order.
+        
+        Inputs are clamped as arrays into the fleet's control columns, then
+        handed to each car without clamping again.
+        
+        Args:
+            throttles: Throttle per car (-1.0 to 1.0)
+            steerings: Steering per car (-1.0 to 1.0)
+            brakes: Brake per car (0.0 to 1.0)
+        """
+        count = len(self.cars)
+        throttle = np.clip(throttles, -1.0, 1.0, out=self.throttle[:count])
+        steering = np.clip(steerings, -1.0, 1.0, out=self.steering[:count])
+        brake = np.clip(brakes, 0.0, 1.0, out=self.brake[:count])
+        
+        for car, car_throttle, car_steering, car_brake in zip(
+                self.cars, throttle.tolist(), steering.tolist(), brake.tolist()):
+            car._set_clamped_controls(car_throttle, car_steering, car_brake)
+    
+    def _update_physics_lod(self, dt: float, focus: Tuple[float, float], count: int) -> None:
+        """
+        Recompute control forces at a reduced rate for cars far from a point.
+        
+        Every car that isn't crashed gets physics every frame. A car on a
+        reduced rate only recomputes its throttle and steering forces once
+        every N frames, or sooner if its controls change, and reapplies the
+        cached values in between. The driving force is cached along the
+        car's forward axis, so it follows the car as it turns. Braking and
+        damping depend on the current velocity, so they are always computed
+        fresh. Frames are staggered by fleet index to spread the work.
+        
+        Args:
+            dt: Delta time in seconds
+            focus: Point distances are measured from
+            count: Number of cars in the fleet
+        """
+        dx = self.pos_x[:count] - focus[0]
+        dy = self.pos_y[:count] - focus[1]
+        distance_sq = dx * dx + dy * dy
+        
+        interval = np.where(distance_sq < self.NEAR_DISTANCE ** 2, 1,
+                            np.where(distance_sq < self.FAR_DISTANCE ** 2,
+                                     self.MID_INTERVAL, self.FAR_INTERVAL))
+        active = ~self.is_crashed[:count]
+        throttle, steering = self.throttle[:count], self.steering[:count]
+        drive_throttle, drive_steering = self.drive_throttle[:count], self.drive_steering[:count]
+        due = ((self._frame + np.arange(count)) % interval == 0)
+        due |= (throttle != drive_throttle) | (steering != drive_steering)
+        due &= active
+        
+        cars = self.cars
+        drive_force, drive_torque = self.drive_force, self.drive_torque
+        due_indices = np.flatnonzero(due)
+        for index in due_indices.tolist():
+            car_body = cars[index].physics_body
+            drive_force[index], drive_torque[index] = \
+                car_body.get_drive_forces(car_body.body.velocity.length)
+        drive_throttle[due_indices] = throttle[due_indices]
+        drive_steering[due_indices] = steering[due_indices]
+        
+        active_indices = np.flatnonzero(active)
+        for index, forward_force, torque in zip(
+                active_indices.tolist(), drive_force[active_indices].tolist(),
+                drive_torque[active_indices].tolist()):
+            car_body = cars[index].physics_body
+            velocity = car_body.body.velocity
+            car_body.apply_drive_forces(forward_force, torque)
+            car_body.apply_resistance(velocity, velocity.length)
+    
+    def update_all(self, dt: float, focus: Optional[Tuple[float, float]] = None) -> None:
+        """
+        Advance every car in the fleet by one frame.
+        
+        Equivalent to calling Car.update(dt) on each car, with the respawn
+        countdown and performance metrics computed as array operations.
+        
+        Args:
+            dt: Delta time in seconds
+            focus: Point (usually the player's position) that distant cars
+                are measured from; cars far from it recompute their throttle
+                and steering forces less often. Every car recomputes them
+                every frame if None.
+        """
+        count = len(self.cars)
+        if count == 0:
+            return
+        cars = self.cars
+        crashed = self.is_crashed[:count]
+        respawn_timer = self.respawn_timer[:count]
+        
+        if self._pending_collisions:
+            self._dispatch_collisions()
+        
+        # Respawn countdown; only cars whose crash state flips touch pymunk
+        if crashed.any():
+            was_crashed = np.flatnonzero(crashed).tolist()
+            for index in update_respawn(crashed, respawn_timer, dt).tolist():
+                # Reset velocity but keep position
+                body = cars[index].physics_body.body
+                body.velocity = (0, 0)
+                body.angular_velocity = 0
+            
+            for index in was_crashed:
+                state = cars[index].state
+                state.is_crashed = bool(crashed[index])
+                state.respawn_timer = float(respawn_timer[index])
+        
+        # Update physics if not crashed
+        if focus is None:
+            for index in np.flatnonzero(~crashed).tolist():
+                cars[index].physics_body.update_physics(dt)
+        else:
+            self._update_physics_lod(dt, focus, count)
+        self._frame += 1
+        
+        # Gather body state once, then update metrics for everyone
+        pos_x, pos_y = self.pos_x, self.pos_y
+        vel_x, vel_y = self.vel_x, self.vel_y
+        angle = self.angle
+        for index, car in enumerate(cars):
+            body = car.physics_body.body
+            pos_x[index], pos_y[index] = body.position
+            vel_x[index], vel_y[index] = body.velocity
+            angle[index] = body.angle
+        
+        distance = self.distance_traveled[:count]
+        top_speed = self.top_speed[:count]
+        update_metrics(pos_x[:count], pos_y[:count],
+                       self.last_x[:count], self.last_y[:count],
+                       vel_x[:count], vel_y[:count],
+                       self.speed[:count], top_speed, distance, self._scratch[:count])
+        update_slip(angle[:count], vel_x[:count], vel_y[:count],
+                    self.forward_speed[:count], self.lateral_speed[:count],
+                    self.is_sliding[:count], self.SLIDING_THRESHOLD,
+                    self._scratch[:count], self._scratch2[:count])
+        
+        # Mirror the metrics into each car's state and HUD view for game and
+        # UI code, straight from the columns instead of re-querying pymunk
+        angle_degrees = np.degrees(angle[:count], out=self._scratch[:count])
+        for (car, x, y, car_angle, car_speed, forward_speed, lateral_speed, sliding,
+             distance_traveled, car_top_speed) in zip(
+                cars, pos_x[:count].tolist(), pos_y[:count].tolist(), angle_degrees.tolist(),
+                self.speed[:count].tolist(), self.forward_speed[:count].tolist(),
+                self.lateral_speed[:count].tolist(), self.is_sliding[:count].tolist(),
+                distance.tolist(), top_speed.tolist()):
+            state = car.state
+            state.distance_traveled = distance_traveled
+            state.top_speed = car_top_speed
+            state.lap_time += dt
+            car._frame_count += 1
+            car._info_cache = None
+            
+            view = car._info_view
+            view.position = (x, y)
+            view.angle_degrees = car_angle
+            view.speed = car_speed
+            view.forward_speed = forward_speed
+            view.lateral_speed = lateral_speed
+            view.is_sliding = sliding
+            view.top_speed = car_top_speed
+            view.distance_traveled = distance_traveled
@@ -5,19 +5,84 @@ This module provides predefined control schemes and utilities for
 managing different input configurations.
 """
 
-from dataclasses import dataclass
-from typing import Dict, List
+import functools
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import List, Mapping
 import pygame
 from .input_manager import InputAction, InputConfig
 
 
-@dataclass
+# Read-only key mapping groups; each scheme merges the groups it uses into
+# its own dict
+_WASD_MAP = MappingProxyType({
+    pygame.K_w: InputAction.ACCELERATE,
+    pygame.K_s: InputAction.BRAKE,
+    pygame.K_a: InputAction.STEER_LEFT,
+    pygame.K_d: InputAction.STEER_RIGHT,
+})
+_ARROW_MAP = MappingProxyType({
+    pygame.K_UP: InputAction.ACCELERATE,
+    pygame.K_DOWN: InputAction.BRAKE,
+    pygame.K_LEFT: InputAction.STEER_LEFT,
+    pygame.K_RIGHT: InputAction.STEER_RIGHT,
+})
+# Reverse and alternative brake keys
+_WASD_EXTRA_MAP = MappingProxyType({
+    pygame.K_LSHIFT: InputAction.REVERSE,
+    pygame.K_SPACE: InputAction.BRAKE,
+})
+_ARROW_EXTRA_MAP = MappingProxyType({
+    pygame.K_RSHIFT: InputAction.REVERSE,
+    pygame.K_RCTRL: InputAction.BRAKE,
+})
+_COMBINED_EXTRA_MAP = MappingProxyType({
+    pygame.K_LSHIFT: InputAction.REVERSE,
+    pygame.K_RSHIFT: InputAction.REVERSE,
+    pygame.K_SPACE: InputAction.BRAKE,
+})
+_SYSTEM_MAP = MappingProxyType({
+    pygame.K_p: InputAction.PAUSE,
+    pygame.K_r: InputAction.RESET,
+    pygame.K_TAB: InputAction.SWITCH_PHYSICS,
+})
+
+# Response settings shared by the WASD, Arrow Keys and Combined schemes
+_STANDARD_RESPONSE = {
+    'acceleration_smoothing': 0.1,
+    'steering_smoothing': 0.05,
+    'brake_smoothing': 0.05,
+    'acceleration_decay': 0.2,
+    'steering_decay': 0.15,
+    'brake_decay': 0.3,
+    'input_deadzone': 0.05,
+}
+
+
+@dataclass(frozen=True, slots=True, eq=False)
 class ControlScheme:
-    """A named control scheme with key mappings and settings."""
+    """
+    A named control scheme with key mappings and settings.
+    
+    Schemes are immutable and compared by identity; the presets are built
+    once and shared.
+    """
     name: str
     description: str
-    key_mappings: Dict[int, InputAction]
+    key_mappings: Mapping[int, InputAction]
     input_config: InputConfig
+    # Inverse of key_mappings, in InputAction order; built on construction
+    keys_by_action: Mapping[InputAction, List[int]] = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        """Store the mappings read-only and build the action-to-keys index."""
+        key_mappings = MappingProxyType(dict(self.key_mappings))
+        keys_by_action = {action: [] for action in InputAction}
+        for key, action in key_mappings.items():
+            keys_by_action[action].append(key)
+        object.__setattr__(self, 'key_mappings', key_mappings)
+        object.__setattr__(self, 'keys_by_action', MappingProxyType(
+            {action: keys for action, keys in keys_by_action.items() if keys}))
 
 
 class ControlSchemes:
@@ -26,33 +91,9 @@ class ControlSchemes:
     @staticmethod
     def wasd_scheme() -> ControlScheme:
         """WASD control scheme (default)."""
-        key_mappings = {
-            # WASD controls
-            pygame.K_w: InputAction.ACCELERATE,
-            pygame.K_s: InputAction.BRAKE,
-            pygame.K_a: InputAction.STEER_LEFT,
-            pygame.K_d: InputAction.STEER_RIGHT,
-            
-            # Additional controls
-            pygame.K_LSHIFT: InputAction.REVERSE,
-            pygame.K_SPACE: InputAction.BRAKE,  # Alternative brake
-            
-            # System controls
-            pygame.K_p: InputAction.PAUSE,
-            pygame.K_r: InputAction.RESET,
-            pygame.K_TAB: InputAction.SWITCH_PHYSICS,
-        }
+        key_mappings = _WASD_MAP | _WASD_EXTRA_MAP | _SYSTEM_MAP
         
-        config = InputConfig(
-            key_mappings=key_mappings,
-            acceleration_smoothing=0.1,
-            steering_smoothing=0.05,
-            brake_smoothing=0.05,
-            acceleration_decay=0.2,
-            steering_decay=0.15,
-            brake_decay=0.3,
-            input_deadzone=0.05
-        )
+        config = InputConfig(key_mappings=key_mappings, **_STANDARD_RESPONSE)
         
         return ControlScheme(
             name="WASD",
@@ -64,33 +105,9 @@ class ControlSchemes:
     @staticmethod
     def arrow_keys_scheme() -> ControlScheme:
         """Arrow keys control scheme."""
-        key_mappings = {
-            # Arrow key controls
-            pygame.K_UP: InputAction.ACCELERATE,
-            pygame.K_DOWN: InputAction.BRAKE,
-            pygame.K_LEFT: InputAction.STEER_LEFT,
-            pygame.K_RIGHT: InputAction.STEER_RIGHT,
-            
-            # Additional controls
-            pygame.K_RSHIFT: InputAction.REVERSE,
-            pygame.K_RCTRL: InputAction.BRAKE,  # Alternative brake
-            
-            # System controls
-            pygame.K_p: InputAction.PAUSE,
-            pygame.K_r: InputAction.RESET,
-            pygame.K_TAB: InputAction.SWITCH_PHYSICS,
-        }
+        key_mappings = _ARROW_MAP | _ARROW_EXTRA_MAP | _SYSTEM_MAP
         
-        config = InputConfig(
-            key_mappings=key_mappings,
-            acceleration_smoothing=0.1,
-            steering_smoothing=0.05,
-            brake_smoothing=0.05,
-            acceleration_decay=0.2,
-            steering_decay=0.15,
-            brake_decay=0.3,
-            input_deadzone=0.05
-        )
+        config = InputConfig(key_mappings=key_mappings, **_STANDARD_RESPONSE)
         
         return ControlScheme(
             name="Arrow Keys",
@@ -102,40 +119,9 @@ class ControlSchemes:
     @staticmethod
     def combined_scheme() -> ControlScheme:
         """Combined WASD + Arrow keys scheme (default)."""
-        key_mappings = {
-            # WASD controls
-            pygame.K_w: InputAction.ACCELERATE,
-            pygame.K_s: InputAction.BRAKE,
-            pygame.K_a: InputAction.STEER_LEFT,
-            pygame.K_d: InputAction.STEER_RIGHT,
-            
-            # Arrow key controls
-            pygame.K_UP: InputAction.ACCELERATE,
-            pygame.K_DOWN: InputAction.BRAKE,
-            pygame.K_LEFT: InputAction.STEER_LEFT,
-            pygame.K_RIGHT: InputAction.STEER_RIGHT,
-            
-            # Additional controls
-            pygame.K_LSHIFT: InputAction.REVERSE,
-            pygame.K_RSHIFT: InputAction.REVERSE,
-            pygame.K_SPACE: InputAction.BRAKE,  # Alternative brake
-            
-            # System controls
-            pygame.K_p: InputAction.PAUSE,
-            pygame.K_r: InputAction.RESET,
-            pygame.K_TAB: InputAction.SWITCH_PHYSICS,
-        }
+        key_mappings = _WASD_MAP | _ARROW_MAP | _COMBINED_EXTRA_MAP | _SYSTEM_MAP
         
-        config = InputConfig(
-            key_mappings=key_mappings,
-            acceleration_smoothing=0.1,
-            steering_smoothing=0.05,
-            brake_smoothing=0.05,
-            acceleration_decay=0.2,
-            steering_decay=0.15,
-            brake_decay=0.3,
-            input_deadzone=0.05
-        )
+        config = InputConfig(key_mappings=key_mappings, **_STANDARD_RESPONSE)
         
         return ControlScheme(
             name="Combined",
@@ -147,29 +133,7 @@ class ControlSchemes:
     @staticmethod
     def arcade_scheme() -> ControlScheme:
         """Arcade-style control scheme with faster response."""
-        key_mappings = {
-            # WASD controls
-            pygame.K_w: InputAction.ACCELERATE,
-            pygame.K_s: InputAction.BRAKE,
-            pygame.K_a: InputAction.STEER_LEFT,
-            pygame.K_d: InputAction.STEER_RIGHT,
-            
-            # Arrow key controls
-            pygame.K_UP: InputAction.ACCELERATE,
-            pygame.K_DOWN: InputAction.BRAKE,
-            pygame.K_LEFT: InputAction.STEER_LEFT,
-            pygame.K_RIGHT: InputAction.STEER_RIGHT,
-            
-            # Additional controls
-            pygame.K_LSHIFT: InputAction.REVERSE,
-            pygame.K_RSHIFT: InputAction.REVERSE,
-            pygame.K_SPACE: InputAction.BRAKE,
-            
-            # System controls
-            pygame.K_p: InputAction.PAUSE,
-            pygame.K_r: InputAction.RESET,
-            pygame.K_TAB: InputAction.SWITCH_PHYSICS,
-        }
+        key_mappings = _WASD_MAP | _ARROW_MAP | _COMBINED_EXTRA_MAP | _SYSTEM_MAP
         
         # Faster, more responsive settings for arcade feel
         config = InputConfig(
@@ -193,29 +157,7 @@ class ControlSchemes:
     @staticmethod
     def realistic_scheme() -> ControlScheme:
         """Realistic control scheme with slower, more gradual response."""
-        key_mappings = {
-            # WASD controls
-            pygame.K_w: InputAction.ACCELERATE,
-            pygame.K_s: InputAction.BRAKE,
-            pygame.K_a: InputAction.STEER_LEFT,
-            pygame.K_d: InputAction.STEER_RIGHT,
-            
-            # Arrow key controls
-            pygame.K_UP: InputAction.ACCELERATE,
-            pygame.K_DOWN: InputAction.BRAKE,
-            pygame.K_LEFT: InputAction.STEER_LEFT,
-            pygame.K_RIGHT: InputAction.STEER_RIGHT,
-            
-            # Additional controls
-            pygame.K_LSHIFT: InputAction.REVERSE,
-            pygame.K_RSHIFT: InputAction.REVERSE,
-            pygame.K_SPACE: InputAction.BRAKE,
-            
-            # System controls
-            pygame.K_p: InputAction.PAUSE,
-            pygame.K_r: InputAction.RESET,
-            pygame.K_TAB: InputAction.SWITCH_PHYSICS,
-        }
+        key_mappings = _WASD_MAP | _ARROW_MAP | _COMBINED_EXTRA_MAP | _SYSTEM_MAP
         
         # Slower, more gradual settings for realistic feel
         config = InputConfig(
@@ -238,14 +180,13 @@ class ControlSchemes:
     
     @staticmethod
     def get_all_schemes() -> List[ControlScheme]:
-        """Get all available control schemes."""
-        return [
-            ControlSchemes.combined_scheme(),      # Default
-            ControlSchemes.wasd_scheme(),
-            ControlSchemes.arrow_keys_scheme(),
-            ControlSchemes.arcade_scheme(),
-            ControlSchemes.realistic_scheme(),
-        ]
+        """
+        Get all available control schemes.
+        
+        The schemes are built once at import and shared between callers;
+        use the individual scheme methods to get an instance to modify.
+        """
+        return list(_ALL_SCHEMES)
     
     @staticmethod
     def get_scheme_by_name(name: str) -> ControlScheme:
@@ -256,28 +197,41 @@ class ControlSchemes:
             name: Name of the control scheme
             
         Returns:
-            ControlScheme instance
+            Shared ControlScheme instance
             
         Raises:
             ValueError: If scheme name is not found
         """
-        schemes = {scheme.name: scheme for scheme in ControlSchemes.get_all_schemes()}
-        
-        if name not in schemes:
-            available = ", ".join(schemes.keys())
+        scheme = _SCHEMES_BY_NAME.get(name)
+        if scheme is None:
+            available = ", ".join(_SCHEMES_BY_NAME)
             raise ValueError(f"Control scheme '{name}' not found. Available: {available}")
         
-        return schemes[name]
+        return scheme
+
+
+# Every scheme, built once; the first is the default
+_ALL_SCHEMES = (
+    ControlSchemes.combined_scheme(),
+    ControlSchemes.wasd_scheme(),
+    ControlSchemes.arrow_keys_scheme(),
+    ControlSchemes.arcade_scheme(),
+    ControlSchemes.realistic_scheme(),
+)
+_SCHEMES_BY_NAME = {scheme.name: scheme for scheme in _ALL_SCHEMES}
 
 
 class ControlsHelper:
     """Helper utilities for working with controls."""
     
     @staticmethod
+    @functools.lru_cache(maxsize=512)
     def get_key_name(key_code: int) -> str:
         """
         Get human-readable name for a pygame key code.
         
+        Results are cached per key code.
+        
         Args:
             key_code: Pygame key constant
             
@@ -330,19 +284,10 @@ class ControlsHelper:
             "Key Mappings:"
         ]
         
-        # Group mappings by action
-        action_keys = {}
-        for key, action in scheme.key_mappings.items():
-            if action not in action_keys:
-                action_keys[action] = []
-            action_keys[action].append(key)
-        
         # Format each action
-        for action in InputAction:
-            if action in action_keys:
-                keys = action_keys[action]
-                key_names = [ControlsHelper.get_key_name(key) for key in keys]
-                action_desc = ControlsHelper.get_action_description(action)
-                lines.append(f"  {action_desc}: {', '.join(key_names)}")
+        for action, keys in scheme.keys_by_action.items():
+            key_names = [ControlsHelper.get_key_name(key) for key in keys]
+            action_desc = ControlsHelper.get_action_description(action)
+            lines.append(f"  {action_desc}: {', '.join(key_names)}")
         
         return "\n".join(lines)
\ No newline at end of file
@@ -5,8 +5,10 @@ This module provides the InputManager class for handling keyboard input
 and mapping it to car controls with smooth input processing.
 """
 
-from dataclasses import dataclass
-from typing import Dict, Set, Optional, Callable, Any
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Set, Optional, Callable, Any, Tuple
+import numpy as np
 import pygame
 from enum import Enum
 
@@ -23,7 +25,7 @@ class InputAction(Enum):
     SWITCH_PHYSICS = "switch_physics"
 
 
-@dataclass
+@dataclass(slots=True)
 class InputState:
     """Current state of all input actions."""
     accelerate: float = 0.0      # 0.0 to 1.0
@@ -52,12 +54,43 @@ class InputState:
         return self.brake
 
 
-@dataclass
+# Default WASD + Arrow key mappings, built once at import
+_DEFAULT_KEY_MAPPINGS = MappingProxyType({
+    # WASD controls
+    pygame.K_w: InputAction.ACCELERATE,
+    pygame.K_s: InputAction.BRAKE,
+    pygame.K_a: InputAction.STEER_LEFT,
+    pygame.K_d: InputAction.STEER_RIGHT,
+    
+    # Arrow key controls
+    pygame.K_UP: InputAction.ACCELERATE,
+    pygame.K_DOWN: InputAction.BRAKE,
+    pygame.K_LEFT: InputAction.STEER_LEFT,
+    pygame.K_RIGHT: InputAction.STEER_RIGHT,
+    
+    # Additional controls
+    pygame.K_LSHIFT: InputAction.REVERSE,
+    pygame.K_RSHIFT: InputAction.REVERSE,
+    pygame.K_SPACE: InputAction.BRAKE,  # Alternative brake
+    
+    # System controls
+    pygame.K_p: InputAction.PAUSE,
+    pygame.K_r: InputAction.RESET,
+    pygame.K_TAB: InputAction.SWITCH_PHYSICS,
+})
+
+
+@dataclass(frozen=True, slots=True)
 class InputConfig:
-    """Configuration for input handling."""
+    """
+    Configuration for input handling.
+    
+    Immutable and shareable between input managers; use
+    dataclasses.replace() to derive a changed copy.
+    """
     
-    # Key mappings (pygame key constants)
-    key_mappings: Dict[int, InputAction] = None
+    # Key mappings (pygame key constants), stored as a read-only copy
+    key_mappings: Mapping[int, InputAction] = field(default=None, hash=False)
     
     # Input smoothing parameters
     acceleration_smoothing: float = 0.1    # How quickly acceleration builds up
@@ -72,36 +105,50 @@ class InputConfig:
     # Deadzone for analog-like behavior
     input_deadzone: float = 0.05
     
+    # Record per-frame input history for debug displays
+    record_history: bool = False
+    
+    # Inverse of key_mappings with an entry for every action; built on construction
+    action_keys: Mapping[InputAction, FrozenSet[int]] = field(
+        init=False, repr=False, compare=False, hash=False)
+    # (InputState field, keys, smoothing, decay) per analog action
+    analog_channels: Tuple[Tuple[str, FrozenSet[int], float, float], ...] = field(
+        init=False, repr=False, compare=False, hash=False)
+    # (InputState field, keys) per digital action
+    digital_channels: Tuple[Tuple[str, FrozenSet[int]], ...] = field(
+        init=False, repr=False, compare=False, hash=False)
+    
     def __post_init__(self):
         """Initialize default key mappings if not provided."""
-        if self.key_mappings is None:
-            self.key_mappings = self._get_default_key_mappings()
+        key_mappings = self.key_mappings
+        if key_mappings is None:
+            key_mappings = self._get_default_key_mappings()
+        object.__setattr__(self, 'key_mappings', MappingProxyType(dict(key_mappings)))
+        
+        action_keys = {action: set() for action in InputAction}
+        for key, action in key_mappings.items():
+            action_keys[action].add(key)
+        action_keys = {action: frozenset(keys) for action, keys in action_keys.items()}
+        object.__setattr__(self, 'action_keys', MappingProxyType(action_keys))
+        
+        # Reverse shares the acceleration response
+        rates = (
+            (InputAction.ACCELERATE, self.acceleration_smoothing, self.acceleration_decay),
+            (InputAction.BRAKE, self.brake_smoothing, self.brake_decay),
+            (InputAction.STEER_LEFT, self.steering_smoothing, self.steering_decay),
+            (InputAction.STEER_RIGHT, self.steering_smoothing, self.steering_decay),
+            (InputAction.REVERSE, self.acceleration_smoothing, self.acceleration_decay),
+        )
+        object.__setattr__(self, 'analog_channels', tuple(
+            (action.value, action_keys[action], smoothing, decay)
+            for action, smoothing, decay in rates))
+        object.__setattr__(self, 'digital_channels', tuple(
+            (action.value, action_keys[action])
+            for action in (InputAction.PAUSE, InputAction.RESET, InputAction.SWITCH_PHYSICS)))
     
-    def _get_default_key_mappings(self) -> Dict[int, InputAction]:
+    def _get_default_key_mappings(self) -> Mapping[int, InputAction]:
         """Get default WASD + Arrow key mappings."""
-        return {
-            # WASD controls
-            pygame.K_w: InputAction.ACCELERATE,
-            pygame.K_s: InputAction.BRAKE,
-            pygame.K_a: InputAction.STEER_LEFT,
-            pygame.K_d: InputAction.STEER_RIGHT,
-            
-            # Arrow key controls
-            pygame.K_UP: InputAction.ACCELERATE,
-            pygame.K_DOWN: InputAction.BRAKE,
-            pygame.K_LEFT: InputAction.STEER_LEFT,
-            pygame.K_RIGHT: InputAction.STEER_RIGHT,
-            
-            # Additional controls
-            pygame.K_LSHIFT: InputAction.REVERSE,
-            pygame.K_RSHIFT: InputAction.REVERSE,
-            pygame.K_SPACE: InputAction.BRAKE,  # Alternative brake
-            
-            # System controls
-            pygame.K_p: InputAction.PAUSE,
-            pygame.K_r: InputAction.RESET,
-            pygame.K_TAB: InputAction.SWITCH_PHYSICS,
-        }
+        return _DEFAULT_KEY_MAPPINGS
 
 
 class InputManager:
@@ -112,6 +159,16 @@ class InputManager:
     supporting both digital and analog-like input behavior.
     """
     
+    # Columns of input_history, one row per recorded frame
+    HISTORY_COLUMNS = ('throttle', 'steering', 'brake', 'raw_accelerate', 'raw_brake',
+                       'raw_steer_left', 'raw_steer_right', 'raw_reverse')
+    _HISTORY_COLUMN_INDEX = dict(zip(HISTORY_COLUMNS, range(len(HISTORY_COLUMNS))))
+    
+    __slots__ = ('config', 'input_state', 'pressed_keys', 'just_pressed_keys',
+                 'just_released_keys', '_pending_pressed', '_pending_released',
+                 '_current_controls', 'action_callbacks', 'max_history_length',
+                 'input_history', '_history_index')
+    
     def __init__(self, config: Optional[InputConfig] = None):
         """
         Initialize the input manager.
@@ -129,15 +186,24 @@ class InputManager:
         self.just_pressed_keys: Set[int] = set()
         self.just_released_keys: Set[int] = set()
         
-        # Previous frame key states for edge detection
-        self._previous_keys: Set[int] = set()
+        # Edges seen by process_events() since the last update(); swapped
+        # into just_pressed_keys/just_released_keys at the next update()
+        self._pending_pressed: Set[int] = set()
+        self._pending_released: Set[int] = set()
+        
+        # Car controls (throttle, steering, brake) combined from input_state;
+        # None until get_car_controls() or history recording needs them
+        self._current_controls: Optional[Tuple[float, float, float]] = None
         
         # Event callbacks
         self.action_callbacks: Dict[InputAction, Callable] = {}
         
-        # Input history for debugging
-        self.input_history: list = []
+        # Input history for debugging: a ring of rows, allocated once; the
+        # next frame goes to row _history_index % max_history_length
         self.max_history_length: int = 60  # 1 second at 60 FPS
+        self.input_history = np.zeros((self.max_history_length, len(self.HISTORY_COLUMNS)),
+                                      dtype=np.float32)
+        self._history_index = 0
     
     def set_action_callback(self, action: InputAction, callback: Callable) -> None:
         """
@@ -149,171 +215,149 @@ class InputManager:
         """
         self.action_callbacks[action] = callback
     
+    def process_events(self, events: List[pygame.event.Event]) -> None:
+        """
+        Track key presses and releases from this frame's events.
+        
+        Call with each frame's events before update(); key repeats of keys
+        already held are ignored.
+        
+        Args:
+            events: Pygame events retrieved this frame
+        """
+        pressed_keys = self.pressed_keys
+        self._current_controls = None
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                key = event.key
+                if key not in pressed_keys:
+                    pressed_keys.add(key)
+                    self._pending_pressed.add(key)
+            elif event.type == pygame.KEYUP:
+                key = event.key
+                if key in pressed_keys:
+                    pressed_keys.discard(key)
+                    self._pending_released.add(key)
+    
     def update(self, dt: float) -> None:
         """
-        Update input state based on current keyboard state.
+        Update input state from the key events processed since the last update.
         
         Args:
             dt: Delta time in seconds
         """
-        # Get current keyboard state
-        keys = pygame.key.get_pressed()
-        current_keys = set()
-        
-        # Build current key set
-        for key_code in range(len(keys)):
-            if keys[key_code]:
-                current_keys.add(key_code)
-        
-        # Detect key press/release events
-        self.just_pressed_keys = current_keys - self._previous_keys
-        self.just_released_keys = self._previous_keys - current_keys
-        self.pressed_keys = current_keys
-        
-        # Update input state with smoothing
-        self._update_analog_inputs(dt)
-        self._update_digital_inputs()
-        
-        # Store previous keys for next frame
-        self._previous_keys = current_keys.copy()
-        
-        # Record input history
-        self._record_input_history()
+        # Publish this frame's edges and reuse last frame's sets as buffers
+        self.just_pressed_keys, self._pending_pressed = self._pending_pressed, self.just_pressed_keys
+        self.just_released_keys, self._pending_released = self._pending_released, self.just_released_keys
+        self._pending_pressed.clear()
+        self._pending_released.clear()
+        
+        state = self.input_state
+        config = self.config
+        pressed_keys = self.pressed_keys
+        just_pressed = self.just_pressed_keys
+        
+        # Analog inputs: build up pressed actions, let released ones decay,
+        # then apply the deadzone
+        deadzone = config.input_deadzone
+        for name, keys, smoothing, decay in config.analog_channels:
+            if keys.isdisjoint(pressed_keys):
+                value = max(0.0, getattr(state, name) - decay * dt)
+            else:
+                value = min(1.0, getattr(state, name) + smoothing)
+            setattr(state, name, value if value >= deadzone else 0.0)
+        
+        # Digital inputs are set for the frame one of their keys went down
+        for name, keys in config.digital_channels:
+            setattr(state, name, not keys.isdisjoint(just_pressed))
+        
+        # Car controls are recombined on first use after the state changed
+        self._current_controls = None
+        
+        # Record input history (debug only)
+        if config.record_history:
+            self._record_input_history()
         
         # Trigger action callbacks for just-pressed keys
-        self._trigger_action_callbacks()
-    
-    def _update_analog_inputs(self, dt: float) -> None:
-        """Update analog-style inputs with smoothing."""
-        # Check which analog actions are currently pressed
-        accelerate_pressed = any(key in self.pressed_keys 
-                               for key, action in self.config.key_mappings.items() 
-                               if action == InputAction.ACCELERATE)
-        
-        brake_pressed = any(key in self.pressed_keys 
-                          for key, action in self.config.key_mappings.items() 
-                          if action == InputAction.BRAKE)
-        
-        steer_left_pressed = any(key in self.pressed_keys 
-                               for key, action in self.config.key_mappings.items() 
-                               if action == InputAction.STEER_LEFT)
-        
-        steer_right_pressed = any(key in self.pressed_keys 
-                                for key, action in self.config.key_mappings.items() 
-                                if action == InputAction.STEER_RIGHT)
-        
-        reverse_pressed = any(key in self.pressed_keys 
-                            for key, action in self.config.key_mappings.items() 
-                            if action == InputAction.REVERSE)
-        
-        # Update acceleration
-        if accelerate_pressed:
-            self.input_state.accelerate = min(1.0, 
-                self.input_state.accelerate + self.config.acceleration_smoothing)
-        else:
-            self.input_state.accelerate = max(0.0, 
-                self.input_state.accelerate - self.config.acceleration_decay * dt)
-        
-        # Update braking
-        if brake_pressed:
-            self.input_state.brake = min(1.0, 
-                self.input_state.brake + self.config.brake_smoothing)
-        else:
-            self.input_state.brake = max(0.0, 
-                self.input_state.brake - self.config.brake_decay * dt)
-        
-        # Update steering left
-        if steer_left_pressed:
-            self.input_state.steer_left = min(1.0, 
-                self.input_state.steer_left + self.config.steering_smoothing)
-        else:
-            self.input_state.steer_left = max(0.0, 
-                self.input_state.steer_left - self.config.steering_decay * dt)
-        
-        # Update steering right
-        if steer_right_pressed:
-            self.input_state.steer_right = min(1.0, 
-                self.input_state.steer_right + self.config.steering_smoothing)
-        else:
-            self.input_state.steer_right = max(0.0, 
-                self.input_state.steer_right - self.config.steering_decay * dt)
-        
-        # Update reverse
-        if reverse_pressed:
-            self.input_state.reverse = min(1.0, 
-                self.input_state.reverse + self.config.acceleration_smoothing)
-        else:
-            self.input_state.reverse = max(0.0, 
-                self.input_state.reverse - self.config.acceleration_decay * dt)
-        
-        # Apply deadzone
-        self._apply_deadzone()
-    
-    def _update_digital_inputs(self) -> None:
-        """Update digital inputs (triggered on key press)."""
-        # Reset digital inputs
-        self.input_state.pause = False
-        self.input_state.reset = False
-        self.input_state.switch_physics = False
-        
-        # Check for just-pressed digital inputs
-        for key in self.just_pressed_keys:
-            action = self.config.key_mappings.get(key)
-            if action == InputAction.PAUSE:
-                self.input_state.pause = True
-            elif action == InputAction.RESET:
-                self.input_state.reset = True
-            elif action == InputAction.SWITCH_PHYSICS:
-                self.input_state.switch_physics = True
-    
-    def _apply_deadzone(self) -> None:
-        """Apply deadzone to analog inputs."""
-        deadzone = self.config.input_deadzone
-        
-        if self.input_state.accelerate < deadzone:
-            self.input_state.accelerate = 0.0
-        
-        if self.input_state.brake < deadzone:
-            self.input_state.brake = 0.0
-        
-        if self.input_state.steer_left < deadzone:
-            self.input_state.steer_left = 0.0
-        
-        if self.input_state.steer_right < deadzone:
-            self.input_state.steer_right = 0.0
-        
-        if self.input_state.reverse < deadzone:
-            self.input_state.reverse = 0.0
+        callbacks = self.action_callbacks
+        if callbacks and just_pressed:
+            key_mappings = config.key_mappings
+            for key in just_pressed:
+                callback = callbacks.get(key_mappings.get(key))
+                if callback is not None:
+                    callback()
     
     def _record_input_history(self) -> None:
-        """Record current input state for debugging."""
-        history_entry = {
-            'throttle': self.input_state.get_throttle(),
-            'steering': self.input_state.get_steering(),
-            'brake': self.input_state.get_brake(),
-            'raw_accelerate': self.input_state.accelerate,
-            'raw_brake': self.input_state.brake,
-            'raw_steer_left': self.input_state.steer_left,
-            'raw_steer_right': self.input_state.steer_right,
-            'raw_reverse': self.input_state.reverse,
-        }
-        
-        self.input_history.append(history_entry)
+        """Record current input state for debugging, overwriting the oldest row."""
+        state = self.input_state
+        throttle, steering, brake = self.get_car_controls()
+        self.input_history[self._history_index % self.max_history_length] = (
+            throttle,
+            steering,
+            brake,
+            state.accelerate,
+            state.brake,
+            state.steer_left,
+            state.steer_right,
+            state.reverse,
+        )
+        self._history_index += 1
+    
+    def get_history_frame(self, index: int) -> Dict[str, float]:
+        """
+        Get one recorded frame of input history by column name.
         
-        # Limit history length
-        if len(self.input_history) > self.max_history_length:
-            self.input_history.pop(0)
+        Args:
+            index: Frame index, oldest retained frame first; negative
+                indices count back from the newest
+            
+        Returns:
+            Dictionary mapping HISTORY_COLUMNS to the frame's values
+            
+        Raises:
+            IndexError: If no recorded frame has that index
+        """
+        count = min(self._history_index, self.max_history_length)
+        if not -count <= index < count:
+            raise IndexError(f"History frame {index} out of range ({count} recorded)")
+        if index < 0:
+            index += count
+        
+        row = self.input_history[(self._history_index - count + index) % self.max_history_length]
+        return dict(zip(self.HISTORY_COLUMNS, row.tolist()))
     
-    def _trigger_action_callbacks(self) -> None:
-        """Trigger callbacks for just-pressed actions."""
-        for key in self.just_pressed_keys:
-            action = self.config.key_mappings.get(key)
-            if action and action in self.action_callbacks:
-                self.action_callbacks[action]()
+    def get_history_column(self, name: str) -> np.ndarray:
+        """
+        Get one column of input history, oldest retained frame first.
+        
+        Useful for debug displays, e.g. np.mean(get_history_column('throttle')).
+        
+        Args:
+            name: Column name from HISTORY_COLUMNS
+            
+        Returns:
+            New array with the column's recorded values in frame order
+            
+        Raises:
+            ValueError: If name is not a history column
+        """
+        column_index = self._HISTORY_COLUMN_INDEX.get(name)
+        if column_index is None:
+            available = ", ".join(self.HISTORY_COLUMNS)
+            raise ValueError(f"Unknown history column '{name}'. Available: {available}")
+        
+        column = self.input_history[:, column_index]
+        if self._history_index < self.max_history_length:
+            return column[:self._history_index].copy()
+        return np.roll(column, -(self._history_index % self.max_history_length))
     
     def get_car_controls(self) -> tuple[float, float, float]:
         """
-        Get current car control inputs.
+        Get car control inputs combined from the current input state.
+        
+        The result is cached until update(), process_events(), a reset or a
+        key mapping change. Key events and mapping changes only move the
+        smoothed input state on the next update().
         
         Returns:
             Tuple of (throttle, steering, brake) values
@@ -321,11 +365,15 @@ class InputManager:
             - steering: -1.0 to 1.0 (left to right)
             - brake: 0.0 to 1.0 (no brake to full brake)
         """
-        return (
-            self.input_state.get_throttle(),
-            self.input_state.get_steering(),
-            self.input_state.get_brake()
-        )
+        controls = self._current_controls
+        if controls is None:
+            state = self.input_state
+            controls = self._current_controls = (
+                -state.reverse if state.reverse > 0.0 else state.accelerate,
+                state.steer_right - state.steer_left,
+                state.brake,
+            )
+        return controls
     
     def is_action_pressed(self, action: InputAction) -> bool:
         """
@@ -337,10 +385,7 @@ class InputManager:
         Returns:
             True if action is currently pressed
         """
-        for key, mapped_action in self.config.key_mappings.items():
-            if mapped_action == action and key in self.pressed_keys:
-                return True
-        return False
+        return not self.config.action_keys[action].isdisjoint(self.pressed_keys)
     
     def is_action_just_pressed(self, action: InputAction) -> bool:
         """
@@ -352,10 +397,7 @@ class InputManager:
         Returns:
             True if action was just pressed
         """
-        for key, mapped_action in self.config.key_mappings.items():
-            if mapped_action == action and key in self.just_pressed_keys:
-                return True
-        return False
+        return not self.config.action_keys[action].isdisjoint(self.just_pressed_keys)
     
     def is_action_just_released(self, action: InputAction) -> bool:
         """
@@ -367,10 +409,7 @@ class InputManager:
         Returns:
             True if action was just released
         """
-        for key, mapped_action in self.config.key_mappings.items():
-            if mapped_action == action and key in self.just_released_keys:
-                return True
-        return False
+        return not self.config.action_keys[action].isdisjoint(self.just_released_keys)
     
     def get_input_info(self) -> Dict[str, Any]:
         """
@@ -412,11 +451,14 @@ class InputManager:
     def reset_input_state(self) -> None:
         """Reset all input states to default values."""
         self.input_state = InputState()
+        self._current_controls = None
         self.pressed_keys.clear()
         self.just_pressed_keys.clear()
         self.just_released_keys.clear()
-        self._previous_keys.clear()
-        self.input_history.clear()
+        self._pending_pressed.clear()
+        self._pending_released.clear()
+        self.input_history.fill(0.0)
+        self._history_index = 0
     
     def set_key_mapping(self, key: int, action: InputAction) -> None:
         """
@@ -426,7 +468,10 @@ class InputManager:
             key: Pygame key constant
             action: Action to map to the key
         """
-        self.config.key_mappings[key] = action
+        key_mappings = dict(self.config.key_mappings)
+        key_mappings[key] = action
+        self.config = replace(self.config, key_mappings=key_mappings)
+        self._current_controls = None
     
     def remove_key_mapping(self, key: int) -> None:
         """
@@ -436,7 +481,10 @@ class InputManager:
             key: Pygame key constant to remove
         """
         if key in self.config.key_mappings:
-            del self.config.key_mappings[key]
+            key_mappings = dict(self.config.key_mappings)
+            del key_mappings[key]
+            self.config = replace(self.config, key_mappings=key_mappings)
+            self._current_controls = None
     
     def get_key_mappings(self) -> Dict[int, InputAction]:
         """
@@ -445,4 +493,4 @@ class InputManager:
         Returns:
             Dictionary of key mappings
         """
-        return self.config.key_mappings.copy()
\ No newline at end of file
+        return dict(self.config.key_mappings)
\ No newline at end of file
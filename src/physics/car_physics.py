@@ -15,6 +15,9 @@ import math
 class CarPhysicsConfig:
     """Configuration for car physics parameters."""
     
+    # Name of the physics model this configuration belongs to
+    model: str = 'custom'
+    
     # Basic car properties
     mass: float = 1000.0  # Car mass in kg
     width: float = 40.0   # Car width in pixels
@@ -38,6 +41,24 @@ class CarPhysicsConfig:
     collision_friction: float = 0.8    # Friction during collisions
 
 
+@dataclass(slots=True)
+class CarPhysicsInfo:
+    """
+    Preallocated snapshot of per-frame car physics values.
+    
+    Filled in place by CarBody.fill_physics_info so debug overlays can
+    reuse one instance instead of building a get_physics_info() dict.
+    """
+    
+    speed: float = 0.0
+    forward_speed: float = 0.0
+    lateral_speed: float = 0.0
+    is_sliding: bool = False
+    throttle: float = 0.0
+    steering: float = 0.0
+    brake: float = 0.0
+
+
 class CarPhysicsPresets:
     """Predefined physics configurations for different driving experiences."""
     
@@ -45,6 +66,7 @@ class CarPhysicsPresets:
     def arcade() -> CarPhysicsConfig:
         """Arcade physics: responsive, forgiving, fun-focused."""
         return CarPhysicsConfig(
+            model='arcade',
             mass=800.0,  # Lighter for more responsive feel
             friction=0.9,  # High friction for easy control
             max_force=50000.0,  # Much higher force for racing speeds
@@ -61,6 +83,7 @@ class CarPhysicsPresets:
     def realistic() -> CarPhysicsConfig:
         """Realistic physics: authentic car handling simulation."""
         return CarPhysicsConfig(
+            model='realistic',
             mass=1200.0,  # Heavier, more realistic mass
             friction=0.6,  # Lower friction, more sliding
             max_force=35000.0,  # Higher force for realistic acceleration
@@ -202,38 +225,67 @@ class CarBody:
         velocity = self.body.velocity
         speed = velocity.length
         
-        # Calculate speed-dependent handling degradation
-        speed_factor = 1.0
-        if speed > self.config.high_speed_threshold:
-            excess_speed = speed - self.config.high_speed_threshold
-            speed_factor = 1.0 - (excess_speed / 200.0) * self.config.handling_degradation
-            speed_factor = max(0.1, speed_factor)  # Don't completely lose control
+        self.apply_drive_forces(*self.get_drive_forces(speed))
+        self.apply_resistance(velocity, speed)
+    
+    def get_drive_forces(self, speed: float) -> Tuple[float, float]:
+        """
+        Calculate the driving force and steering torque for the current controls.
+        
+        The force is along the car's forward axis, so it stays valid in the
+        body's own frame while the car turns.
         
-        # Apply throttle force
-        if abs(self.throttle) > 0.01:
-            # Calculate forward direction
-            forward = pymunk.Vec2d(math.cos(self.body.angle), math.sin(self.body.angle))
-            
-            # Apply driving force
-            force_magnitude = self.throttle * self.config.max_force
-            driving_force = forward * force_magnitude
+        Args:
+            speed: Current speed of the body
             
-            self.body.apply_force_at_world_point(driving_force, self.body.position)
+        Returns:
+            Tuple of (forward_force, torque)
+        """
+        # Throttle force along the forward direction
+        forward_force = 0.0
+        if abs(self.throttle) > 0.01:
+            forward_force = self.throttle * self.config.max_force
         
-        # Apply steering torque
+        # Steering torque
+        torque = 0.0
         if abs(self.steering) > 0.01:
             # For arcade physics, maintain responsive steering at all speeds
             # For realistic physics, reduce steering at very high speeds only
             if speed > self.config.high_speed_threshold * 1.5:  # Only at very high speeds
+                # Speed-dependent handling degradation
+                excess_speed = speed - self.config.high_speed_threshold
+                speed_factor = 1.0 - (excess_speed / 200.0) * self.config.handling_degradation
+                speed_factor = max(0.1, speed_factor)  # Don't completely lose control
                 effective_steering = self.steering * speed_factor
             else:
                 effective_steering = self.steering
             
-            # Apply steering torque
             torque = effective_steering * self.config.max_torque
-            self.body.torque = torque
-        else:
-            self.body.torque = 0
+        
+        return forward_force, torque
+    
+    def apply_drive_forces(self, forward_force: float, torque: float) -> None:
+        """
+        Apply a driving force and steering torque from get_drive_forces().
+        
+        Args:
+            forward_force: Driving force along the car's forward axis
+            torque: Steering torque
+        """
+        body = self.body
+        if forward_force:
+            body.apply_force_at_local_point((forward_force, 0))
+        body.torque = torque
+    
+    def apply_resistance(self, velocity: pymunk.Vec2d, speed: float) -> None:
+        """
+        Apply braking and damping, which oppose the current motion.
+        
+        Args:
+            velocity: Current velocity of the body
+            speed: Current speed of the body
+        """
+        body = self.body
         
         # Apply braking
         if self.brake > 0.01:
@@ -241,18 +293,18 @@ class CarBody:
             if speed > 0.1:  # Only brake if moving
                 brake_direction = -velocity.normalized()
                 brake_force = brake_direction * (self.brake * self.config.max_force * 1.5)
-                self.body.apply_force_at_world_point(brake_force, self.body.position)
+                body.apply_force_at_world_point(brake_force, body.position)
         
         # Apply damping (air resistance and rolling resistance)
         if speed > 0.1:
             # Linear damping
             linear_drag = -velocity * self.config.linear_damping * speed
-            self.body.apply_force_at_world_point(linear_drag, self.body.position)
+            body.apply_force_at_world_point(linear_drag, body.position)
         
         # Angular damping
-        if abs(self.body.angular_velocity) > 0.01:
-            angular_drag = -self.body.angular_velocity * self.config.angular_damping
-            self.body.torque += angular_drag
+        if abs(body.angular_velocity) > 0.01:
+            angular_drag = -body.angular_velocity * self.config.angular_damping
+            body.torque += angular_drag
     
     def get_forward_vector(self) -> pymunk.Vec2d:
         """Get the car's forward direction vector."""
@@ -341,10 +393,12 @@ class CarBody:
         Returns:
             Dictionary with car physics data
         """
+        position = self.body.position
+        velocity = self.body.velocity
         return {
-            'position': tuple(self.body.position),
+            'position': (position.x, position.y),
             'angle': self.body.angle,
-            'velocity': tuple(self.body.velocity),
+            'velocity': (velocity.x, velocity.y),
             'angular_velocity': self.body.angular_velocity,
             'speed': self.get_speed(),
             'forward_speed': self.get_forward_speed(),
@@ -357,6 +411,25 @@ class CarBody:
             'friction': self.shape.friction
         }
     
+    def fill_physics_info(self, out: CarPhysicsInfo) -> CarPhysicsInfo:
+        """
+        Write current physics values into a reusable info object.
+        
+        Args:
+            out: Info object to update in place
+            
+        Returns:
+            The same info object, for convenience
+        """
+        out.speed = self.get_speed()
+        out.forward_speed = self.get_forward_speed()
+        out.lateral_speed = self.get_lateral_speed()
+        out.is_sliding = self.is_sliding()
+        out.throttle = self.throttle
+        out.steering = self.steering
+        out.brake = self.brake
+        return out
+    
     def cleanup(self) -> None:
         """Remove car from physics space and clean up resources."""
         if self.body in self.space.bodies:
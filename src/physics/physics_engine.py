@@ -6,7 +6,7 @@ supporting both arcade and realistic physics models with debug rendering capabil
 """
 
 from dataclasses import dataclass
-from typing import List, Optional, Tuple, Dict, Any
+from typing import Callable, List, Optional, Tuple, Dict, Any
 import pymunk
 import pygame
 import math
@@ -20,6 +20,7 @@ class PhysicsConfig:
     gravity: Tuple[float, float] = (0, 0)  # Top-down view, no gravity
     damping: float = 0.1  # Air resistance/global damping
     time_step: float = 1.0 / 60.0  # 60 FPS physics
+    max_steps_per_frame: int = 5  # Cap on catch-up steps in advance()
     iterations: int = 10  # Pymunk solver iterations for accuracy
     
     # Model-specific parameters
@@ -54,6 +55,9 @@ class PhysicsEngine:
         # Track all bodies for debug rendering
         self.tracked_bodies: List[pymunk.Body] = []
         
+        # Frame time not yet simulated by advance()
+        self._accumulator = 0.0
+        
         self._configure_space()
     
     def _configure_space(self) -> None:
@@ -74,6 +78,45 @@ class PhysicsEngine:
         time_step = dt or self.config.time_step
         self.space.step(time_step)
     
+    def advance(self, frame_dt: float,
+                before_step: Optional[Callable[[float], None]] = None) -> int:
+        """
+        Advance the simulation by a frame's worth of time in fixed steps.
+        
+        Frame time is accumulated and consumed in config.time_step chunks so
+        the solver always integrates with the same step size. Leftover time
+        carries over to the next frame; see interpolation_alpha.
+        
+        Args:
+            frame_dt: Real time elapsed since the last frame, in seconds
+            before_step: Optional callback run before each step with the step
+                size, e.g. to apply forces (Pymunk clears forces every step)
+            
+        Returns:
+            Number of physics steps taken this frame
+        """
+        time_step = self.config.time_step
+        self._accumulator += frame_dt
+        
+        steps = 0
+        while self._accumulator >= time_step and steps < self.config.max_steps_per_frame:
+            if before_step is not None:
+                before_step(time_step)
+            self.space.step(time_step)
+            self._accumulator -= time_step
+            steps += 1
+        
+        # Drop time we couldn't catch up on instead of spiralling next frame
+        if steps == self.config.max_steps_per_frame:
+            self._accumulator = min(self._accumulator, time_step)
+        
+        return steps
+    
+    @property
+    def interpolation_alpha(self) -> float:
+        """Fraction of a fixed step left unsimulated, for render interpolation."""
+        return min(self._accumulator / self.config.time_step, 1.0)
+    
     def add_body(self, body: pymunk.Body, shape: pymunk.Shape) -> None:
         """
         Add a body and shape to the physics world.
@@ -193,8 +236,14 @@ class PhysicsEngine:
         self.debug_enabled = False
         self.debug_renderer = None
     
-    def render_debug(self) -> None:
-        """Render debug visualization of all physics bodies."""
+    def render_debug(self, include_static: bool = True) -> None:
+        """
+        Render debug visualization of all physics bodies.
+        
+        Args:
+            include_static: Whether to draw static shapes. Callers that
+                pre-render static geometry once can skip it every frame.
+        """
         if not self.debug_enabled or not self.debug_renderer:
             return
         
@@ -211,6 +260,8 @@ class PhysicsEngine:
             if body.body_type == pymunk.Body.DYNAMIC:
                 color = DYNAMIC_COLOR
             elif body.body_type == pymunk.Body.STATIC:
+                if not include_static:
+                    continue
                 color = STATIC_COLOR
             else:  # KINEMATIC
                 color = KINEMATIC_COLOR
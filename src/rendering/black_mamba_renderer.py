@@ -5,11 +5,15 @@ Implements the clean, minimalist aesthetic with muted colors and geometric shape
 characteristic of classic mobile racing games like Black Mamba Racer.
 """
 
+import os
 import pygame
 import math
-from typing import Tuple, List, Optional
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Tuple, List, Optional
 from dataclasses import dataclass
 
+from src.utils.fonts import get_font
+
 
 @dataclass
 class ColorPalette:
@@ -44,45 +48,145 @@ class BlackMambaRenderer:
     with muted color palette and minimalist design principles.
     """
     
-    def __init__(self, screen_width: int, screen_height: int):
+    def __init__(self, screen_width: int, screen_height: int, display_flags: int = 0):
         """
         Initialize the Black Mamba renderer.
         
         Args:
             screen_width: Width of the game screen in pixels
             screen_height: Height of the game screen in pixels
+            display_flags: pygame display flags; pygame.SCALED presents frames
+                through an SDL hardware renderer texture, falling back to a
+                plain software window when no renderer can be created
         """
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.colors = ColorPalette()
         
+        # Let SDL batch consecutive draws when a hardware renderer is used
+        os.environ.setdefault("SDL_RENDER_BATCHING", "1")
+        
         # Initialize pygame surfaces
-        self.screen = pygame.display.set_mode((screen_width, screen_height))
-        self.track_surface = pygame.Surface((screen_width * 2, screen_height * 2))
-        self.ui_surface = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
+        try:
+            self.screen = pygame.display.set_mode((screen_width, screen_height), display_flags)
+        except pygame.error:
+            if not display_flags & (pygame.SCALED | pygame.OPENGL):
+                raise
+            # No hardware renderer available (e.g. dummy or headless video driver)
+            display_flags &= ~(pygame.SCALED | pygame.OPENGL)
+            self.screen = pygame.display.set_mode((screen_width, screen_height), display_flags)
+        self.display_flags = display_flags
+        self.track_surface = self._to_display_format(
+            pygame.Surface((screen_width * 2, screen_height * 2)), alpha=False)
+        self.ui_surface = self._to_display_format(
+            pygame.Surface((screen_width, screen_height), pygame.SRCALPHA))
+        
+        # Pre-filled background blitted by clear_screen
+        self._background = self._to_display_format(
+            pygame.Surface((screen_width, screen_height)), alpha=False)
+        self._background.fill(self.colors.BACKGROUND_GRAY)
         
-        # Car sprite cache for different angles
-        self._car_sprite_cache = {}
+        # Regions of the UI surface drawn since the last clear
+        self._ui_dirty_rects: List[pygame.Rect] = []
+        self._max_ui_dirty_rects = 64
+        
+        # Car sprite cache: pre-rotated sprites per color at fixed angle steps
+        self._car_sprite_cache: Dict[Tuple[int, int, int], List[pygame.Surface]] = {}
         self._car_sprite_size = (20, 12)
+        self._car_rotation_step = 5  # degrees between cached rotations
+        
+        # Solid-color fill surfaces, cropped with a blit area to any rect size
+        self._fill_surface_cache: Dict[Tuple[int, int, int], pygame.Surface] = {}
+        
+        # Pre-baked mini-map: (track_points, size, background, transform)
+        self._mini_map_cache: Optional[Tuple[Any, Tuple[int, int], pygame.Surface,
+                                             Optional[Tuple[float, float, float]]]] = None
+        
+        # Pre-rendered tire barrier sprites keyed by radius
+        self._tire_sprite_cache: Dict[int, pygame.Surface] = {}
+        
+        # World-to-screen camera offset applied to world-space draws
+        self.camera_offset: Tuple[float, float] = (0.0, 0.0)
+        
+        # Car sprites collected during the frame and flushed in one batch
+        self._pending_car_blits: List[Tuple[pygame.Surface, pygame.Rect]] = []
         
         # Initialize fonts for clean typography
         pygame.font.init()
-        self.font_small = pygame.font.Font(None, 24)
-        self.font_medium = pygame.font.Font(None, 32)
-        self.font_large = pygame.font.Font(None, 48)
+        self.font_small = get_font(24)
+        self.font_medium = get_font(32)
+        self.font_large = get_font(48)
+        self._fonts = {
+            "small": self.font_small,
+            "medium": self.font_medium,
+            "large": self.font_large
+        }
+        
+        # Glyph atlas and rendered-string cache for HUD text
+        self._glyph_cache: Dict[Tuple[str, Tuple[int, int, int], str], pygame.Surface] = {}
+        self._text_cache: OrderedDict = OrderedDict()
+        self._text_cache_size = 256
+        
+        # Last value and surface drawn for each named HUD field
+        self._hud_fields: Dict[str, Tuple[Any, pygame.Surface]] = {}
+    
+    def _to_display_format(self, surface: pygame.Surface, alpha: bool = True) -> pygame.Surface:
+        """
+        Convert a surface to the display pixel format for fast blitting.
+        
+        Args:
+            surface: Surface to convert
+            alpha: Whether to keep per-pixel alpha (convert_alpha vs convert)
+            
+        Returns:
+            Converted pygame.Surface
+        """
+        if alpha:
+            # convert_alpha always yields 32-bit pixels, whatever the display depth
+            return surface.convert_alpha()
+        # Match the screen's own format rather than trusting the display default
+        return surface.convert(self.screen)
     
     def clear_screen(self) -> None:
         """Clear the screen with background color."""
-        self.screen.fill(self.colors.BACKGROUND_GRAY)
+        self._pending_car_blits.clear()  # Anything queued is erased anyway
+        self.screen.blit(self._background, (0, 0))
     
     def clear_ui_surface(self) -> None:
-        """Clear the UI overlay surface."""
-        self.ui_surface.fill((0, 0, 0, 0))  # Transparent
+        """Clear the regions of the UI overlay surface drawn since the last clear."""
+        for rect in self._ui_dirty_rects:
+            self.ui_surface.fill((0, 0, 0, 0), rect)  # Transparent
+        self._ui_dirty_rects.clear()
+    
+    def _mark_ui_dirty(self, rects: Iterable[pygame.Rect]) -> None:
+        """
+        Record UI surface regions that need clearing on the next frame.
+        
+        Args:
+            rects: Rectangles drawn on the UI surface
+        """
+        self._ui_dirty_rects.extend(rects)
+        if len(self._ui_dirty_rects) > self._max_ui_dirty_rects:
+            # Collapse into one bounding rect so the list stays bounded
+            bounds = self._ui_dirty_rects[0].unionall(self._ui_dirty_rects[1:])
+            self._ui_dirty_rects = [bounds]
+    
+    def set_camera(self, offset: Tuple[float, float]) -> None:
+        """
+        Set the camera offset subtracted from world-space positions.
+        
+        Args:
+            offset: (x, y) world position of the top-left corner of the screen
+        """
+        self.camera_offset = (offset[0], offset[1])
     
     def generate_car_sprite(self, color: Tuple[int, int, int], angle: float = 0.0) -> pygame.Surface:
         """
         Generate a geometric arrow-like car sprite.
         
+        All rotations for a color are rendered on first use and the angle is
+        snapped to the nearest cached step, so drawing never rotates pixels.
+        
         Args:
             color: RGB color tuple for the car
             angle: Rotation angle in degrees
@@ -90,10 +194,28 @@ class BlackMambaRenderer:
         Returns:
             pygame.Surface containing the car sprite
         """
-        cache_key = (color, int(angle))
-        if cache_key in self._car_sprite_cache:
-            return self._car_sprite_cache[cache_key]
+        sprites = self._car_sprite_cache.get(color)
+        if sprites is None:
+            base = self._build_car_sprite(color)
+            sprites = [
+                self._to_display_format(pygame.transform.rotate(base, -step_angle))
+                for step_angle in range(0, 360, self._car_rotation_step)
+            ]
+            self._car_sprite_cache[color] = sprites
+        
+        index = int(round(angle / self._car_rotation_step)) % len(sprites)
+        return sprites[index]
+    
+    def _build_car_sprite(self, color: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Draw the unrotated car sprite (pointing right).
         
+        Args:
+            color: RGB color tuple for the car
+            
+        Returns:
+            pygame.Surface containing the car sprite
+        """
         width, height = self._car_sprite_size
         surface = pygame.Surface((width, height), pygame.SRCALPHA)
         
@@ -113,30 +235,116 @@ class BlackMambaRenderer:
         # Add small accent details
         pygame.draw.circle(surface, self.colors.LIGHT_GRAY, (6, height // 2), 2)
         
-        # Rotate if needed
-        if angle != 0:
-            surface = pygame.transform.rotate(surface, -angle)
-        
-        # Cache the sprite
-        self._car_sprite_cache[cache_key] = surface
         return surface
     
     def draw_car(self, position: Tuple[float, float], angle: float, 
-                 color: Tuple[int, int, int] = None) -> None:
+                 color: Tuple[int, int, int] = None,
+                 camera: Optional[Tuple[float, float]] = None) -> None:
         """
-        Draw a car at the specified position and angle.
+        Queue a car at the specified position and angle.
+        
+        Cars are collected and blitted together by flush_car_draws(), which
+        runs before any other screen drawing and at present().
         
         Args:
             position: (x, y) position in world coordinates
             angle: Rotation angle in degrees
             color: Car color (defaults to light gray)
+            camera: Camera offset for this draw (defaults to camera_offset)
         """
         if color is None:
             color = self.colors.LIGHT_GRAY
         
         sprite = self.generate_car_sprite(color, angle)
-        rect = sprite.get_rect(center=position)
-        self.screen.blit(sprite, rect)
+        camera_x, camera_y = camera if camera is not None else self.camera_offset
+        rect = sprite.get_rect(center=(position[0] - camera_x, position[1] - camera_y))
+        self._pending_car_blits.append((sprite, rect))
+    
+    def flush_car_draws(self) -> None:
+        """Blit all queued cars to the screen in a single batch."""
+        if self._pending_car_blits:
+            self.screen.blits(self._pending_car_blits, doreturn=False)
+            self._pending_car_blits.clear()
+    
+    def _draw_target(self, surface: Optional[pygame.Surface]) -> pygame.Surface:
+        """
+        Resolve the target surface for a draw call.
+        
+        Queued cars are flushed first when drawing to the screen so draw
+        order is preserved.
+        
+        Args:
+            surface: Requested target surface, or None for the screen
+            
+        Returns:
+            Surface to draw on
+        """
+        if surface is None or surface is self.screen:
+            self.flush_car_draws()
+            return self.screen
+        return surface
+    
+    def _get_fill_surface(self, color: Tuple[int, int, int],
+                          size: Tuple[int, int]) -> pygame.Surface:
+        """
+        Get a solid-color surface at least as large as the requested size.
+        
+        Args:
+            color: RGB fill color
+            size: Minimum (width, height) needed
+            
+        Returns:
+            pygame.Surface filled with the color
+        """
+        surface = self._fill_surface_cache.get(color)
+        if surface is None or surface.get_width() < size[0] or surface.get_height() < size[1]:
+            if surface is not None:
+                size = (max(size[0], surface.get_width()), max(size[1], surface.get_height()))
+            surface = self._to_display_format(pygame.Surface(size), alpha=False)
+            surface.fill(color)
+            self._fill_surface_cache[color] = surface
+        return surface
+    
+    def fill_rects(self, rects: Iterable[Tuple[Tuple[int, int, int], Any]],
+                   surface: Optional[pygame.Surface] = None) -> None:
+        """
+        Fill several solid rectangles with a single batched blit.
+        
+        Rectangles are drawn in order, so later entries cover earlier ones.
+        
+        Args:
+            rects: Iterable of (color, rect) pairs; rects are pygame.Rect or
+                (x, y, width, height) tuples
+            surface: Target surface (defaults to the screen)
+        """
+        target = self._draw_target(surface)
+        blit_sequence = []
+        for color, rect in rects:
+            x, y, width, height = rect
+            if width <= 0 or height <= 0:
+                continue
+            fill = self._get_fill_surface(color, (width, height))
+            blit_sequence.append((fill, (x, y), (0, 0, width, height)))
+        target.blits(blit_sequence, doreturn=False)
+    
+    def _get_tire_sprite(self, radius: int) -> pygame.Surface:
+        """
+        Get a pre-rendered tire barrier sprite for the given radius.
+        
+        Args:
+            radius: Radius of the tire barrier in pixels
+            
+        Returns:
+            pygame.Surface containing the tire barrier
+        """
+        sprite = self._tire_sprite_cache.get(radius)
+        if sprite is None:
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, self.colors.TIRE_BARRIER_BLACK, (radius, radius), radius)
+            pygame.draw.circle(sprite, self.colors.LIGHT_GRAY, (radius, radius), radius, 1)
+            sprite = self._to_display_format(sprite)
+            self._tire_sprite_cache[radius] = sprite
+        return sprite
     
     def draw_tire_barrier(self, position: Tuple[float, float], radius: float = 8) -> None:
         """
@@ -146,34 +354,60 @@ class BlackMambaRenderer:
             position: (x, y) center position
             radius: Radius of the tire barrier
         """
-        pygame.draw.circle(self.screen, self.colors.TIRE_BARRIER_BLACK, 
-                          (int(position[0]), int(position[1])), int(radius))
-        pygame.draw.circle(self.screen, self.colors.LIGHT_GRAY, 
-                          (int(position[0]), int(position[1])), int(radius), 1)
+        self.draw_tire_barriers([position], radius)
+    
+    def draw_tire_barriers(self, centers: Iterable[Tuple[float, float]],
+                           radius: float = 8,
+                           surface: Optional[pygame.Surface] = None) -> None:
+        """
+        Draw several tire barriers with a single batched blit.
+        
+        Args:
+            centers: Iterable of (x, y) center positions
+            radius: Radius of the tire barriers
+            surface: Target surface (defaults to the screen)
+        """
+        radius = int(radius)
+        sprite = self._get_tire_sprite(radius)
+        target = self._draw_target(surface)
+        target.blits(
+            [(sprite, (int(x) - radius, int(y) - radius)) for x, y in centers],
+            doreturn=False
+        )
     
-    def draw_checkered_pattern(self, rect: pygame.Rect, square_size: int = 8) -> None:
+    def draw_checkered_pattern(self, rect: pygame.Rect, square_size: int = 8,
+                               surface: Optional[pygame.Surface] = None) -> None:
         """
         Draw a checkered pattern within the given rectangle.
         
         Args:
             rect: Rectangle to fill with checkered pattern
             square_size: Size of each checkered square
+            surface: Target surface (defaults to the screen)
         """
-        for x in range(rect.left, rect.right, square_size):
-            for y in range(rect.top, rect.bottom, square_size):
-                # Determine if this square should be dark or light
-                square_x = (x - rect.left) // square_size
-                square_y = (y - rect.top) // square_size
-                is_dark = (square_x + square_y) % 2 == 0
-                
-                color = self.colors.CHECKERED_DARK if is_dark else self.colors.CHECKERED_LIGHT
-                square_rect = pygame.Rect(x, y, square_size, square_size)
-                clipped_rect = square_rect.clip(rect)  # Clip to boundary
-                if clipped_rect.width > 0 and clipped_rect.height > 0:
-                    pygame.draw.rect(self.screen, color, clipped_rect)
+        target = self._draw_target(surface)
+        
+        # Hold one lock for the whole burst of small draws
+        target.lock()
+        try:
+            for x in range(rect.left, rect.right, square_size):
+                for y in range(rect.top, rect.bottom, square_size):
+                    # Determine if this square should be dark or light
+                    square_x = (x - rect.left) // square_size
+                    square_y = (y - rect.top) // square_size
+                    is_dark = (square_x + square_y) % 2 == 0
+                    
+                    color = self.colors.CHECKERED_DARK if is_dark else self.colors.CHECKERED_LIGHT
+                    square_rect = pygame.Rect(x, y, square_size, square_size)
+                    clipped_rect = square_rect.clip(rect)  # Clip to boundary
+                    if clipped_rect.width > 0 and clipped_rect.height > 0:
+                        pygame.draw.rect(target, color, clipped_rect)
+        finally:
+            target.unlock()
     
     def draw_track_boundary(self, points: List[Tuple[float, float]], 
-                           width: float = 20, use_checkered: bool = True) -> None:
+                           width: float = 20, use_checkered: bool = True,
+                           surface: Optional[pygame.Surface] = None) -> None:
         """
         Draw track boundary with tire barriers or checkered pattern.
         
@@ -181,42 +415,50 @@ class BlackMambaRenderer:
             points: List of points defining the boundary
             width: Width of the boundary
             use_checkered: Whether to use checkered pattern or tire barriers
+            surface: Target surface (defaults to the screen)
         """
         if len(points) < 2:
             return
         
+        target = self._draw_target(surface)
+        
         if use_checkered:
-            # Draw checkered boundary
-            for i in range(len(points) - 1):
-                start = points[i]
-                end = points[i + 1]
+            # Draw checkered boundary, holding one lock for all segments
+            target.lock()
+            try:
+                for i in range(len(points) - 1):
+                    start = points[i]
+                    end = points[i + 1]
                 
-                # Calculate perpendicular vector for width
-                dx = end[0] - start[0]
-                dy = end[1] - start[1]
-                length = math.sqrt(dx*dx + dy*dy)
-                if length == 0:
-                    continue
+                    # Calculate perpendicular vector for width
+                    dx = end[0] - start[0]
+                    dy = end[1] - start[1]
+                    length = math.sqrt(dx*dx + dy*dy)
+                    if length == 0:
+                        continue
                 
-                # Normalize and get perpendicular
-                dx /= length
-                dy /= length
-                perp_x = -dy * width / 2
-                perp_y = dx * width / 2
+                    # Normalize and get perpendicular
+                    dx /= length
+                    dy /= length
+                    perp_x = -dy * width / 2
+                    perp_y = dx * width / 2
                 
-                # Create rectangle for this segment
-                rect_points = [
-                    (start[0] + perp_x, start[1] + perp_y),
-                    (start[0] - perp_x, start[1] - perp_y),
-                    (end[0] - perp_x, end[1] - perp_y),
-                    (end[0] + perp_x, end[1] + perp_y)
-                ]
+                    # Create rectangle for this segment
+                    rect_points = [
+                        (start[0] + perp_x, start[1] + perp_y),
+                        (start[0] - perp_x, start[1] - perp_y),
+                        (end[0] - perp_x, end[1] - perp_y),
+                        (end[0] + perp_x, end[1] + perp_y)
+                    ]
                 
-                # Draw the segment
-                pygame.draw.polygon(self.screen, self.colors.CHECKERED_DARK, rect_points)
+                    # Draw the segment
+                    pygame.draw.polygon(target, self.colors.CHECKERED_DARK, rect_points)
+            finally:
+                target.unlock()
         else:
             # Draw tire barriers along the boundary
             barrier_spacing = 16
+            centers = []
             for i in range(len(points) - 1):
                 start = points[i]
                 end = points[i + 1]
@@ -232,8 +474,73 @@ class BlackMambaRenderer:
                 num_barriers = max(1, int(length / barrier_spacing))
                 for j in range(num_barriers + 1):
                     t = j / num_barriers if num_barriers > 0 else 0
-                    pos = (start[0] + t * dx, start[1] + t * dy)
-                    self.draw_tire_barrier(pos)
+                    centers.append((start[0] + t * dx, start[1] + t * dy))
+            
+            self.draw_tire_barriers(centers, surface=target)
+    
+    def _get_glyph(self, font_size: str, color: Tuple[int, int, int],
+                   char: str) -> pygame.Surface:
+        """
+        Get a single pre-rendered glyph from the glyph atlas.
+        
+        Args:
+            font_size: "small", "medium", or "large"
+            color: Text color
+            char: Character to render
+            
+        Returns:
+            pygame.Surface containing the glyph
+        """
+        key = (font_size, color, char)
+        glyph = self._glyph_cache.get(key)
+        if glyph is None:
+            font = self._fonts.get(font_size, self.font_medium)
+            glyph = self._to_display_format(font.render(char, True, color))
+            self._glyph_cache[key] = glyph
+        return glyph
+    
+    def render_text(self, text: str, font_size: str = "medium",
+                    color: Tuple[int, int, int] = None) -> pygame.Surface:
+        """
+        Get a rendered text surface, composed from cached glyphs.
+        
+        Rendered strings are kept in a small LRU cache so repeated labels
+        cost a single dictionary lookup.
+        
+        Args:
+            text: Text to render
+            font_size: "small", "medium", or "large"
+            color: Text color (defaults to HUD_TEXT)
+            
+        Returns:
+            pygame.Surface containing the rendered text
+        """
+        if color is None:
+            color = self.colors.HUD_TEXT
+        
+        cache_key = (text, font_size, color)
+        surface = self._text_cache.get(cache_key)
+        if surface is not None:
+            self._text_cache.move_to_end(cache_key)
+            return surface
+        
+        # Lay out the string from the glyph atlas
+        glyph_blits = []
+        x = 0
+        for char in text:
+            glyph = self._get_glyph(font_size, color, char)
+            glyph_blits.append((glyph, (x, 0)))
+            x += glyph.get_width()
+        
+        font = self._fonts.get(font_size, self.font_medium)
+        surface = pygame.Surface((max(1, x), font.get_height()), pygame.SRCALPHA)
+        surface.blits(glyph_blits, doreturn=False)
+        surface = self._to_display_format(surface)
+        
+        self._text_cache[cache_key] = surface
+        if len(self._text_cache) > self._text_cache_size:
+            self._text_cache.popitem(last=False)
+        return surface
     
     def draw_hud_text(self, text: str, position: Tuple[int, int], 
                       font_size: str = "medium", color: Tuple[int, int, int] = None) -> None:
@@ -246,81 +553,181 @@ class BlackMambaRenderer:
             font_size: "small", "medium", or "large"
             color: Text color (defaults to HUD_TEXT)
         """
-        if color is None:
-            color = self.colors.HUD_TEXT
+        rect = self.ui_surface.blit(self.render_text(text, font_size, color), position)
+        self._mark_ui_dirty((rect,))
+    
+    def draw_hud_texts(self, items: Iterable[Tuple]) -> None:
+        """
+        Draw several HUD text entries with a single batched blit.
         
-        font = {
-            "small": self.font_small,
-            "medium": self.font_medium,
-            "large": self.font_large
-        }.get(font_size, self.font_medium)
+        Args:
+            items: Iterable of (text, position, font_size[, color]) tuples
+        """
+        blit_sequence = []
+        for text, position, *style in items:
+            blit_sequence.append((self.render_text(text, *style), position))
+        self._mark_ui_dirty(self.ui_surface.blits(blit_sequence))
+    
+    def _get_hud_field(self, field: str, value: Any, template: str,
+                       font_size: str = "medium",
+                       color: Tuple[int, int, int] = None) -> pygame.Surface:
+        """
+        Get the surface for a named HUD field, re-rendering only on change.
         
-        text_surface = font.render(text, True, color)
-        self.ui_surface.blit(text_surface, position)
+        Args:
+            field: Unique name of the HUD field (e.g. "speed")
+            value: Current value; quantize floats before passing them in
+            template: str.format template applied to the value
+            font_size: "small", "medium", or "large"
+            color: Text color (defaults to HUD_TEXT)
+            
+        Returns:
+            pygame.Surface containing the formatted field
+        """
+        state = (value, template, font_size, color)
+        cached = self._hud_fields.get(field)
+        if cached is not None and cached[0] == state:
+            return cached[1]
+        
+        surface = self.render_text(template.format(value), font_size, color)
+        self._hud_fields[field] = (state, surface)
+        return surface
     
-    def draw_mini_map(self, position: Tuple[int, int], size: Tuple[int, int],
-                      track_points: List[Tuple[float, float]], 
-                      car_positions: List[Tuple[float, float]]) -> None:
+    def draw_hud_field(self, field: str, value: Any, template: str,
+                       position: Tuple[int, int], font_size: str = "medium",
+                       color: Tuple[int, int, int] = None) -> None:
         """
-        Draw a minimalist mini-map in the corner.
+        Draw a formatted HUD value, skipping formatting when it is unchanged.
+        
+        Args:
+            field: Unique name of the HUD field (e.g. "speed")
+            value: Current value; quantize floats before passing them in
+            template: str.format template applied to the value
+            position: (x, y) position for the text
+            font_size: "small", "medium", or "large"
+            color: Text color (defaults to HUD_TEXT)
+        """
+        surface = self._get_hud_field(field, value, template, font_size, color)
+        self._mark_ui_dirty((self.ui_surface.blit(surface, position),))
+    
+    def draw_hud_fields(self, fields: Iterable[Tuple]) -> None:
+        """
+        Draw several formatted HUD values with a single batched blit.
+        
+        Args:
+            fields: Iterable of (field, value, template, position, font_size[, color])
+        """
+        blit_sequence = []
+        for field, value, template, position, *style in fields:
+            surface = self._get_hud_field(field, value, template, *style)
+            blit_sequence.append((surface, position))
+        self._mark_ui_dirty(self.ui_surface.blits(blit_sequence))
+    
+    def _get_mini_map_background(self, size: Tuple[int, int],
+                                 track_points: List[Tuple[float, float]]
+                                 ) -> Tuple[pygame.Surface, Optional[Tuple[float, float, float]]]:
+        """
+        Get the pre-baked mini-map background with the track outline.
+        
+        The background is rebuilt only when a different track_points object or
+        size is passed in; mutate-in-place changes to the list are not detected.
         
         Args:
-            position: (x, y) position of the mini-map
             size: (width, height) of the mini-map
             track_points: Track outline points
-            car_positions: Current car positions
+            
+        Returns:
+            Tuple of (background surface, (min_x, min_y, scale) or None when
+            the track cannot be scaled into the map)
         """
+        cached = self._mini_map_cache
+        if cached is not None and cached[0] is track_points and cached[1] == size:
+            return cached[2], cached[3]
+        
         # Draw mini-map background
-        map_rect = pygame.Rect(position[0], position[1], size[0], size[1])
-        pygame.draw.rect(self.ui_surface, self.colors.BACKGROUND_GRAY, map_rect)
-        pygame.draw.rect(self.ui_surface, self.colors.WHITE, map_rect, 1)
+        background = self._to_display_format(pygame.Surface(size), alpha=False)
+        map_rect = background.get_rect()
+        pygame.draw.rect(background, self.colors.BACKGROUND_GRAY, map_rect)
+        pygame.draw.rect(background, self.colors.WHITE, map_rect, 1)
         
-        if not track_points:
-            return
+        transform = None
+        if track_points:
+            # Calculate scale to fit track in mini-map
+            min_x = min(p[0] for p in track_points)
+            max_x = max(p[0] for p in track_points)
+            min_y = min(p[1] for p in track_points)
+            max_y = max(p[1] for p in track_points)
+            
+            track_width = max_x - min_x
+            track_height = max_y - min_y
+            
+            if track_width != 0 and track_height != 0:
+                scale_x = (size[0] - 10) / track_width
+                scale_y = (size[1] - 10) / track_height
+                scale = min(scale_x, scale_y)
+                transform = (min_x, min_y, scale)
+                
+                # Draw track outline
+                scaled_points = [
+                    (5 + (point[0] - min_x) * scale, 5 + (point[1] - min_y) * scale)
+                    for point in track_points
+                ]
+                if len(scaled_points) > 2:
+                    pygame.draw.lines(background, self.colors.LIGHT_GRAY, True, scaled_points, 2)
         
-        # Calculate scale to fit track in mini-map
-        min_x = min(p[0] for p in track_points)
-        max_x = max(p[0] for p in track_points)
-        min_y = min(p[1] for p in track_points)
-        max_y = max(p[1] for p in track_points)
+        self._mini_map_cache = (track_points, size, background, transform)
+        return background, transform
+    
+    def draw_mini_map(self, position: Tuple[int, int], size: Tuple[int, int],
+                      track_points: List[Tuple[float, float]], 
+                      car_positions: Iterable[Tuple[float, float]]) -> None:
+        """
+        Draw a minimalist mini-map in the corner.
         
-        track_width = max_x - min_x
-        track_height = max_y - min_y
+        Args:
+            position: (x, y) position of the mini-map
+            size: (width, height) of the mini-map
+            track_points: Track outline points
+            car_positions: Current car positions; any iterable of (x, y) pairs,
+                including an (N, 2) NumPy array
+        """
+        background, transform = self._get_mini_map_background(size, track_points)
+        self._mark_ui_dirty((self.ui_surface.blit(background, position),))
         
-        if track_width == 0 or track_height == 0:
+        if transform is None:
             return
         
-        scale_x = (size[0] - 10) / track_width
-        scale_y = (size[1] - 10) / track_height
-        scale = min(scale_x, scale_y)
-        
-        # Draw track outline
-        scaled_points = []
-        for point in track_points:
-            scaled_x = position[0] + 5 + (point[0] - min_x) * scale
-            scaled_y = position[1] + 5 + (point[1] - min_y) * scale
-            scaled_points.append((scaled_x, scaled_y))
-        
-        if len(scaled_points) > 2:
-            pygame.draw.lines(self.ui_surface, self.colors.LIGHT_GRAY, True, scaled_points, 2)
-        
-        # Draw car positions
-        for car_pos in car_positions:
-            scaled_x = position[0] + 5 + (car_pos[0] - min_x) * scale
-            scaled_y = position[1] + 5 + (car_pos[1] - min_y) * scale
-            pygame.draw.circle(self.ui_surface, self.colors.ACCENT_RED, 
-                             (int(scaled_x), int(scaled_y)), 2)
+        # Draw car positions (cars off the track bounds may land outside the map)
+        min_x, min_y, scale = transform
+        origin_x = position[0] + 5
+        origin_y = position[1] + 5
+        car_rects = []
+        self.ui_surface.lock()
+        try:
+            for car_pos in car_positions:
+                scaled_x = origin_x + (car_pos[0] - min_x) * scale
+                scaled_y = origin_y + (car_pos[1] - min_y) * scale
+                car_rects.append(pygame.draw.circle(self.ui_surface, self.colors.ACCENT_RED, 
+                                                    (int(scaled_x), int(scaled_y)), 2))
+        finally:
+            self.ui_surface.unlock()
+        self._mark_ui_dirty(car_rects)
     
     def present(self) -> None:
         """Present the final rendered frame to the screen."""
-        # Blit UI overlay on top of everything
+        # Blit queued cars, then the UI overlay on top of everything
+        self.flush_car_draws()
         self.screen.blit(self.ui_surface, (0, 0))
         pygame.display.flip()
     
     def get_screen_surface(self) -> pygame.Surface:
         """Get the main screen surface for direct drawing."""
+        # Direct drawing happens after anything already queued
+        self.flush_car_draws()
         return self.screen
     
     def get_ui_surface(self) -> pygame.Surface:
         """Get the UI overlay surface for HUD elements."""
+        # Direct drawing is untracked, so clear the whole overlay next frame
+        self._mark_ui_dirty((self.ui_surface.get_rect(),))
         return self.ui_surface
\ No newline at end of file
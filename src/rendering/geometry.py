@@ -0,0 +1,44 @@
+"""
+Small geometry kernels used by the rendering code.
+
+These helpers write into caller-provided buffers so per-frame drawing code
+can reuse the same arrays instead of allocating new ones every frame.
+"""
+
+import math
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+# Box outline as signed half-extents: rear-left, front-left, front-right, rear-right
+BOX_CORNER_SIGNS = np.array([[-1.0, -1.0], [1.0, -1.0], [1.0, 1.0], [-1.0, 1.0]])
+
+
+def rotate_box_corners(half_width: float, half_height: float, angle: float,
+                       center: Tuple[float, float],
+                       out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Compute the screen corners of a rotated box.
+    
+    Args:
+        half_width: Half of the box width (along its forward axis)
+        half_height: Half of the box height
+        angle: Rotation angle in radians
+        center: (x, y) center of the box
+        out: Optional preallocated int32 array of shape (4, 2) to fill
+        
+    Returns:
+        int32 array of shape (4, 2) with corner positions, truncated toward zero
+    """
+    if out is None:
+        out = np.empty((4, 2), dtype=np.int32)
+    
+    cos_a = math.cos(angle)
+    sin_a = math.sin(angle)
+    rotation = np.array([[cos_a * half_width, sin_a * half_width],
+                         [-sin_a * half_height, cos_a * half_height]])
+    
+    # Rotate scaled corner signs and translate, truncating like int()
+    np.trunc(BOX_CORNER_SIGNS @ rotation + center, out=out, casting='unsafe')
+    return out
@@ -0,0 +1,43 @@
+"""
+Shared font cache.
+
+Loading the default font is slow, so each size is created once and reused
+by every scene and renderer.
+"""
+
+from typing import Dict
+
+import pygame
+
+
+_font_cache: Dict[int, pygame.font.Font] = {}
+
+
+def get_font(size: int) -> pygame.font.Font:
+    """
+    Get the default pygame font at a given size, creating it on first use.
+    
+    Args:
+        size: Font size in pixels
+        
+    Returns:
+        Cached pygame.font.Font instance
+    """
+    font = _font_cache.get(size)
+    if font is None:
+        if not _font_cache:
+            # Fonts are invalid once pygame shuts down; pygame forgets quit
+            # callbacks after running them, so register again per fill
+            pygame.register_quit(clear_font_cache)
+        font = _font_cache[size] = pygame.font.Font(None, size)
+    return font
+
+
+def clear_font_cache() -> None:
+    """
+    Drop all cached fonts.
+    
+    Called automatically by pygame.quit(); call it directly after
+    pygame.font.quit() if fonts are used again after re-initializing.
+    """
+    _font_cache.clear()
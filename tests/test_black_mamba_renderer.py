@@ -4,6 +4,7 @@ Tests for the Black Mamba Racer rendering system.
 
 import pytest
 import pygame
+from unittest.mock import patch
 from src.rendering.black_mamba_renderer import BlackMambaRenderer, ColorPalette
 
 
@@ -46,6 +47,62 @@ class TestBlackMambaRenderer:
         assert renderer.track_surface is not None
         assert renderer.ui_surface is not None
     
+    def test_renderer_display_flags(self):
+        """Test renderer accepts display flags for hardware presentation."""
+        pygame.init()
+        renderer = BlackMambaRenderer(800, 600, pygame.SCALED)
+        
+        assert renderer.screen.get_size() == (800, 600)
+        renderer.clear_screen()
+        renderer.present()
+    
+    def test_renderer_display_flags_fallback(self):
+        """Test renderer drops SCALED when no hardware renderer can be created."""
+        pygame.init()
+        real_set_mode = pygame.display.set_mode
+        
+        def set_mode(size, flags=0):
+            if flags & pygame.SCALED:
+                raise pygame.error("failed to create renderer")
+            return real_set_mode(size, flags)
+        
+        with patch("pygame.display.set_mode", side_effect=set_mode) as mock_set_mode:
+            renderer = BlackMambaRenderer(800, 600, pygame.SCALED)
+        
+        assert mock_set_mode.call_count == 2
+        assert not renderer.display_flags & pygame.SCALED
+        assert renderer.screen.get_size() == (800, 600)
+    
+    def test_cached_surfaces_match_display_format(self, renderer):
+        """Test that cached surfaces are converted to the display format."""
+        assert renderer.track_surface.get_bitsize() == renderer.screen.get_bitsize()
+        
+        alpha_surfaces = [
+            renderer.ui_surface,
+            renderer.generate_car_sprite((100, 100, 100), 30),
+            renderer.render_text("Lap", "small"),
+        ]
+        
+        for surface in alpha_surfaces:
+            assert surface.get_bitsize() == 32
+            assert surface.get_flags() & pygame.SRCALPHA
+    
+    def test_alpha_surfaces_on_low_depth_display(self, renderer):
+        """Test alpha conversion does not assume the display is 32-bit."""
+        renderer.screen = pygame.Surface((800, 600), depth=16)
+        
+        surface = renderer._to_display_format(pygame.Surface((8, 8), pygame.SRCALPHA))
+        
+        assert surface.get_bitsize() == 32
+    
+    def test_opaque_surfaces_match_screen_format(self, renderer):
+        """Test opaque conversion follows the screen's depth."""
+        renderer.screen = pygame.Surface((800, 600), depth=16)
+        
+        surface = renderer._to_display_format(pygame.Surface((8, 8)), alpha=False)
+        
+        assert surface.get_bitsize() == 16
+    
     def test_car_sprite_generation(self, renderer):
         """Test car sprite generation."""
         color = (100, 100, 100)
@@ -76,6 +133,18 @@ class TestBlackMambaRenderer:
         # Different angles should produce different sprites
         assert sprite_0 is not sprite_90
     
+    def test_car_sprite_angle_bins(self, renderer):
+        """Test that angles snap to cached rotation steps."""
+        color = (100, 100, 100)
+        
+        # Nearby and full-turn angles share a sprite
+        assert renderer.generate_car_sprite(color, 44.0) is renderer.generate_car_sprite(color, 45.0)
+        assert renderer.generate_car_sprite(color, 405.0) is renderer.generate_car_sprite(color, 45.0)
+        assert renderer.generate_car_sprite(color, -90.0) is renderer.generate_car_sprite(color, 270.0)
+        
+        # Cache is bounded per color
+        assert len(renderer._car_sprite_cache[color]) == 360 // renderer._car_rotation_step
+    
     def test_clear_screen(self, renderer):
         """Test screen clearing."""
         # Should not raise any exceptions
@@ -86,6 +155,26 @@ class TestBlackMambaRenderer:
         # Should not raise any exceptions
         renderer.clear_ui_surface()
     
+    def test_clear_ui_surface_dirty_rects(self, renderer):
+        """Test that UI clearing only touches regions drawn since the last clear."""
+        renderer.draw_hud_text("Lap: 1/3", (10, 10), "medium")
+        renderer.draw_mini_map((650, 50), (140, 100), [(0, 0), (100, 0), (100, 100)], [(50, 50)])
+        assert len(renderer._ui_dirty_rects) > 0
+        assert renderer.ui_surface.get_at((651, 51)).a == 255
+        
+        renderer.clear_ui_surface()
+        
+        assert renderer._ui_dirty_rects == []
+        assert renderer.ui_surface.get_at((651, 51)).a == 0
+        assert renderer.ui_surface.get_bounding_rect().size == (0, 0)
+    
+    def test_ui_dirty_rects_bounded(self, renderer):
+        """Test that dirty rect tracking collapses when it grows too large."""
+        for i in range(renderer._max_ui_dirty_rects + 1):
+            renderer.draw_hud_text("x", (i, i), "small")
+        
+        assert len(renderer._ui_dirty_rects) == 1
+    
     def test_draw_car(self, renderer):
         """Test car drawing."""
         position = (100, 100)
@@ -95,6 +184,34 @@ class TestBlackMambaRenderer:
         # Should not raise any exceptions
         renderer.draw_car(position, angle, color)
     
+    def test_set_camera(self, renderer):
+        """Test that draw_car applies the camera offset."""
+        renderer.set_camera((100, 50))
+        assert renderer.camera_offset == (100, 50)
+        
+        renderer.clear_screen()
+        renderer.draw_car((500, 350), 0.0, (220, 50, 50))
+        renderer.flush_car_draws()
+        
+        # Car is drawn at world position minus camera offset
+        assert renderer.screen.get_at((400, 300))[:3] != renderer.colors.BACKGROUND_GRAY
+    
+    def test_draw_car_batched(self, renderer):
+        """Test that cars are queued and flushed in one batch."""
+        renderer.clear_screen()
+        renderer.draw_car((100, 100), 0.0, (220, 50, 50), camera=(0, 0))
+        renderer.draw_car((300, 100), 0.0, (220, 50, 50), camera=(100, 0))
+        
+        # Nothing reaches the screen until the flush
+        assert len(renderer._pending_car_blits) == 2
+        assert renderer.screen.get_at((100, 100))[:3] == renderer.colors.BACKGROUND_GRAY
+        
+        # Drawing directly to the screen flushes queued cars first
+        renderer.fill_rects([((0, 0, 0), (0, 0, 10, 10))])
+        assert renderer._pending_car_blits == []
+        assert renderer.screen.get_at((100, 100))[:3] != renderer.colors.BACKGROUND_GRAY
+        assert renderer.screen.get_at((200, 100))[:3] != renderer.colors.BACKGROUND_GRAY
+    
     def test_draw_tire_barrier(self, renderer):
         """Test tire barrier drawing."""
         position = (200, 200)
@@ -103,6 +220,33 @@ class TestBlackMambaRenderer:
         # Should not raise any exceptions
         renderer.draw_tire_barrier(position, radius)
     
+    def test_draw_tire_barriers(self, renderer):
+        """Test batched tire barrier drawing."""
+        renderer.clear_screen()
+        renderer.draw_tire_barriers([(100, 250), (160, 250)], 12)
+        
+        # Tire centers are filled and the sprite is shared
+        assert renderer.screen.get_at((100, 250))[:3] == renderer.colors.TIRE_BARRIER_BLACK
+        assert renderer.screen.get_at((160, 250))[:3] == renderer.colors.TIRE_BARRIER_BLACK
+        assert len(renderer._tire_sprite_cache) == 1
+    
+    def test_fill_rects(self, renderer):
+        """Test batched solid rectangle filling."""
+        renderer.clear_screen()
+        renderer.fill_rects([
+            ((40, 40, 40), (10, 10, 100, 50)),
+            ((0, 255, 0), pygame.Rect(20, 20, 30, 10)),
+            ((0, 255, 0), (200, 200, 0, 10)),  # Empty rects are skipped
+        ])
+        
+        assert renderer.screen.get_at((15, 15))[:3] == (40, 40, 40)
+        assert renderer.screen.get_at((25, 25))[:3] == (0, 255, 0)
+        assert renderer.screen.get_at((55, 25))[:3] == (40, 40, 40)
+        assert renderer.screen.get_at((200, 200))[:3] == renderer.colors.BACKGROUND_GRAY
+        
+        # Fill surfaces are cached per color and grow to fit
+        assert len(renderer._fill_surface_cache) == 2
+    
     def test_draw_checkered_pattern(self, renderer):
         """Test checkered pattern drawing."""
         rect = pygame.Rect(50, 50, 100, 100)
@@ -110,6 +254,22 @@ class TestBlackMambaRenderer:
         # Should not raise any exceptions
         renderer.draw_checkered_pattern(rect, 8)
     
+    def test_draw_to_background_surface(self, renderer):
+        """Test that static elements can be drawn into a cached surface."""
+        background = pygame.Surface((800, 600))
+        background.fill(renderer.colors.BACKGROUND_GRAY)
+        renderer.clear_screen()
+        
+        renderer.draw_checkered_pattern(pygame.Rect(50, 50, 100, 100), 8, surface=background)
+        renderer.draw_track_boundary([(200, 200), (300, 200)], width=20, surface=background)
+        renderer.draw_tire_barriers([(400, 400)], 10, surface=background)
+        
+        # Only the target surface is modified
+        assert background.get_at((51, 51))[:3] == renderer.colors.CHECKERED_DARK
+        assert background.get_at((250, 200))[:3] == renderer.colors.CHECKERED_DARK
+        assert background.get_at((400, 400))[:3] == renderer.colors.TIRE_BARRIER_BLACK
+        assert renderer.screen.get_at((51, 51))[:3] == renderer.colors.BACKGROUND_GRAY
+    
     def test_draw_track_boundary_checkered(self, renderer):
         """Test track boundary with checkered pattern."""
         points = [(0, 0), (100, 0), (100, 100), (0, 100)]
@@ -131,7 +291,63 @@ class TestBlackMambaRenderer:
         
         # Should not raise any exceptions
         renderer.draw_hud_text(text, position, "medium")
-    
+
+    def test_render_text_caching(self, renderer):
+        """Test that rendered strings and glyphs are cached."""
+        surface1 = renderer.render_text("Throttle", "small")
+        surface2 = renderer.render_text("Throttle", "small")
+
+        # Repeated strings should reuse the cached surface
+        assert surface1 is surface2
+        assert surface1.get_width() > 0
+
+        # Glyphs are shared between strings
+        glyph_count = len(renderer._glyph_cache)
+        renderer.render_text("Throttle", "small", (255, 255, 255))
+        renderer.render_text("tle", "small")
+        assert len(renderer._glyph_cache) == glyph_count + len(set("Throttle"))
+
+    def test_render_text_cache_limit(self, renderer):
+        """Test that the rendered string cache is bounded."""
+        for i in range(renderer._text_cache_size + 10):
+            renderer.render_text(f"{i}", "small")
+
+        assert len(renderer._text_cache) == renderer._text_cache_size
+
+    def test_draw_hud_texts(self, renderer):
+        """Test batched HUD text drawing."""
+        # Should not raise any exceptions
+        renderer.draw_hud_texts([
+            ("Speed: 85", (10, 10), "medium"),
+            ("SLIDING!", (10, 40), "medium", (255, 255, 0)),
+            ("Lap: 1/3", (10, 70)),
+        ])
+
+    def test_hud_field_caching(self, renderer):
+        """Test that HUD fields are only re-rendered when their value changes."""
+        surface1 = renderer._get_hud_field("speed", 85, "Speed: {} km/h", "small")
+        surface2 = renderer._get_hud_field("speed", 85, "Speed: {} km/h", "small")
+        surface3 = renderer._get_hud_field("speed", 86, "Speed: {} km/h", "small")
+
+        assert surface1 is surface2
+        assert surface3 is not surface1
+
+    def test_hud_field_template_change(self, renderer):
+        """Test that a new template re-renders a field with an unchanged value."""
+        surface1 = renderer._get_hud_field("status", 3, "Lap: {}", "small")
+        surface2 = renderer._get_hud_field("status", 3, "Position: {}", "small")
+
+        assert surface2 is not surface1
+
+    def test_draw_hud_fields(self, renderer):
+        """Test batched HUD field drawing."""
+        # Should not raise any exceptions
+        renderer.draw_hud_field("lap", 1, "Lap: {}/3", (20, 100), "medium")
+        renderer.draw_hud_fields([
+            ("speed", 85, "Speed: {} km/h", (10, 10), "medium"),
+            ("position", (10, 20), "Position: ({0[0]}, {0[1]})", (10, 40), "small"),
+        ])
+
     def test_draw_mini_map(self, renderer):
         """Test mini-map drawing."""
         position = (650, 50)
@@ -142,6 +358,19 @@ class TestBlackMambaRenderer:
         # Should not raise any exceptions
         renderer.draw_mini_map(position, size, track_points, car_positions)
     
+    def test_mini_map_background_cached(self, renderer):
+        """Test that the mini-map track outline is baked once per track."""
+        track_points = [(0, 0), (100, 0), (100, 100), (0, 100)]
+        
+        renderer.draw_mini_map((650, 50), (140, 100), track_points, [(50, 50)])
+        background = renderer._mini_map_cache[2]
+        renderer.draw_mini_map((650, 50), (140, 100), track_points, [(75, 25)])
+        assert renderer._mini_map_cache[2] is background
+        
+        # A new track invalidates the cached background
+        renderer.draw_mini_map((650, 50), (140, 100), list(track_points), [(75, 25)])
+        assert renderer._mini_map_cache[2] is not background
+    
     def test_present(self, renderer):
         """Test frame presentation."""
         # Should not raise any exceptions
@@ -8,10 +8,13 @@ import pytest
 import pygame
 import pymunk
 import math
+import numpy as np
 from unittest.mock import Mock, patch
 
 from src.entities.car import Car, CarState
-from src.physics.car_physics import CarPhysicsPresets
+from src.entities.car_fleet import CarFleet
+from src.entities._car_kernels import update_metrics, update_respawn, update_slip
+from src.physics.car_physics import CarPhysicsConfig, CarPhysicsPresets
 from src.rendering.black_mamba_renderer import BlackMambaRenderer
 
 
@@ -95,6 +98,14 @@ class TestCar:
         car1_duplicate = Car("ai_1", physics_space)
         assert car1_duplicate.car_color == car1.car_color
     
+    def test_ai_car_color_from_spawn_index(self, physics_space):
+        """Test that a spawn index cycles through the AI palette."""
+        cars = [Car(f"ai_{i}", physics_space, spawn_index=i) for i in range(4)]
+        
+        assert [car.car_color for car in cars] == [
+            (120, 120, 120), (80, 80, 80), (60, 60, 60), (120, 120, 120)
+        ]
+    
     def test_apply_controls(self, physics_space):
         """Test applying control inputs."""
         car = Car("test_car", physics_space)
@@ -201,6 +212,21 @@ class TestCar:
         assert realistic_friction < arcade_friction
         assert arcade_friction == initial_friction
     
+    def test_physics_model_name_from_config(self, physics_space):
+        """Test that the model name comes from the config, not its friction."""
+        grippy_custom = CarPhysicsConfig(friction=0.95)
+        realistic = Car("realistic", physics_space,
+                        physics_config=CarPhysicsPresets.realistic())
+        custom = Car("custom", physics_space, position=(200, 0),
+                     physics_config=grippy_custom)
+        
+        assert realistic.physics_model == 'realistic'
+        assert custom.physics_model == 'custom'
+        assert custom.get_car_info()['physics_model'] == 'custom'
+        
+        custom.switch_physics_model('arcade')
+        assert custom.physics_model == 'arcade'
+    
     def test_position_reset(self, physics_space):
         """Test position reset functionality."""
         car = Car("test_car", physics_space, position=(100, 100))
@@ -235,6 +261,41 @@ class TestCar:
         assert car.state.distance_traveled > 0
         assert car.state.top_speed > 0
     
+    def test_render_with_camera(self, physics_space, mock_renderer):
+        """Test that render passes the camera offset through to the renderer."""
+        car = Car("test_car", physics_space, position=(100, 200), car_color=(10, 20, 30))
+        
+        car.render(mock_renderer, camera=(50, 60))
+        
+        mock_renderer.draw_car.assert_called_once_with((100, 200), 0.0, (10, 20, 30), (50, 60))
+    
+    def test_render_crashed_car_darker(self, physics_space, mock_renderer):
+        """Test that crashed cars are drawn in the precomputed darker color."""
+        car = Car("test_car", physics_space, position=(100, 200), car_color=(40, 120, 200))
+        car.state.is_crashed = True
+        
+        car.render(mock_renderer)
+        
+        mock_renderer.draw_car.assert_called_once_with((100, 200), 0.0, (0, 70, 150), None)
+        
+        car.car_color = (100, 100, 100)
+        car.render(mock_renderer)
+        
+        assert mock_renderer.draw_car.call_args[0][2] == (50, 50, 50)
+    
+    def test_angle_degrees_cached(self, physics_space):
+        """Test that the degree conversion is reused until the body turns."""
+        car = Car("test_car", physics_space, angle=math.pi / 2)
+        
+        with patch('src.entities.car.math.degrees', wraps=math.degrees) as degrees:
+            assert car.get_angle_degrees() == pytest.approx(90.0)
+            assert car.get_angle_degrees() == pytest.approx(90.0)
+            assert degrees.call_count == 0
+            
+            car.physics_body.body.angle = math.pi
+            assert car.get_angle_degrees() == pytest.approx(180.0)
+            assert degrees.call_count == 1
+    
     def test_get_car_info(self, physics_space):
         """Test comprehensive car information retrieval."""
         car = Car("test_car", physics_space, is_player=True)
@@ -264,6 +325,89 @@ class TestCar:
         assert info['steering'] == 0.2
         assert info['brake'] == 0.1
     
+    def test_get_car_info_cached_until_change(self, physics_space):
+        """Test that car info is reused until the car changes."""
+        car = Car("test_car", physics_space)
+        
+        info = car.get_car_info()
+        assert car.get_car_info() is info
+        with pytest.raises(TypeError):
+            info['throttle'] = 1.0
+        with patch.object(car.physics_body, 'get_speed') as get_speed:
+            car.get_car_info()
+            get_speed.assert_not_called()
+        
+        car.apply_controls(0.5, 0.0, 0.0)
+        current = car.get_car_info()
+        assert current is not info
+        assert current['throttle'] == 0.5
+        assert info['throttle'] == 0.0
+        
+        car.complete_lap(30.0)
+        assert car.get_car_info()['current_lap'] == 1
+        
+        car.physics_body.body.position = (50, 60)
+        car.update(1/60.0)
+        assert car.get_car_info()['position'] == (50, 60)
+    
+    def test_fleet_update_invalidates_car_info(self, physics_space):
+        """Test that fleet updates refresh cached car info."""
+        fleet = CarFleet()
+        car = Car("test_car", physics_space, fleet=fleet)
+        info = car.get_car_info()
+        
+        fleet.update_all(1/60.0)
+        
+        assert car.get_car_info() is not info
+        assert car.get_car_info()['lap_time'] == pytest.approx(1/60.0)
+    
+    def test_fleet_car_info_sliding_matches_car(self, physics_space):
+        """Test that fleet car info reports sliding from the fleet's slip column."""
+        fleet = CarFleet()
+        car = Car("test_car", physics_space, fleet=fleet)
+        car.physics_body.body.velocity = (0, 200)  # Sideways at angle 0
+        fleet.update_all(1/60.0)
+        car.physics_body.body.velocity = (0, 0)  # Not seen until the next update
+        
+        assert car.is_sliding() is True
+        assert car.get_car_info()['is_sliding'] is True
+    
+    def test_info_view_updated_in_place(self, physics_space):
+        """Test that the HUD info view is reused and refreshed on update."""
+        car = Car("test_car", physics_space, position=(100, 200), is_player=True)
+        view = car.get_info_view()
+        
+        assert view.position == (100, 200)
+        assert view.physics_model == 'arcade'
+        
+        car.apply_controls(0.5, 0.2, 0.1)
+        assert view.throttle == 0.5
+        assert view.steering == 0.2
+        assert view.brake == 0.1
+        
+        car.physics_body.body.velocity = (100, 0)
+        car.update(0.016)
+        
+        # Same object, refreshed values
+        assert car.get_info_view() is view
+        assert view.speed == pytest.approx(car.get_speed())
+        assert view.top_speed == car.state.top_speed
+        
+        car.switch_physics_model('realistic')
+        assert view.physics_model == 'realistic'
+    
+    def test_info_view_refreshed_after_step(self, physics_space):
+        """Test that the info view can be brought up to date after a physics step."""
+        car = Car("test_car", physics_space, position=(100, 200))
+        car.physics_body.body.velocity = (60, 0)
+        car.update(1/60.0)
+        physics_space.step(1/60.0)
+        
+        car.refresh_info_view()
+        
+        assert car.get_info_view().position == pytest.approx(car.get_position())
+        assert car.get_info_view().position[0] > 100
+    
     def test_collision_callback(self, physics_space):
         """Test collision callback functionality."""
         car = Car("test_car", physics_space)
@@ -306,5 +450,280 @@ class TestCar:
         assert car.physics_body.shape not in physics_space.shapes
 
 
+class TestCarFleet:
+    """Test vectorized fleet updates."""
+    
+    @pytest.fixture
+    def physics_space(self):
+        """Create a Pymunk space for testing."""
+        space = pymunk.Space()
+        space.gravity = (0, 0)
+        return space
+    
+    def test_fleet_matches_individual_updates(self, physics_space):
+        """Test that update_all produces the same metrics as Car.update."""
+        fleet_space = pymunk.Space()
+        fleet = CarFleet(capacity=1)
+        fleet_cars = [Car(f"fleet_{i}", fleet_space, position=(100 * i, 0), fleet=fleet)
+                      for i in range(3)]
+        solo_cars = [Car(f"solo_{i}", physics_space, position=(100 * i, 0)) for i in range(3)]
+        
+        for i, (fleet_car, solo_car) in enumerate(zip(fleet_cars, solo_cars)):
+            fleet_car.apply_controls(0.3 * (i + 1), 0.2, 0.0)
+            solo_car.apply_controls(0.3 * (i + 1), 0.2, 0.0)
+        
+        for _ in range(20):
+            fleet.update_all(1/60.0)
+            fleet_space.step(1/60.0)
+            for solo_car in solo_cars:
+                solo_car.update(1/60.0)
+            physics_space.step(1/60.0)
+        
+        assert len(fleet) == 3
+        for fleet_car, solo_car in zip(fleet_cars, solo_cars):
+            assert fleet_car.state.distance_traveled == pytest.approx(solo_car.state.distance_traveled)
+            assert fleet_car.state.top_speed == pytest.approx(solo_car.state.top_speed)
+            assert fleet_car.state.lap_time == pytest.approx(solo_car.state.lap_time)
+            assert fleet_car.state.distance_traveled > 0
+    
+    def test_apply_controls_bulk(self, physics_space):
+        """Test that bulk controls are clamped and reach every car."""
+        fleet = CarFleet()
+        cars = [Car(f"car_{i}", physics_space, fleet=fleet) for i in range(3)]
+        
+        fleet.apply_controls_bulk([2.0, 0.5, -3.0], [0.1, -1.5, 0.0], [-1.0, 0.2, 4.0])
+        
+        assert [car.throttle_input for car in cars] == [1.0, 0.5, -1.0]
+        assert [car.steering_input for car in cars] == [0.1, -1.0, 0.0]
+        assert [car.brake_input for car in cars] == [0.0, 0.2, 1.0]
+        assert cars[1].physics_body.throttle == 0.5
+        assert cars[2].get_info_view().brake == 1.0
+        assert fleet.throttle[:3].tolist() == [1.0, 0.5, -1.0]
+    
+    def test_update_all_fills_info_views_from_columns(self, physics_space):
+        """Test that fleet updates fill each HUD view without querying the body."""
+        fleet = CarFleet()
+        car = Car("car", physics_space, position=(10, 20), angle=math.pi / 2, fleet=fleet)
+        car.physics_body.body.velocity = (30, 40)
+        
+        with patch.object(car.physics_body, 'get_speed') as get_speed, \
+             patch.object(car.physics_body, 'get_lateral_speed') as get_lateral_speed:
+            fleet.update_all(1/60.0)
+        
+        get_speed.assert_not_called()
+        get_lateral_speed.assert_not_called()
+        view = car.get_info_view()
+        assert view.position == (10, 20)
+        assert view.angle_degrees == pytest.approx(90.0)
+        assert view.speed == pytest.approx(50.0)
+        assert view.forward_speed == pytest.approx(40.0)
+        assert view.lateral_speed == pytest.approx(-30.0)
+        assert view.is_sliding is False
+    
+    def test_distant_cars_update_less_often(self, physics_space):
+        """Test that drive forces are recomputed less often far from the focus point."""
+        fleet = CarFleet()
+        near = Car("near", physics_space, position=(0, 0), fleet=fleet)
+        mid = Car("mid", physics_space, position=(1000, 0), fleet=fleet)
+        far = Car("far", physics_space, position=(0, 5000), fleet=fleet)
+        
+        no_drive = (0.0, 0.0)
+        with patch.object(near.physics_body, 'get_drive_forces', return_value=no_drive) as near_drive, \
+             patch.object(mid.physics_body, 'get_drive_forces', return_value=no_drive) as mid_drive, \
+             patch.object(far.physics_body, 'get_drive_forces', return_value=no_drive) as far_drive, \
+             patch.object(far.physics_body, 'apply_resistance') as far_resistance:
+            for _ in range(30):
+                fleet.update_all(1/60.0, focus=(0, 0))
+        
+        assert near_drive.call_count == 30
+        assert mid_drive.call_count == 30 // CarFleet.MID_INTERVAL
+        assert far_drive.call_count == 30 // CarFleet.FAR_INTERVAL
+        # Braking and damping still run for every car every frame
+        assert far_resistance.call_count == 30
+        assert far.state.lap_time == pytest.approx(0.5)
+    
+    def test_distant_car_drive_force_follows_rotation(self, physics_space):
+        """Test that a cached drive force points along the car's current heading."""
+        fleet = CarFleet()
+        car = Car("far", physics_space, position=(0, 5000), fleet=fleet)
+        car.apply_controls(1.0, 0.0, 0.0)
+        fleet.update_all(1/60.0, focus=(0, 0))  # Drive force computed and cached
+        body = car.physics_body.body
+        body.angle = math.pi / 2
+        body.force = (0, 0)
+        
+        with patch.object(car.physics_body, 'get_drive_forces') as get_drive_forces:
+            fleet.update_all(1/60.0, focus=(0, 0))
+        
+        get_drive_forces.assert_not_called()
+        assert body.force.x == pytest.approx(0.0, abs=1e-6)
+        assert body.force.y > 0
+    
+    def test_distant_car_recomputes_drive_on_control_change(self, physics_space):
+        """Test that new controls are picked up before the next scheduled recompute."""
+        fleet = CarFleet()
+        car = Car("far", physics_space, position=(0, 5000), fleet=fleet)
+        fleet.update_all(1/60.0, focus=(0, 0))
+        
+        car.apply_controls(1.0, 0.0, 0.0)
+        fleet.update_all(1/60.0, focus=(0, 0))
+        
+        assert fleet.drive_force[car._fleet_index] == pytest.approx(
+            car.physics_body.config.max_force)
+    
+    def test_distant_cars_damped_every_frame(self):
+        """Test that reduced-rate cars coast exactly like full-rate cars."""
+        def coast(focus):
+            space = pymunk.Space()
+            fleet = CarFleet()
+            car = Car("far", space, position=(0, 5000), fleet=fleet)
+            car.physics_body.body.velocity = (400, 0)
+            car.physics_body.body.angular_velocity = 3.0
+            for _ in range(CarFleet.FAR_INTERVAL):
+                fleet.update_all(1/60.0, focus=focus)
+                space.step(1/60.0)
+            body = car.physics_body.body
+            return body.velocity, body.angular_velocity
+        
+        velocity, angular_velocity = coast(focus=(0, 0))
+        reference_velocity, reference_angular_velocity = coast(focus=None)
+        
+        assert velocity.x == pytest.approx(reference_velocity.x)
+        assert velocity.x > 0
+        assert angular_velocity == pytest.approx(reference_angular_velocity)
+        assert angular_velocity > 0
+    
+    def test_update_metrics_kernel(self):
+        """Test the in-place distance and top speed kernel."""
+        pos_x, pos_y = np.array([3.0, 0.0]), np.array([4.0, 0.0])
+        last_x, last_y = np.zeros(2), np.zeros(2)
+        vel_x, vel_y = np.array([6.0, 1.0]), np.array([8.0, 0.0])
+        speed, top_speed = np.zeros(2), np.array([5.0, 5.0])
+        distance = np.array([1.0, 1.0])
+        
+        update_metrics(pos_x, pos_y, last_x, last_y, vel_x, vel_y,
+                       speed, top_speed, distance, np.zeros(2))
+        
+        assert distance.tolist() == [6.0, 1.0]
+        assert speed.tolist() == [10.0, 1.0]
+        assert top_speed.tolist() == [10.0, 5.0]
+        assert last_x.tolist() == [3.0, 0.0]
+        assert last_y.tolist() == [4.0, 0.0]
+    
+    def test_update_respawn_kernel(self):
+        """Test the masked respawn countdown kernel."""
+        is_crashed = np.array([True, True, False])
+        respawn_timer = np.array([0.5, 0.1, 0.0])
+        
+        respawned = update_respawn(is_crashed, respawn_timer, 0.25)
+        
+        assert respawned.tolist() == [1]
+        assert is_crashed.tolist() == [True, False, False]
+        assert respawn_timer.tolist() == [0.25, 0.0, 0.0]
+    
+    def test_update_slip_kernel(self):
+        """Test the forward/lateral speed split and sliding flags."""
+        angle = np.array([0.0, math.pi / 2])
+        vel_x, vel_y = np.array([10.0, 60.0]), np.array([80.0, 0.0])
+        forward, lateral = np.zeros(2), np.zeros(2)
+        sliding = np.zeros(2, dtype=bool)
+        
+        update_slip(angle, vel_x, vel_y, forward, lateral, sliding, 50.0,
+                    np.zeros(2), np.zeros(2))
+        
+        assert forward == pytest.approx([10.0, 0.0], abs=1e-9)
+        assert lateral == pytest.approx([80.0, -60.0], abs=1e-9)
+        assert sliding.tolist() == [True, True]
+    
+    def test_fleet_sliding_matches_physics(self, physics_space):
+        """Test that fleet sliding state agrees with the per-body calculation."""
+        fleet = CarFleet()
+        cars = [Car(f"car_{i}", physics_space, position=(200 * i, 0), angle=0.3 * i, fleet=fleet)
+                for i in range(3)]
+        for car, velocity in zip(cars, [(100, 0), (0, 100), (30, 20)]):
+            car.physics_body.body.velocity = velocity
+        
+        with patch('src.physics.car_physics.CarBody.update_physics'):
+            fleet.update_all(1 / 60.0)
+        
+        for car in cars:
+            body = car.physics_body
+            assert fleet.lateral_speed[car._fleet_index] == pytest.approx(body.get_lateral_speed())
+            assert fleet.forward_speed[car._fleet_index] == pytest.approx(body.get_forward_speed())
+            assert car.is_sliding() == body.is_sliding()
+            assert car.is_sliding(10.0) == body.is_sliding(10.0)
+    
+    def test_fleet_crash_and_respawn(self, physics_space):
+        """Test that crashed fleet cars skip physics and respawn after the delay."""
+        fleet = CarFleet()
+        crashed_car = Car("crashed", physics_space, fleet=fleet)
+        other_car = Car("other", physics_space, fleet=fleet)
+        
+        fleet.mark_crashed(crashed_car._fleet_index)
+        
+        assert fleet.is_crashed[crashed_car._fleet_index]
+        assert not fleet.is_crashed[other_car._fleet_index]
+        
+        with patch.object(crashed_car.physics_body, 'update_physics') as crashed_physics:
+            fleet.update_all(1.0)
+        
+        crashed_physics.assert_not_called()
+        assert crashed_car.state.is_crashed is True
+        assert crashed_car.state.respawn_timer == pytest.approx(1.0)
+        
+        fleet.update_all(1.5)
+        
+        assert crashed_car.state.is_crashed is False
+        assert crashed_car.state.respawn_timer == 0.0
+        assert not fleet.is_crashed[crashed_car._fleet_index]
+    
+    def test_fleet_handles_collisions(self, physics_space):
+        """Test that the fleet marks crashes itself and defers collision callbacks."""
+        fleet = CarFleet()
+        left = Car("left", physics_space, position=(0, 0), fleet=fleet)
+        right = Car("right", physics_space, position=(41, 0), fleet=fleet)
+        callback = Mock()
+        right.set_collision_callback(callback)
+        left.physics_body.body.velocity = (600, 0)
+        right.physics_body.body.velocity = (-600, 0)
+        
+        physics_space.step(1 / 60.0)
+        
+        assert fleet.is_crashed[left._fleet_index]
+        assert fleet.is_crashed[right._fleet_index]
+        callback.assert_not_called()
+        
+        fleet.update_all(1 / 60.0)
+        
+        assert left.state.is_crashed and right.state.is_crashed
+        callback.assert_called_once()
+        car, collision_info = callback.call_args[0]
+        assert car is right
+        assert collision_info['other_shape'] is left.physics_body.shape
+    
+    def test_fleets_share_space_collision_handler(self, physics_space):
+        """Test that two fleets in one space both see their cars' collisions."""
+        left_fleet = CarFleet()
+        right_fleet = CarFleet()
+        left = Car("left", physics_space, position=(0, 0), fleet=left_fleet)
+        right = Car("right", physics_space, position=(41, 0), fleet=right_fleet)
+        left.physics_body.body.velocity = (600, 0)
+        right.physics_body.body.velocity = (-600, 0)
+        
+        physics_space.step(1 / 60.0)
+        
+        assert left_fleet.is_crashed[left._fleet_index]
+        assert right_fleet.is_crashed[right._fleet_index]
+    
+    def test_fleet_rejects_claimed_collision_handler(self, physics_space):
+        """Test that a fleet refuses to replace another post-solve callback."""
+        handler = physics_space.add_collision_handler(
+            CarFleet.CAR_COLLISION_TYPE, CarFleet.CAR_COLLISION_TYPE)
+        handler.post_solve = lambda arbiter, space, data: None
+        
+        with pytest.raises(RuntimeError):
+            Car("car", physics_space, fleet=CarFleet())
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
@@ -8,7 +8,7 @@ car simulation behavior.
 import pytest
 import pymunk
 import math
-from src.physics.car_physics import CarBody, CarPhysicsConfig, CarPhysicsPresets
+from src.physics.car_physics import CarBody, CarPhysicsConfig, CarPhysicsInfo, CarPhysicsPresets
 
 
 class TestCarPhysicsConfig:
@@ -24,6 +24,7 @@ class TestCarPhysicsConfig:
         assert config.friction == 0.7
         assert config.max_force == 5000.0
         assert config.max_torque == 2000.0
+        assert config.model == 'custom'
     
     def test_arcade_preset(self):
         """Test arcade physics preset."""
@@ -243,6 +244,26 @@ class TestCarBody:
         assert info['steering'] == -0.2
         assert info['brake'] == 0.1
     
+    def test_fill_physics_info(self):
+        """Test filling a reusable physics info object in place."""
+        self.car.body.velocity = (30, 40)
+        self.car.apply_controls(0.5, -0.2, 0.1)
+        info = CarPhysicsInfo()
+        
+        result = self.car.fill_physics_info(info)
+        
+        assert result is info
+        assert info.speed == pytest.approx(50.0)
+        assert info.throttle == 0.5
+        assert info.steering == -0.2
+        assert info.brake == 0.1
+        
+        # Matches the dictionary form
+        expected = self.car.get_physics_info()
+        assert info.forward_speed == expected['forward_speed']
+        assert info.lateral_speed == expected['lateral_speed']
+        assert info.is_sliding == expected['is_sliding']
+    
     def test_collision_callback_setup(self):
         """Test collision callback setup."""
         callback_called = False
@@ -0,0 +1,334 @@
+"""Tests for the event system."""
+
+import pytest
+import pygame
+from unittest.mock import patch
+from src.core.event_system import EventSystem, GameEventType, InputManager
+
+
+class TestEventSystem:
+    """Test cases for custom game event queueing and dispatch."""
+
+    def test_events_dispatched_in_order(self):
+        """Test that queued game events are dispatched first-in, first-out."""
+        events = EventSystem()
+        received = []
+        events.register_game_event_handler(
+            GameEventType.LAP_COMPLETED, lambda event: received.append(event.data["lap"])
+        )
+
+        for lap in range(5):
+            events.post_game_event(GameEventType.LAP_COMPLETED, {"lap": lap})
+        assert events.get_pending_event_count() == 5
+
+        events.process_game_events()
+
+        assert received == [0, 1, 2, 3, 4]
+        assert events.get_pending_event_count() == 0
+        assert events.get_events_processed() == 5
+
+    def test_events_dispatched_in_batches_by_type(self):
+        """Test that each handler runs over its type's events before the next handler."""
+        events = EventSystem()
+        received = []
+        events.register_game_event_handler(
+            GameEventType.CAR_COLLISION, lambda event: received.append(("first", event.data["id"]))
+        )
+        events.register_game_event_handler(
+            GameEventType.CAR_COLLISION, lambda event: received.append(("second", event.data["id"]))
+        )
+        events.register_game_event_handler(
+            GameEventType.LAP_COMPLETED, lambda event: received.append(("lap", event.data["id"]))
+        )
+
+        events.post_game_event(GameEventType.CAR_COLLISION, {"id": 1})
+        events.post_game_event(GameEventType.LAP_COMPLETED, {"id": 2})
+        events.post_game_event(GameEventType.CAR_COLLISION, {"id": 3})
+        events.post_game_event(GameEventType.TRACK_LOADED, {"id": 4})
+        events.process_game_events()
+
+        assert received == [
+            ("first", 1),
+            ("first", 3),
+            ("second", 1),
+            ("second", 3),
+            ("lap", 2),
+        ]
+        assert events.get_events_processed() == 4
+
+    def test_queue_grows_past_capacity(self):
+        """Test that posting beyond capacity keeps every event in order."""
+        events = EventSystem()
+        received = []
+        events.register_game_event_handler(
+            GameEventType.CAR_COLLISION, lambda event: received.append(event.data["id"])
+        )
+        total = EventSystem.INITIAL_QUEUE_CAPACITY + 10
+
+        # Offset head/tail so the ring wraps before growing
+        events.post_game_event(GameEventType.CAR_COLLISION, {"id": -1})
+        events.process_game_events()
+        for i in range(total):
+            events.post_game_event(GameEventType.CAR_COLLISION, {"id": i})
+
+        events.process_game_events()
+
+        assert received == [-1] + list(range(total))
+
+    def test_handler_can_post_events(self):
+        """Test that events posted by handlers are processed in the same pass."""
+        events = EventSystem()
+        received = []
+
+        def on_lap(event):
+            received.append("lap")
+            events.post_game_event(GameEventType.RACE_FINISHED, {})
+
+        events.register_game_event_handler(GameEventType.LAP_COMPLETED, on_lap)
+        events.register_game_event_handler(
+            GameEventType.RACE_FINISHED, lambda event: received.append("finished")
+        )
+
+        events.post_game_event(GameEventType.LAP_COMPLETED, {})
+        events.process_game_events()
+
+        assert received == ["lap", "finished"]
+
+    def test_game_events_are_slotted(self):
+        """Test that posted events carry no per-instance dict."""
+        events = EventSystem()
+        events.post_game_event(GameEventType.CAR_COLLISION, {"speed": 3.0}, source="car")
+
+        event = events.event_queue[0]
+
+        assert not hasattr(event, "__dict__")
+        assert event.data == {"speed": 3.0}
+        assert event.source == "car"
+
+    def test_reserved_events_dispatch_in_reservation_order(self):
+        """Test that a reserved slot holds its place until published."""
+        events = EventSystem()
+        received = []
+        events.register_game_event_handler(
+            GameEventType.CAR_COLLISION, lambda event: received.append(event.data["id"])
+        )
+
+        first = events.reserve_event(GameEventType.CAR_COLLISION, source="car")
+        events.post_game_event(GameEventType.CAR_COLLISION, {"id": 2})
+        events.process_game_events()
+
+        # The later post waits behind the unpublished reservation
+        assert received == []
+        assert events.get_pending_event_count() == 0
+
+        events.publish_event(first, {"id": 1})
+        events.process_game_events()
+
+        assert received == [1, 2]
+
+    def test_reservation_survives_queue_growth(self):
+        """Test that a sequence number stays valid when the ring grows."""
+        events = EventSystem()
+        received = []
+        events.register_game_event_handler(
+            GameEventType.LAP_COMPLETED, lambda event: received.append(event.data["lap"])
+        )
+
+        reserved = events.reserve_event(GameEventType.LAP_COMPLETED)
+        for lap in range(1, EventSystem.INITIAL_QUEUE_CAPACITY + 1):
+            events.post_game_event(GameEventType.LAP_COMPLETED, {"lap": lap})
+        events.publish_event(reserved, {"lap": 0})
+        events.process_game_events()
+
+        assert received == list(range(EventSystem.INITIAL_QUEUE_CAPACITY + 1))
+
+    def test_game_event_types_are_dense_tags(self):
+        """Test that game event types can index the handler table directly."""
+        assert [int(event_type) for event_type in GameEventType] == list(
+            range(len(GameEventType))
+        )
+
+    def test_clear_event_queue(self):
+        """Test that clearing drops pending events."""
+        events = EventSystem()
+        events.post_game_event(GameEventType.TRACK_LOADED, {})
+        events.post_game_event(GameEventType.TRACK_LOADED, {})
+
+        events.clear_event_queue()
+
+        assert events.event_queue == []
+        assert events.get_pending_event_count() == 0
+
+    def test_process_shared_pygame_events(self):
+        """Test dispatching an already-retrieved event list without draining the queue."""
+        events = EventSystem()
+        received = []
+        events.register_pygame_handler(pygame.KEYDOWN, lambda event: received.append(event.key))
+        frame_events = [
+            pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a),
+            pygame.event.Event(pygame.KEYUP, key=pygame.K_a),
+        ]
+
+        result = events.process_pygame_events(frame_events)
+
+        assert result is frame_events
+        assert received == [pygame.K_a]
+        assert events.get_events_processed() == 2
+
+    def test_dispatch_does_not_drain_queue(self):
+        """Test that dispatch only handles the given events."""
+        events = EventSystem()
+        received = []
+        events.register_pygame_handler(pygame.KEYUP, lambda event: received.append(event.key))
+
+        with patch("pygame.event.get") as mock_get:
+            events.dispatch([pygame.event.Event(pygame.KEYUP, key=pygame.K_b)])
+
+        mock_get.assert_not_called()
+        assert received == [pygame.K_b]
+
+    def test_unregistered_pygame_handler_not_called(self):
+        """Test that removing a handler also stops dispatch to it."""
+        events = EventSystem()
+        received = []
+        handler = received.append
+        events.register_pygame_handler(pygame.KEYDOWN, handler)
+
+        assert events.unregister_pygame_handler(pygame.KEYDOWN, handler)
+        events.process_pygame_events([pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a)])
+
+        assert received == []
+
+    def test_failing_handler_does_not_stop_dispatch(self, capsys):
+        """Test that a raising handler is reported and later handlers still run."""
+        events = EventSystem()
+        received = []
+
+        def broken(event):
+            raise RuntimeError("boom")
+
+        events.register_pygame_handler(pygame.KEYDOWN, broken)
+        events.register_pygame_handler(pygame.KEYDOWN, lambda event: received.append(event.key))
+
+        events.dispatch([pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a)])
+
+        assert received == [pygame.K_a]
+        captured = capsys.readouterr()
+        assert "KeyDown handler" in captured.out
+        assert "RuntimeError: boom" in captured.err
+
+    def test_handler_can_unregister_during_dispatch(self):
+        """Test that unregistering mid-dispatch doesn't disturb the running loop."""
+        events = EventSystem()
+        received = []
+
+        def once(event):
+            received.append("once")
+            events.unregister_pygame_handler(pygame.KEYDOWN, once)
+
+        events.register_pygame_handler(pygame.KEYDOWN, once)
+        events.register_pygame_handler(pygame.KEYDOWN, lambda event: received.append("always"))
+        key_down = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a)
+
+        events.dispatch([key_down, key_down])
+
+        assert received == ["once", "always", "always"]
+
+    def test_non_callable_handler_rejected(self):
+        """Test that registering a non-callable handler fails immediately."""
+        events = EventSystem()
+
+        with pytest.raises(TypeError):
+            events.register_pygame_handler(pygame.KEYDOWN, None)
+        with pytest.raises(TypeError):
+            events.register_game_event_handler(GameEventType.LAP_COMPLETED, "handler")
+
+
+
+class TestInputManager:
+    """Test cases for bitset-backed key and mouse state tracking."""
+
+    def test_key_press_and_release(self):
+        """Test pressed, just-pressed and just-released key states."""
+        manager = InputManager()
+
+        manager.update([
+            pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a),
+            pygame.event.Event(pygame.KEYDOWN, key=pygame.K_UP),
+        ])
+
+        assert manager.is_key_pressed(pygame.K_a)
+        assert manager.is_key_pressed(pygame.K_UP)
+        assert manager.is_key_just_pressed(pygame.K_UP)
+        assert not manager.is_key_pressed(pygame.K_DOWN)
+        assert manager.is_any_key_pressed()
+
+        manager.update([pygame.event.Event(pygame.KEYUP, key=pygame.K_UP)])
+
+        assert manager.is_key_pressed(pygame.K_a)
+        assert not manager.is_key_just_pressed(pygame.K_a)
+        assert not manager.is_key_pressed(pygame.K_UP)
+        assert manager.is_key_just_released(pygame.K_UP)
+
+        manager.update([])
+
+        assert not manager.is_key_just_released(pygame.K_UP)
+
+    def test_wide_keycodes(self):
+        """Test keycodes outside the compact ranges, like non-Latin characters."""
+        manager = InputManager()
+        cyrillic_key = 0x0439
+
+        assert not manager.is_key_pressed(cyrillic_key)
+
+        manager.update([pygame.event.Event(pygame.KEYDOWN, key=cyrillic_key)])
+
+        assert manager.is_key_pressed(cyrillic_key)
+        assert not manager.is_key_pressed(pygame.K_a)
+
+    def test_mouse_buttons(self):
+        """Test mouse button and position tracking."""
+        manager = InputManager()
+
+        manager.update([
+            pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1),
+            pygame.event.Event(pygame.MOUSEMOTION, pos=(10, 20)),
+        ])
+
+        assert manager.is_mouse_button_pressed(1)
+        assert manager.is_mouse_button_just_pressed(1)
+        assert not manager.is_mouse_button_pressed(3)
+        assert manager.get_mouse_position() == (10, 20)
+
+        manager.update([pygame.event.Event(pygame.MOUSEBUTTONUP, button=1)])
+
+        assert not manager.is_mouse_button_pressed(1)
+        assert not manager.is_mouse_button_just_pressed(1)
+
+    def test_state_attributes_decode_bitsets(self):
+        """Test the set-valued state attributes stay available as snapshots."""
+        manager = InputManager()
+        cyrillic_key = 0x0439
+
+        manager.update([
+            pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a),
+            pygame.event.Event(pygame.KEYDOWN, key=pygame.K_UP),
+            pygame.event.Event(pygame.KEYDOWN, key=cyrillic_key),
+            pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=3),
+        ])
+
+        assert manager.keys_pressed == {pygame.K_a, pygame.K_UP, cyrillic_key}
+        assert manager.keys_just_pressed == {pygame.K_a, pygame.K_UP, cyrillic_key}
+        assert manager.mouse_buttons == {3}
+        assert manager.mouse_just_pressed == {3}
+
+        manager.update([
+            pygame.event.Event(pygame.KEYUP, key=pygame.K_UP),
+            pygame.event.Event(pygame.MOUSEBUTTONUP, button=3),
+        ])
+
+        assert manager.keys_pressed == {pygame.K_a, cyrillic_key}
+        assert manager.keys_just_pressed == frozenset()
+        assert manager.keys_just_released == {pygame.K_UP}
+        assert manager.mouse_buttons == frozenset()
+        assert manager.mouse_just_released == {3}
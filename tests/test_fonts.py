@@ -0,0 +1,29 @@
+"""
+Tests for the shared font cache.
+"""
+
+import pygame
+
+from src.utils.fonts import get_font
+
+
+class TestFontCache:
+    """Test font reuse and invalidation."""
+    
+    def test_font_reused_per_size(self):
+        """Test that each size is loaded once and shared."""
+        pygame.font.init()
+        
+        assert get_font(24) is get_font(24)
+        assert get_font(24) is not get_font(36)
+    
+    def test_cache_cleared_on_quit(self):
+        """Test that fonts are not reused across pygame shutdowns."""
+        pygame.init()
+        font = get_font(24)
+        
+        pygame.quit()
+        pygame.init()
+        
+        assert get_font(24) is not font
+        assert get_font(24).render("ok", True, (255, 255, 255)).get_width() > 0
@@ -0,0 +1,40 @@
+"""
+Tests for the rendering geometry kernels.
+"""
+
+import math
+import numpy as np
+from src.rendering.geometry import rotate_box_corners
+
+
+class TestRotateBoxCorners:
+    """Test rotated box corner computation."""
+    
+    def test_unrotated_corners(self):
+        """Test corners of an axis-aligned box."""
+        corners = rotate_box_corners(20, 10, 0.0, (100, 50))
+        
+        assert corners.dtype == np.int32
+        assert corners.tolist() == [[80, 40], [120, 40], [120, 60], [80, 60]]
+    
+    def test_matches_scalar_rotation(self):
+        """Test that corners match per-corner trigonometry with int() truncation."""
+        half_width, half_height, angle, center = 20, 10, 0.7, (300.0, 200.0)
+        expected = []
+        for x, y in [(-half_width, -half_height), (half_width, -half_height),
+                     (half_width, half_height), (-half_width, half_height)]:
+            expected.append([
+                int(center[0] + x * math.cos(angle) - y * math.sin(angle)),
+                int(center[1] + x * math.sin(angle) + y * math.cos(angle))
+            ])
+        
+        assert rotate_box_corners(half_width, half_height, angle, center).tolist() == expected
+    
+    def test_writes_into_buffer(self):
+        """Test that a preallocated output buffer is reused."""
+        out = np.empty((4, 2), dtype=np.int32)
+        
+        result = rotate_box_corners(5, 5, 0.0, (10, 10), out=out)
+        
+        assert result is out
+        assert out.tolist() == [[5, 5], [15, 5], [15, 15], [5, 15]]
@@ -4,6 +4,7 @@ Tests for the input management system.
 Tests InputManager, InputConfig, and control schemes functionality.
 """
 
+import dataclasses
 import unittest
 from unittest.mock import Mock, patch
 import pygame
@@ -98,6 +99,28 @@ class TestInputConfig(unittest.TestCase):
         
         self.assertEqual(config.key_mappings, custom_mappings)
         self.assertNotIn(pygame.K_w, config.key_mappings)
+    
+    def test_config_is_immutable(self):
+        """Test that a config and its key mappings can't be changed in place."""
+        config = InputConfig()
+        
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            config.steering_smoothing = 1.0
+        with self.assertRaises(TypeError):
+            config.key_mappings[pygame.K_q] = InputAction.BRAKE
+        self.assertEqual(hash(config), hash(InputConfig()))
+    
+    def test_action_keys_index(self):
+        """Test that every action maps to the frozen set of its keys."""
+        config = InputConfig(key_mappings={
+            pygame.K_SPACE: InputAction.ACCELERATE,
+            pygame.K_x: InputAction.ACCELERATE,
+        })
+        
+        self.assertEqual(config.action_keys[InputAction.ACCELERATE],
+                         frozenset({pygame.K_SPACE, pygame.K_x}))
+        self.assertEqual(config.action_keys[InputAction.BRAKE], frozenset())
+        self.assertEqual(set(config.action_keys), set(InputAction))
 
 
 class TestInputManager(unittest.TestCase):
@@ -120,13 +143,16 @@ class TestInputManager(unittest.TestCase):
         self.assertEqual(len(self.input_manager.just_pressed_keys), 0)
         self.assertEqual(len(self.input_manager.just_released_keys), 0)
     
-    @patch('pygame.key.get_pressed')
-    def test_update_with_no_input(self, mock_get_pressed):
+    def _press(self, manager, *keys):
+        """Feed KEYDOWN events for keys to an input manager."""
+        manager.process_events([pygame.event.Event(pygame.KEYDOWN, key=key) for key in keys])
+    
+    def _release(self, manager, *keys):
+        """Feed KEYUP events for keys to an input manager."""
+        manager.process_events([pygame.event.Event(pygame.KEYUP, key=key) for key in keys])
+    
+    def test_update_with_no_input(self):
         """Test update with no keys pressed."""
-        # Mock no keys pressed
-        mock_keys = [False] * 512  # Pygame has up to 512 key codes
-        mock_get_pressed.return_value = mock_keys
-        
         self.input_manager.update(0.016)  # 60 FPS delta time
         
         throttle, steering, brake = self.input_manager.get_car_controls()
@@ -134,13 +160,9 @@ class TestInputManager(unittest.TestCase):
         self.assertEqual(steering, 0.0)
         self.assertEqual(brake, 0.0)
     
-    @patch('pygame.key.get_pressed')
-    def test_update_with_acceleration(self, mock_get_pressed):
+    def test_update_with_acceleration(self):
         """Test update with acceleration key pressed."""
-        # Mock W key pressed
-        mock_keys = [False] * 512
-        mock_keys[pygame.K_w] = True
-        mock_get_pressed.return_value = mock_keys
+        self._press(self.input_manager, pygame.K_w)
         
         # Update multiple times to build up input
         for _ in range(10):
@@ -151,13 +173,9 @@ class TestInputManager(unittest.TestCase):
         self.assertEqual(steering, 0.0)
         self.assertEqual(brake, 0.0)
     
-    @patch('pygame.key.get_pressed')
-    def test_update_with_steering(self, mock_get_pressed):
+    def test_update_with_steering(self):
         """Test update with steering keys pressed."""
-        # Mock A key pressed (steer left)
-        mock_keys = [False] * 512
-        mock_keys[pygame.K_a] = True
-        mock_get_pressed.return_value = mock_keys
+        self._press(self.input_manager, pygame.K_a)  # Steer left
         
         # Update multiple times to build up input
         for _ in range(10):
@@ -168,13 +186,9 @@ class TestInputManager(unittest.TestCase):
         self.assertLess(steering, 0.0)  # Left steering is negative
         self.assertEqual(brake, 0.0)
     
-    @patch('pygame.key.get_pressed')
-    def test_input_smoothing(self, mock_get_pressed):
+    def test_input_smoothing(self):
         """Test that input smoothing works correctly."""
-        # Mock W key pressed
-        mock_keys = [False] * 512
-        mock_keys[pygame.K_w] = True
-        mock_get_pressed.return_value = mock_keys
+        self._press(self.input_manager, pygame.K_w)
         
         # First update should have small throttle
         self.input_manager.update(0.016)
@@ -187,13 +201,10 @@ class TestInputManager(unittest.TestCase):
         self.assertGreater(throttle2, throttle1)
         self.assertLess(throttle1, 1.0)  # Should not reach max immediately
     
-    @patch('pygame.key.get_pressed')
-    def test_input_decay(self, mock_get_pressed):
+    def test_input_decay(self):
         """Test that input decays when keys are released."""
         # First, build up some input
-        mock_keys = [False] * 512
-        mock_keys[pygame.K_w] = True
-        mock_get_pressed.return_value = mock_keys
+        self._press(self.input_manager, pygame.K_w)
         
         for _ in range(10):
             self.input_manager.update(0.016)
@@ -202,8 +213,7 @@ class TestInputManager(unittest.TestCase):
         self.assertGreater(throttle_with_input, 0.5)
         
         # Now release the key
-        mock_keys[pygame.K_w] = False
-        mock_get_pressed.return_value = mock_keys
+        self._release(self.input_manager, pygame.K_w)
         
         # Update and check that input decays
         self.input_manager.update(0.016)
@@ -211,6 +221,137 @@ class TestInputManager(unittest.TestCase):
         
         self.assertLess(throttle_after_release, throttle_with_input)
     
+    def test_analog_channels_respect_deadzone(self):
+        """Test that reverse uses the acceleration response and small values snap to zero."""
+        config = InputConfig(key_mappings={pygame.K_x: InputAction.REVERSE},
+                             acceleration_smoothing=0.04, input_deadzone=0.05)
+        manager = InputManager(config)
+        self._press(manager, pygame.K_x)
+        
+        manager.update(0.016)
+        self.assertEqual(manager.input_state.reverse, 0.0)
+        
+        manager.input_state.reverse = 0.02
+        manager.update(0.016)
+        self.assertAlmostEqual(manager.input_state.reverse, 0.06)
+        self.assertEqual(manager.input_state.accelerate, 0.0)
+    
+    def test_key_edges_from_events(self):
+        """Test that key edges last one update and repeats are ignored."""
+        manager = self.input_manager
+        
+        self._press(manager, pygame.K_w, pygame.K_w)
+        manager.update(0.016)
+        
+        self.assertEqual(manager.pressed_keys, {pygame.K_w})
+        self.assertTrue(manager.is_action_just_pressed(InputAction.ACCELERATE))
+        
+        manager.update(0.016)
+        
+        self.assertTrue(manager.is_action_pressed(InputAction.ACCELERATE))
+        self.assertFalse(manager.is_action_just_pressed(InputAction.ACCELERATE))
+        
+        self._release(manager, pygame.K_w)
+        manager.update(0.016)
+        
+        self.assertFalse(manager.is_action_pressed(InputAction.ACCELERATE))
+        self.assertTrue(manager.is_action_just_released(InputAction.ACCELERATE))
+    
+    def test_car_controls_computed_once_per_update(self):
+        """Test that controls are combined once and reused until the next update."""
+        manager = self.input_manager
+        self._press(manager, pygame.K_w, pygame.K_d)
+        manager.update(0.016)
+        
+        controls = manager.get_car_controls()
+        self.assertIs(manager.get_car_controls(), controls)
+        self.assertEqual(controls, (manager.input_state.get_throttle(),
+                                    manager.input_state.get_steering(),
+                                    manager.input_state.get_brake()))
+        
+        self._press(manager, pygame.K_LSHIFT)
+        manager.update(0.016)
+        
+        self.assertLess(manager.get_car_controls()[0], 0.0)
+    
+    def test_car_controls_not_stale_after_reset_or_events(self):
+        """Test that reset and event processing invalidate the cached controls."""
+        manager = self.input_manager
+        self._press(manager, pygame.K_w)
+        manager.update(0.016)
+        self.assertGreater(manager.get_car_controls()[0], 0.0)
+        
+        manager.reset_input_state()
+        self.assertEqual(manager.get_car_controls(), (0.0, 0.0, 0.0))
+        
+        manager.input_state.steer_left = 0.5
+        manager.process_events([])
+        self.assertEqual(manager.get_car_controls(), (0.0, -0.5, 0.0))
+    
+    def test_digital_inputs_last_one_frame(self):
+        """Test that pause/reset/switch flags are set only on the frame of the press."""
+        manager = self.input_manager
+        self._press(manager, pygame.K_p, pygame.K_TAB)
+        manager.update(0.016)
+        
+        self.assertTrue(manager.input_state.pause)
+        self.assertTrue(manager.input_state.switch_physics)
+        self.assertFalse(manager.input_state.reset)
+        
+        manager.update(0.016)
+        
+        self.assertFalse(manager.input_state.pause)
+        self.assertFalse(manager.input_state.switch_physics)
+    
+    def test_input_history_ring(self):
+        """Test that history keeps the newest frames in a fixed buffer."""
+        manager = InputManager(InputConfig(record_history=True))
+        history = manager.input_history
+        self._press(manager, pygame.K_w)
+        
+        for _ in range(manager.max_history_length + 5):
+            manager.update(0.016)
+        
+        self.assertIs(manager.input_history, history)
+        newest = manager.get_history_frame(-1)
+        self.assertAlmostEqual(newest['throttle'], manager.input_state.get_throttle(), places=6)
+        self.assertEqual(set(newest), set(InputManager.HISTORY_COLUMNS))
+        self.assertLess(manager.get_history_frame(0)['raw_accelerate'], newest['raw_accelerate'])
+        with self.assertRaises(IndexError):
+            manager.get_history_frame(manager.max_history_length)
+        
+        manager.reset_input_state()
+        with self.assertRaises(IndexError):
+            manager.get_history_frame(0)
+    
+    def test_input_history_columns(self):
+        """Test that a history column comes back in frame order across the wrap."""
+        manager = InputManager(InputConfig(record_history=True))
+        self._press(manager, pygame.K_w)
+        
+        for _ in range(3):
+            manager.update(0.016)
+        self.assertEqual(len(manager.get_history_column('raw_accelerate')), 3)
+        
+        for _ in range(manager.max_history_length):
+            manager.update(0.016)
+        column = manager.get_history_column('raw_accelerate')
+        
+        self.assertEqual(len(column), manager.max_history_length)
+        self.assertEqual(column[0], manager.get_history_frame(0)['raw_accelerate'])
+        self.assertEqual(column[-1], manager.get_history_frame(-1)['raw_accelerate'])
+        self.assertTrue((column[1:] >= column[:-1]).all())
+        with self.assertRaises(ValueError):
+            manager.get_history_column('speed')
+    
+    def test_input_history_off_by_default(self):
+        """Test that no history is recorded unless the config asks for it."""
+        self._press(self.input_manager, pygame.K_w)
+        self.input_manager.update(0.016)
+        
+        with self.assertRaises(IndexError):
+            self.input_manager.get_history_frame(-1)
+    
     def test_action_callbacks(self):
         """Test that action callbacks are triggered correctly."""
         callback_called = False
@@ -222,12 +363,8 @@ class TestInputManager(unittest.TestCase):
         self.input_manager.set_action_callback(InputAction.PAUSE, test_callback)
         
         # Simulate P key press
-        with patch('pygame.key.get_pressed') as mock_get_pressed:
-            mock_keys = [False] * 512
-            mock_keys[pygame.K_p] = True
-            mock_get_pressed.return_value = mock_keys
-            
-            self.input_manager.update(0.016)
+        self._press(self.input_manager, pygame.K_p)
+        self.input_manager.update(0.016)
         
         self.assertTrue(callback_called)
     
@@ -245,13 +382,9 @@ class TestInputManager(unittest.TestCase):
     def test_reset_input_state(self):
         """Test that input state resets correctly."""
         # Build up some input first
-        with patch('pygame.key.get_pressed') as mock_get_pressed:
-            mock_keys = [False] * 512
-            mock_keys[pygame.K_w] = True
-            mock_get_pressed.return_value = mock_keys
-            
-            for _ in range(5):
-                self.input_manager.update(0.016)
+        self._press(self.input_manager, pygame.K_w)
+        for _ in range(5):
+            self.input_manager.update(0.016)
         
         # Verify input exists
         throttle_before, _, _ = self.input_manager.get_car_controls()
@@ -339,6 +472,38 @@ class TestControlSchemes(unittest.TestCase):
         # Test invalid name
         with self.assertRaises(ValueError):
             ControlSchemes.get_scheme_by_name("NonExistent")
+    
+    def test_keys_by_action_index(self):
+        """Test the action-to-keys index built with each scheme."""
+        scheme = ControlSchemes.combined_scheme()
+        
+        self.assertEqual(scheme.keys_by_action[InputAction.ACCELERATE], [pygame.K_w, pygame.K_UP])
+        self.assertEqual(scheme.keys_by_action[InputAction.REVERSE], [pygame.K_LSHIFT, pygame.K_RSHIFT])
+        self.assertEqual(list(scheme.keys_by_action), [action for action in InputAction
+                                                       if action in scheme.keys_by_action])
+    
+    def test_schemes_built_once(self):
+        """Test that scheme lookups share the cached instances."""
+        schemes = ControlSchemes.get_all_schemes()
+        
+        self.assertIs(ControlSchemes.get_scheme_by_name("Combined"), schemes[0])
+        self.assertIs(ControlSchemes.get_all_schemes()[1], schemes[1])
+    
+    def test_shared_scheme_not_changed_by_remapping(self):
+        """Test that remapping keys in a manager leaves the shared scheme intact."""
+        scheme = ControlSchemes.get_scheme_by_name("WASD")
+        manager = InputManager(scheme.input_config)
+        
+        manager.set_key_mapping(pygame.K_q, InputAction.BRAKE)
+        manager.remove_key_mapping(pygame.K_w)
+        
+        self.assertEqual(manager.get_key_mappings()[pygame.K_q], InputAction.BRAKE)
+        self.assertIn(pygame.K_q, manager.config.action_keys[InputAction.BRAKE])
+        self.assertNotIn(pygame.K_w, manager.config.action_keys[InputAction.ACCELERATE])
+        self.assertNotIn(pygame.K_w, manager.get_key_mappings())
+        self.assertNotIn(pygame.K_q, scheme.input_config.key_mappings)
+        self.assertIn(pygame.K_w, scheme.input_config.key_mappings)
+        self.assertEqual(len({scheme, ControlSchemes.get_scheme_by_name("WASD")}), 1)
 
 
 class TestControlsHelper(unittest.TestCase):
@@ -1,10 +1,12 @@
 """Tests for the main game application."""
 
 import pytest
+import pygame
 from unittest.mock import patch, MagicMock
 from src.main import main
 from src.core.game_engine import GameEngine, GameConfig, GameScene
-from src.core.scene_manager import MenuScene
+from src.core.scene_manager import MenuScene, RaceScene
+from src.core.event_system import EventSystem, InputManager
 
 
 class TestGameEngine:
@@ -65,6 +67,241 @@ class TestGameEngine:
         assert engine.next_scene == GameScene.RACE
         assert engine.scene_transition_requested is True
 
+    def test_scene_methods_follow_transitions(self):
+        """Test that cached scene methods are rebound on scene transitions."""
+        engine = GameEngine(GameConfig())
+        menu_scene = MagicMock()
+        race_scene = MagicMock()
+        engine.register_scene(GameScene.MENU, menu_scene)
+        engine.register_scene(GameScene.RACE, race_scene)
+
+        engine._update_current_scene()
+        menu_scene.update.assert_called_once()
+
+        engine.change_scene(GameScene.RACE)
+        engine._perform_scene_transition()
+        engine._update_current_scene()
+
+        menu_scene.exit.assert_called_once()
+        race_scene.enter.assert_called_once()
+        race_scene.update.assert_called_once()
+        assert menu_scene.update.call_count == 1
+
+    def test_scene_methods_follow_direct_assignment(self):
+        """Test that assigning current_scene directly rebinds scene methods."""
+        engine = GameEngine(GameConfig())
+        menu_scene = MagicMock()
+        race_scene = MagicMock()
+        engine.register_scene(GameScene.MENU, menu_scene)
+        engine.register_scene(GameScene.RACE, race_scene)
+
+        engine.current_scene = GameScene.RACE
+        engine._update_current_scene()
+
+        race_scene.update.assert_called_once()
+        menu_scene.update.assert_not_called()
+
+    @patch("pygame.display.flip")
+    def test_scene_background_built_once(self, mock_flip):
+        """Test that the scene background with static text is cached across frames."""
+        pygame.font.init()
+        engine = GameEngine(GameConfig())
+        engine.screen = pygame.Surface((320, 240))
+        menu_scene = MenuScene()
+        engine.register_scene(GameScene.MENU, menu_scene)
+
+        engine._render_current_scene()
+        background = engine._current_background
+        engine._render_current_scene()
+
+        assert engine._current_background is background
+        assert background is not engine._background
+        assert menu_scene._static_text == []
+        assert engine.screen.get_at((0, 0))[:3] == engine.config.background_color
+
+        # A scene transition rebuilds the background for the new scene
+        engine.register_scene(GameScene.RACE, RaceScene())
+        engine.change_scene(GameScene.RACE)
+        engine._perform_scene_transition()
+        engine._render_current_scene()
+
+        assert engine._current_background is not background
+
+    def test_scene_events_coalesced(self):
+        """Test that mouse motion is merged and repeated key downs are dropped."""
+        events = [
+            pygame.event.Event(pygame.MOUSEMOTION, pos=(10, 10), rel=(2, 1), buttons=(0, 0, 0)),
+            pygame.event.Event(pygame.KEYDOWN, key=pygame.K_UP),
+            pygame.event.Event(pygame.MOUSEMOTION, pos=(15, 12), rel=(5, 2), buttons=(0, 0, 0)),
+            pygame.event.Event(pygame.KEYDOWN, key=pygame.K_UP),
+            pygame.event.Event(pygame.KEYUP, key=pygame.K_UP),
+            pygame.event.Event(pygame.KEYDOWN, key=pygame.K_UP),
+        ]
+
+        compact = GameEngine._coalesce_scene_events(events)
+
+        assert [event.type for event in compact] == [
+            pygame.KEYDOWN,
+            pygame.KEYUP,
+            pygame.KEYDOWN,
+            pygame.MOUSEMOTION,
+        ]
+        assert compact[-1].pos == (15, 12)
+        assert compact[-1].rel == (7, 3)
+
+    @patch("pygame.display.get_active", return_value=True)
+    @patch("pygame.event.get", return_value=[])
+    def test_run_counts_frames(self, mock_get, mock_active):
+        """Test that the main loop uses the clock's tick as delta time and counts frames."""
+        engine = GameEngine(GameConfig())
+        engine.clock = MagicMock()
+        engine.clock.tick.return_value = 20
+        rendered = []
+
+        def render():
+            rendered.append(engine.delta_time)
+            if len(rendered) == 3:
+                engine.quit()
+
+        with patch.object(engine, "initialize", return_value=True), patch.object(
+            engine, "_render_current_scene", side_effect=render
+        ):
+            engine.run()
+
+        assert engine.frame_count == 3
+        assert rendered == [pytest.approx(0.02)] * 3
+        engine.clock.tick.assert_called_with(engine.config.target_fps)
+
+    @patch("pygame.time.wait")
+    @patch("pygame.display.get_active", return_value=False)
+    @patch("pygame.event.get", return_value=[])
+    def test_hidden_window_skips_updates_but_redraws(self, mock_get, mock_active, mock_wait):
+        """Test that a hidden window idles but still services a pending redraw."""
+        engine = GameEngine(GameConfig())
+        engine.clock = MagicMock()
+        engine.clock.tick.return_value = 20
+        scene = MagicMock()
+        engine.register_scene(GameScene.MENU, scene)
+        rendered = []
+
+        def idle(ms):
+            if mock_wait.call_count == 3:
+                engine.quit()
+
+        mock_wait.side_effect = idle
+        with patch.object(engine, "initialize", return_value=True), patch.object(
+            engine, "_render_current_scene", side_effect=lambda: rendered.append(1)
+        ):
+            engine.run()
+
+        scene.update.assert_not_called()
+        assert rendered == [1]
+        mock_wait.assert_called_with(engine.config.background_idle_ms)
+
+    @patch("pygame.display.get_active", return_value=True)
+    @patch("pygame.event.get", return_value=[])
+    def test_static_scene_waits_for_events(self, mock_get, mock_active):
+        """Test that a static scene is only redrawn when an event arrives."""
+        engine = GameEngine(GameConfig())
+        engine.clock = MagicMock()
+        engine.clock.tick.return_value = 0
+        engine.register_scene(GameScene.MENU, MenuScene())
+        waits = [
+            pygame.event.Event(pygame.NOEVENT),
+            pygame.event.Event(pygame.KEYDOWN, key=pygame.K_DOWN),
+            pygame.event.Event(pygame.NOEVENT),
+        ]
+        rendered = []
+
+        def wait(timeout):
+            if not waits:
+                engine.quit()
+                return pygame.event.Event(pygame.NOEVENT)
+            return waits.pop(0)
+
+        with patch.object(engine, "initialize", return_value=True), patch.object(
+            engine, "_render_current_scene", side_effect=lambda: rendered.append(1)
+        ), patch("pygame.event.wait", side_effect=wait) as mock_wait:
+            engine.run()
+
+        # First frame, then once for the key press
+        assert len(rendered) == 2
+        assert engine.scenes[GameScene.MENU].selected_item == 1
+        mock_wait.assert_called_with(engine.config.static_wait_ms)
+
+    @patch("pygame.display.flip")
+    def test_clean_scene_not_rerendered(self, mock_flip):
+        """Test that rendering is skipped until the scene marks itself dirty."""
+        pygame.font.init()
+        engine = GameEngine(GameConfig())
+        engine.screen = pygame.Surface((320, 240))
+        menu_scene = MenuScene()
+        engine.register_scene(GameScene.MENU, menu_scene)
+
+        engine._render_current_scene()
+        engine._redraw_requested = False
+        engine._render_current_scene()
+
+        assert mock_flip.call_count == 1
+        assert not menu_scene.dirty
+
+        menu_scene.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_DOWN))
+        engine._render_current_scene()
+
+        assert mock_flip.call_count == 2
+
+    def test_attached_systems_share_frame_events(self):
+        """Test that the event queue is drained once and broadcast to attached systems."""
+        engine = GameEngine(GameConfig())
+        event_system = EventSystem()
+        input_manager = InputManager()
+        received = []
+        event_system.register_pygame_handler(pygame.KEYDOWN, lambda event: received.append(event.key))
+        engine.attach_event_system(event_system, input_manager)
+        events = [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_UP)]
+
+        with patch("pygame.event.get", return_value=events) as mock_get:
+            engine._handle_events()
+
+        mock_get.assert_called_once()
+        assert engine.frame_events is events
+        assert received == [pygame.K_UP]
+        assert input_manager.is_key_just_pressed(pygame.K_UP)
+
+
+class TestScenes:
+    """Test cases for scene rendering."""
+
+    def setup_method(self):
+        """Initialize fonts for scene rendering."""
+        pygame.font.init()
+
+    def test_menu_static_text_rendered_once(self):
+        """Test that menu text is rendered once and reused across frames."""
+        scene = MenuScene()
+        screen = pygame.Surface((400, 300))
+
+        scene.render(screen)
+        static_text = scene._static_text
+        item_surfaces = scene._item_surfaces
+        scene.selected_item = 2
+        scene.render(screen)
+
+        assert scene._static_text is static_text
+        assert scene._item_surfaces is item_surfaces
+        assert len(item_surfaces) == len(scene.menu_items)
+
+    def test_static_text_relaid_out_on_resize(self):
+        """Test that a new screen size re-renders the static text layout."""
+        scene = RaceScene()
+        scene.render(pygame.Surface((400, 300)))
+        first_layout = scene._static_text
+
+        scene.render(pygame.Surface((800, 600)))
+
+        assert scene._static_text is not first_layout
+        assert scene._static_text[0][1].center == (400, 250)
+
 
 def test_main_function():
     """Test the main function entry point."""
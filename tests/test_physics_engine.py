@@ -47,6 +47,29 @@ class TestPhysicsEngine:
         # Velocity should have changed due to applied force
         assert body.velocity.x != initial_velocity
     
+    def test_advance_fixed_steps(self):
+        """Test that frame time is consumed in fixed steps with carry-over."""
+        engine = PhysicsEngine(PhysicsConfig(time_step=0.25))
+        step_sizes = []
+        
+        steps = engine.advance(0.625, step_sizes.append)
+        
+        assert steps == 2
+        assert step_sizes == [0.25, 0.25]
+        assert engine.interpolation_alpha == 0.5
+        
+        # Leftover time completes a step on the next frame
+        assert engine.advance(0.125) == 1
+        assert engine.interpolation_alpha == 0.0
+    
+    def test_advance_caps_catch_up(self):
+        """Test that a long frame is capped instead of spiralling."""
+        max_steps = self.engine.config.max_steps_per_frame
+        
+        assert self.engine.advance(10.0) == max_steps
+        assert self.engine.interpolation_alpha <= 1.0
+        assert self.engine.advance(0.0) <= 1
+    
     def test_add_remove_body(self):
         """Test adding and removing bodies."""
         body = pymunk.Body(1, pymunk.moment_for_circle(1, 0, 10))
@@ -145,6 +168,19 @@ class TestPhysicsEngine:
         assert not self.engine.debug_enabled
         assert self.engine.debug_renderer is None
     
+    def test_render_debug_skips_static(self):
+        """Test that static shapes can be left out of debug rendering."""
+        surface = pygame.Surface((100, 100))
+        wall = pymunk.Segment(self.engine.space.static_body, (0, 50), (100, 50), 5)
+        self.engine.add_static_body(wall)
+        self.engine.enable_debug_rendering(surface)
+        
+        self.engine.render_debug(include_static=False)
+        assert surface.get_at((50, 50)) == (0, 0, 0, 255)
+        
+        self.engine.render_debug()
+        assert surface.get_at((50, 50)) != (0, 0, 0, 255)
+    
     def test_physics_info(self):
         """Test getting physics engine information."""
         info = self.engine.get_physics_info()